@@ -0,0 +1,186 @@
+"""Extract article bodies from a corpus of saved pages, legacy vs process pool.
+
+Usage:
+    python -m benchmarks.article_extraction [--pages DIR] [--count 200]
+        [--workers 1,2,4] [--repeat 2]
+
+``--pages`` is a directory of saved ``*.html`` pages (the URL of each is
+taken from a ``<link rel="canonical">`` if present, else the file name);
+without it, ``--count`` synthetic news pages are built from the fixture
+links in ``tests_data/links``: navigation, a 40-80 paragraph article with a
+table, comments and a footer, around 20 KB each.
+
+The legacy path is the former ``extract_article_async``: ``asyncio.to_thread``
+around a process-wide lock, so one page is extracted at a time. The current
+path is ``ExtractPool`` at each ``--workers`` count, started and warmed
+before timing. Every page is submitted at once, as ``BodyFetcher`` does for
+an epoch's links, and every run must return the same extractions.
+Throughput can only scale up to the machine's cores.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import re
+import sys
+import threading
+import time
+
+from neurons.validators.apify.article_extract import RAW_CACHE_CHARS, extract_pair
+from neurons.validators.apify.extract_pool import ExtractPool
+from tests_data.links import links as fixture_links
+
+_EXTRACT_LOCK = threading.Lock()
+_CANONICAL = re.compile(r'<link[^>]+rel="canonical"[^>]+href="([^"]+)"', re.I)
+
+
+def legacy_extract_pair(html, url, max_chars):
+    with _EXTRACT_LOCK:
+        return extract_pair(html, url, max_chars)
+
+
+async def legacy_extract_async(html, url, max_chars):
+    return await asyncio.to_thread(legacy_extract_pair, html, url, max_chars)
+
+
+def load_pages(directory: str) -> list[tuple[str, str]]:
+    pages = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".html"):
+            continue
+        with open(
+            os.path.join(directory, name), encoding="utf-8", errors="replace"
+        ) as f:
+            html = f.read()
+        match = _CANONICAL.search(html)
+        pages.append(
+            (html, match.group(1) if match else f"https://saved.invalid/{name}")
+        )
+    return pages
+
+
+def build_pages(count: int, seed: int) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    links = [
+        value
+        for name, value in sorted(vars(fixture_links).items())
+        if name.startswith("link") and isinstance(value, dict)
+    ]
+    sentences = [
+        sentence.strip() + "."
+        for link in links
+        for sentence in (link["snippet"] or "").split(".")
+        if sentence.strip()
+    ]
+    pages = []
+    for i in range(count):
+        link = links[i % len(links)]
+        paragraphs = "".join(
+            "<p>" + " ".join(rng.choices(sentences, k=rng.randint(3, 8))) + "</p>"
+            for _ in range(rng.randint(40, 80))
+        )
+        rows = "".join(
+            f"<tr><td>{rng.choice(sentences)[:30]}</td><td>{rng.randint(1, 999)}</td></tr>"
+            for _ in range(10)
+        )
+        comments = "".join(
+            f"<div class='comment'><p>{rng.choice(sentences)}</p></div>"
+            for _ in range(10)
+        )
+        url = f"{link['link'].rstrip('/')}/article-{i}"
+        pages.append(
+            (
+                "<html><head>"
+                f"<title>{link['title']} {i}</title>"
+                f'<link rel="canonical" href="{url}">'
+                '<meta name="author" content="Staff Writer">'
+                '<meta property="article:published_time" content="2026-01-15">'
+                "</head><body>"
+                "<nav><a href='/'>Home</a> <a href='/news'>News</a> Login</nav>"
+                f"<article><h1>{link['title']} {i}</h1>{paragraphs}"
+                f"<table>{rows}</table></article>"
+                f"<section class='comments'>{comments}</section>"
+                "<footer>Cookie policy. All rights reserved.</footer>"
+                "</body></html>",
+                url,
+            )
+        )
+    return pages
+
+
+async def run_all(extract, pages) -> tuple[float, list]:
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *[extract(html, url, RAW_CACHE_CHARS) for html, url in pages]
+    )
+    return time.perf_counter() - started, results
+
+
+async def best_of(extract, pages, repeat: int) -> tuple[float, list]:
+    best, results = float("inf"), None
+    for _ in range(repeat):
+        seconds, results = await run_all(extract, pages)
+        best = min(best, seconds)
+    return best, results
+
+
+async def benchmark(args) -> int:
+    pages = load_pages(args.pages) if args.pages else build_pages(args.count, args.seed)
+    if not pages:
+        print(f"no *.html pages in {args.pages}")
+        return 1
+    total_kb = sum(len(html) for html, _ in pages) / 1024
+    print(
+        f"{len(pages)} pages, {total_kb / len(pages):.0f} KB average, "
+        f"{os.cpu_count()} cores"
+    )
+
+    legacy_seconds, legacy_results = await best_of(
+        legacy_extract_async, pages, args.repeat
+    )
+    print(
+        f"{'legacy (locked thread)':24s} {legacy_seconds * 1000:9.1f} ms  "
+        f"{len(pages) / legacy_seconds:7.1f} pages/s"
+    )
+    if not any(text for _, text, _, _ in legacy_results):
+        print("warning: no page produced text; is trafilatura installed?")
+
+    mismatch = False
+    for workers in args.workers:
+        pool = ExtractPool(workers=workers)
+        try:
+            await pool.start()
+            seconds, results = await best_of(pool.extract, pages, args.repeat)
+        finally:
+            pool.close()
+        mismatch |= results != legacy_results
+        print(
+            f"{f'pool, {workers} workers':24s} {seconds * 1000:9.1f} ms  "
+            f"{len(pages) / seconds:7.1f} pages/s  "
+            f"speedup {legacy_seconds / seconds:5.2f}x"
+        )
+
+    if mismatch:
+        print("MISMATCH between legacy and pool extractions")
+        return 1
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", default=None)
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument(
+        "--workers",
+        type=lambda value: [int(n) for n in value.split(",")],
+        default=[1, 2, 4],
+    )
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    return asyncio.run(benchmark(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
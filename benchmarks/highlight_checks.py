@@ -0,0 +1,147 @@
+"""Check miner highlights against fetched bodies, legacy vs current.
+
+Usage:
+    python -m benchmarks.highlight_checks [--responses 256] [--pages 120] [--repeat 3]
+
+Each response samples three links from a pool of ``--pages`` fetched pages
+(16000 characters each, the body fetcher's cap) and carries the miner's
+highlights and text for each. Like the web relevance model, every link is
+gated twice with ``link_meets_evidence`` (before the LLM judge and when
+scoring the sampled links), each gate checking the highlights against the
+fetched body and against the miner's text.
+
+The legacy path normalizes the whole body or text on every check; the
+current path reads ``normalized_text``, cleared before each run. Both must
+return the same verdicts.
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from neurons.validators.reward.search_content_relevance import link_meets_evidence
+from neurons.validators.utils.source_bodies import (
+    _normalize_for_match,
+    normalized_text,
+)
+
+BODY_CHARS = 16000
+LINKS_PER_RESPONSE = 3
+GATES_PER_LINK = 2
+
+WORDS = (
+    "the council approved a new budget for harbour bridge repairs after "
+    "engineers reported corrosion &amp; officials said work starts in spring "
+    "residents asked whether tolls would rise while the mayor's office "
+    "promised updates"
+).split()
+
+
+def build_pages(count: int, rng: random.Random) -> list[str]:
+    pages = []
+    for i in range(count):
+        words = []
+        while sum(len(w) + 1 for w in words) < BODY_CHARS:
+            words.append(rng.choice(WORDS))
+            if rng.random() < 0.05:
+                words.append(f"Section {i}-{len(words)}.")
+        pages.append(" ".join(words)[:BODY_CHARS])
+    return pages
+
+
+def build_links(responses: int, pages: list[str], rng: random.Random) -> list:
+    links = []
+    for _ in range(responses * LINKS_PER_RESPONSE):
+        body = rng.choice(pages)
+        starts = sorted(rng.sample(range(0, len(body) - 200), 3))
+        highlights = [body[s : s + rng.randint(40, 160)] for s in starts]
+        if rng.random() < 0.3:
+            highlights.reverse()
+        if rng.random() < 0.2:
+            highlights.append("a sentence the page never contained")
+        links.append((highlights, body, body))
+    return links
+
+
+def legacy_highlights_in_order(highlights, body) -> bool:
+    normalized_body = _normalize_for_match(body)
+    if not normalized_body or not highlights:
+        return False
+    cursor = 0
+    for highlight in highlights:
+        normalized = _normalize_for_match(highlight)
+        if not normalized:
+            return False
+        idx = normalized_body.find(normalized, cursor)
+        if idx == -1:
+            return False
+        cursor = idx + len(normalized)
+    return True
+
+
+def legacy_link_meets_evidence(miner_highlights, miner_text, fetched_body) -> bool:
+    if not miner_highlights or not miner_text:
+        return False
+    if not legacy_highlights_in_order(miner_highlights, fetched_body):
+        return False
+    if not legacy_highlights_in_order(miner_highlights, miner_text):
+        return False
+    return True
+
+
+def gate_all(check, links) -> list[bool]:
+    return [
+        check(highlights, miner_text, body)
+        for _ in range(GATES_PER_LINK)
+        for highlights, miner_text, body in links
+    ]
+
+
+def timed(check, links, repeat: int, before=None) -> tuple[float, list]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        started = time.perf_counter()
+        result = gate_all(check, links)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--responses", type=int, default=256)
+    parser.add_argument("--pages", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    links = build_links(args.responses, build_pages(args.pages, rng), rng)
+
+    legacy_seconds, legacy_result = timed(
+        legacy_link_meets_evidence, links, args.repeat
+    )
+    current_seconds, current_result = timed(
+        link_meets_evidence, links, args.repeat, before=normalized_text.cache_clear
+    )
+
+    print(
+        f"{len(links)} links x {GATES_PER_LINK} gates over {args.pages} pages, "
+        f"{sum(legacy_result)} pass"
+    )
+    print(
+        f"legacy {legacy_seconds * 1000:8.1f} ms  "
+        f"current {current_seconds * 1000:8.1f} ms  "
+        f"speedup {legacy_seconds / current_seconds:6.2f}x"
+    )
+
+    if legacy_result != current_result:
+        print("MISMATCH between legacy and current verdicts")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
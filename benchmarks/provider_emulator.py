@@ -0,0 +1,531 @@
+"""Local stand-in for Apify, ScrapingDog, OpenAI and Chutes.
+
+Usage:
+    python -m benchmarks.provider_emulator [--port 8900] [--seed 0]
+        [--profile apify=3000:0.4:0.01] [--latency-scale 1.0]
+
+Serves every provider under its own path prefix on one port and prints the
+environment (``desearch.provider_endpoints`` base URLs plus placeholder API
+keys) that points miners and validators at it. Responses are built from the
+``tests_data`` fixtures:
+
+- Apify runs return one fixture tweet per requested id, with that id and a
+  matching url, so validator verification sees the tweet a miner built with
+  ``fixture_tweet``. Items land in the dataset gradually over the run.
+- ScrapingDog pages are small articles carrying the fixture title and
+  snippet that ``fixture_link`` assigns to the url.
+- Chat completions answer every prompt with ``--llm-reply``.
+
+Each provider draws latency from a log-normal distribution and fails with a
+fixed probability. ``--profile NAME=MEDIAN_MS[:SIGMA[:ERROR_RATE]]``
+overrides a provider's defaults; ``--latency-scale`` multiplies all medians.
+``GET /stats`` returns request counts, errors and served latency quantiles.
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import sys
+import time
+import uuid
+import zlib
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from html import escape
+from typing import Optional
+
+from aiohttp import web
+
+from desearch.provider_endpoints import (
+    APIFY,
+    BASE_URL_ENV_VARS,
+    CHUTES,
+    OPENAI,
+    SCRAPINGDOG,
+)
+from neurons.validators.apify.twitter_scraper_actor import toTwitterScraperTweet
+from tests_data.links.links import link1, link2, link3, link4, link5
+from tests_data.tweets.tweet1 import tweet1
+from tests_data.tweets.tweet2 import tweet2
+
+FIXTURE_TWEETS = [tweet1, tweet2]
+FIXTURE_LINKS = [link1, link2, link3, link4, link5]
+
+DEFAULT_LLM_REPLY = "Verdict: HIGH\nScore: 9"
+
+API_KEY_ENV_VARS = {
+    APIFY: "APIFY_API_KEY",
+    SCRAPINGDOG: "SCRAPINGDOG_API_KEY",
+    OPENAI: "OPENAI_API_KEY",
+    CHUTES: "CHUTES_API_TOKEN",
+}
+
+# Advanced-search runs without maxItems return this many tweets.
+DEFAULT_SEARCH_ITEMS = 20
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    median_ms: float = 0.0
+    sigma: float = 0.0
+    error_rate: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyProfile":
+        parts = [float(part) for part in spec.split(":")]
+        return cls(*parts)
+
+    def delay(self, rng: random.Random) -> float:
+        if self.median_ms <= 0:
+            return 0.0
+        return self.median_ms * math.exp(self.sigma * rng.gauss(0, 1)) / 1000
+
+    def fails(self, rng: random.Random) -> bool:
+        return rng.random() < self.error_rate
+
+
+DEFAULT_PROFILES = {
+    APIFY: LatencyProfile(3000, 0.4, 0.01),
+    SCRAPINGDOG: LatencyProfile(1500, 0.6, 0.02),
+    OPENAI: LatencyProfile(600, 0.5, 0.01),
+    CHUTES: LatencyProfile(900, 0.5, 0.02),
+}
+
+
+def _pick(key: str, fixtures: list):
+    return fixtures[zlib.crc32(key.encode()) % len(fixtures)]
+
+
+def fixture_tweet(tweet_id: str) -> dict:
+    """The fixture tweet served for ``tweet_id``, as the ``TwitterScraperTweet``
+    dict the validator builds from the actor item. The id is appended to the
+    text so tweets of one response never read as duplicates."""
+    tweet = _pick(tweet_id, FIXTURE_TWEETS)
+    username = tweet["user"]["username"]
+    item = to_actor_item(
+        {
+            **tweet,
+            "id": tweet_id,
+            "url": f"https://x.com/{username}/status/{tweet_id}",
+            "text": f"{tweet['text']} {tweet_id}",
+        }
+    )
+    return toTwitterScraperTweet(item).model_dump(mode="json")
+
+
+def fixture_link(url: str) -> dict:
+    """The fixture search result whose title and snippet the page at ``url`` carries."""
+    return {**_pick(url, FIXTURE_LINKS), "link": url}
+
+
+def to_actor_item(tweet: dict) -> dict:
+    """Inverse of ``toTwitterScraperTweet``: a tweet in the actors' dataset shape."""
+    user = tweet.get("user") or {}
+    quote = tweet.get("quote")
+    return {
+        "type": "tweet",
+        "id": tweet["id"],
+        "url": tweet["url"],
+        "text": tweet.get("text"),
+        "replyCount": tweet.get("reply_count"),
+        "retweetCount": tweet.get("retweet_count"),
+        "likeCount": tweet.get("like_count"),
+        "quoteCount": tweet.get("quote_count"),
+        "bookmarkCount": tweet.get("bookmark_count"),
+        "viewCount": tweet.get("view_count"),
+        "createdAt": tweet.get("created_at"),
+        "isQuote": tweet.get("is_quote_tweet"),
+        "isRetweet": tweet.get("is_retweet"),
+        "lang": tweet.get("lang"),
+        "conversationId": tweet.get("conversation_id"),
+        "inReplyToId": tweet.get("in_reply_to_status_id"),
+        "entities": tweet.get("entities"),
+        "extendedEntities": tweet.get("extended_entities") or {},
+        "quoted_tweet": quote and to_actor_item(quote),
+        "author": {
+            "id": user.get("id"),
+            "createdAt": user.get("created_at"),
+            "description": user.get("description"),
+            "followers": user.get("followers_count"),
+            "favouritesCount": user.get("favourites_count"),
+            "listedCount": user.get("listed_count"),
+            "mediaCount": user.get("media_count"),
+            "statusesCount": user.get("statuses_count"),
+            "isVerified": user.get("verified"),
+            "isBlueVerified": user.get("is_blue_verified"),
+            "profilePicture": user.get("profile_image_url"),
+            "coverPicture": user.get("profile_banner_url"),
+            "url": user.get("url"),
+            "name": user.get("name"),
+            "userName": user.get("username"),
+            "entities": user.get("entities"),
+            "canDm": user.get("can_dm"),
+            "canMediaTag": user.get("can_media_tag"),
+            "location": user.get("location"),
+            "pinnedTweetIds": user.get("pinned_tweet_ids"),
+        },
+    }
+
+
+def article_html(url: str) -> str:
+    link = fixture_link(url)
+    title, snippet = escape(link["title"]), escape(link["snippet"])
+    others = "".join(
+        f"<p>{escape(other['snippet'])}</p>" for other in FIXTURE_LINKS if other != link
+    )
+    return (
+        f"<html><head><title>{title}</title>"
+        f'<meta name="description" content="{snippet}"></head>'
+        f"<body><article><h1>{title}</h1><p>{snippet}</p>{others}</article>"
+        "</body></html>"
+    )
+
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+class EmulatedRun:
+    def __init__(self, actor_id: str, items: list, duration: float, failed: bool):
+        self.id = uuid.uuid4().hex
+        self.dataset_id = uuid.uuid4().hex
+        self.actor_id = actor_id
+        self.items = [] if failed else items
+        self.started_at = time.time()
+        self.finishes_at = self.started_at + duration
+        self.final_status = "FAILED" if failed else "SUCCEEDED"
+        self.aborted_at: Optional[float] = None
+
+    def status(self) -> str:
+        if self.aborted_at is not None:
+            return "ABORTED"
+        if time.time() >= self.finishes_at:
+            return self.final_status
+        return "RUNNING"
+
+    def remaining(self) -> float:
+        if self.status() != "RUNNING":
+            return 0.0
+        return self.finishes_at - time.time()
+
+    def visible_items(self) -> list:
+        """Items pushed so far: they land evenly over the run."""
+        end = self.aborted_at or time.time()
+        duration = self.finishes_at - self.started_at
+        if end >= self.finishes_at or duration <= 0:
+            return self.items
+        done = (end - self.started_at) / duration
+        return self.items[: int(len(self.items) * done)]
+
+    def to_dict(self) -> dict:
+        status = self.status()
+        finished_at = None
+        if status == "ABORTED":
+            finished_at = self.aborted_at
+        elif status != "RUNNING":
+            finished_at = self.finishes_at
+        return {
+            "id": self.id,
+            "actId": self.actor_id,
+            "status": status,
+            "defaultDatasetId": self.dataset_id,
+            "startedAt": _iso(self.started_at),
+            "finishedAt": _iso(finished_at),
+        }
+
+
+class ProviderEmulator:
+    def __init__(
+        self,
+        profiles: Optional[dict] = None,
+        seed: int = 0,
+        llm_reply: str = DEFAULT_LLM_REPLY,
+    ) -> None:
+        self.profiles = {**DEFAULT_PROFILES, **(profiles or {})}
+        self.rng = random.Random(seed)
+        self.llm_reply = llm_reply
+        self.runs: dict[str, EmulatedRun] = {}
+        self.datasets: dict[str, EmulatedRun] = {}
+        self.served: dict[str, list[float]] = {name: [] for name in self.profiles}
+        self.errors: dict[str, int] = {name: 0 for name in self.profiles}
+        self.url: Optional[str] = None
+        self._runner: Optional[web.AppRunner] = None
+
+        self.app = web.Application()
+        self.app.add_routes(
+            [
+                web.post("/apify/v2/acts/{actor_id}/runs", self.start_run),
+                web.get("/apify/v2/actor-runs/{run_id}", self.get_run),
+                web.post("/apify/v2/actor-runs/{run_id}/abort", self.abort_run),
+                web.get("/apify/v2/datasets/{dataset_id}/items", self.list_items),
+                web.get("/scrapingdog/scrape", self.scrape),
+                web.get("/scrapingdog/youtube/video", self.youtube_video),
+                web.get("/scrapingdog/google", self.google_search),
+                web.post("/openai/v1/chat/completions", self.chat_completion),
+                web.post("/chutes/v1/chat/completions", self.chat_completion),
+                web.get("/stats", self.get_stats),
+            ]
+        )
+
+    def scaled(self, factor: float) -> "ProviderEmulator":
+        self.profiles = {
+            name: replace(profile, median_ms=profile.median_ms * factor)
+            for name, profile in self.profiles.items()
+        }
+        return self
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.url = f"http://{host}:{bound_port}"
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def environ(self) -> dict[str, str]:
+        """Environment pointing every provider client at this emulator."""
+        paths = {
+            APIFY: "apify",
+            SCRAPINGDOG: "scrapingdog",
+            OPENAI: "openai/v1",
+            CHUTES: "chutes/v1",
+        }
+        env = {
+            BASE_URL_ENV_VARS[name]: f"{self.url}/{path}"
+            for name, path in paths.items()
+        }
+        env.update({var: "emulator" for var in API_KEY_ENV_VARS.values()})
+        return env
+
+    async def _serve(self, provider: str) -> bool:
+        """Sleep for a sampled latency; False when the request should fail."""
+        profile = self.profiles[provider]
+        delay = profile.delay(self.rng)
+        failed = profile.fails(self.rng)
+        await asyncio.sleep(delay)
+        self.served[provider].append(delay)
+        if failed:
+            self.errors[provider] += 1
+        return not failed
+
+    def _error(self, provider: str) -> web.Response:
+        return web.json_response(
+            {"error": {"type": "emulated-error", "message": f"{provider} failure"}},
+            status=500,
+        )
+
+    # Apify
+
+    def _actor_items(self, run_input: dict) -> list:
+        tweet_ids = run_input.get("tweetIDs")
+        if tweet_ids:
+            tweets = [fixture_tweet(str(tweet_id)) for tweet_id in tweet_ids]
+        else:
+            key = repr(sorted(run_input.items()))
+            base = 10**15 + zlib.crc32(key.encode()) * 1000
+            count = run_input.get("maxItems") or DEFAULT_SEARCH_ITEMS
+            tweets = [fixture_tweet(str(base + i)) for i in range(count)]
+        return [to_actor_item(tweet) for tweet in tweets]
+
+    async def start_run(self, request: web.Request) -> web.Response:
+        run_input = await request.json() if request.can_read_body else {}
+        profile = self.profiles[APIFY]
+        duration = profile.delay(self.rng)
+        failed = profile.fails(self.rng)
+        self.served[APIFY].append(duration)
+        if failed:
+            self.errors[APIFY] += 1
+
+        run = EmulatedRun(
+            request.match_info["actor_id"],
+            self._actor_items(run_input or {}),
+            duration,
+            failed,
+        )
+        self.runs[run.id] = run
+        self.datasets[run.dataset_id] = run
+        return web.json_response({"data": run.to_dict()}, status=201)
+
+    async def get_run(self, request: web.Request) -> web.Response:
+        run = self.runs.get(request.match_info["run_id"])
+        if run is None:
+            raise web.HTTPNotFound()
+        wait = float(request.query.get("waitForFinish") or 0)
+        await asyncio.sleep(min(max(wait, 0), run.remaining()))
+        return web.json_response({"data": run.to_dict()})
+
+    async def abort_run(self, request: web.Request) -> web.Response:
+        run = self.runs.get(request.match_info["run_id"])
+        if run is None:
+            raise web.HTTPNotFound()
+        if run.status() == "RUNNING":
+            run.aborted_at = time.time()
+        return web.json_response({"data": run.to_dict()})
+
+    async def list_items(self, request: web.Request) -> web.Response:
+        run = self.datasets.get(request.match_info["dataset_id"])
+        if run is None:
+            raise web.HTTPNotFound()
+        items = run.visible_items()
+        offset = int(request.query.get("offset") or 0)
+        limit = int(request.query.get("limit") or len(items) or 1)
+        page = items[offset : offset + limit]
+        return web.json_response(
+            page,
+            headers={
+                "x-apify-pagination-total": str(len(items)),
+                "x-apify-pagination-offset": str(offset),
+                "x-apify-pagination-limit": str(limit),
+                "x-apify-pagination-desc": "",
+            },
+        )
+
+    # ScrapingDog
+
+    async def scrape(self, request: web.Request) -> web.Response:
+        if not await self._serve(SCRAPINGDOG):
+            return self._error(SCRAPINGDOG)
+        return web.Response(
+            text=article_html(request.query.get("url", "")), content_type="text/html"
+        )
+
+    async def youtube_video(self, request: web.Request) -> web.Response:
+        if not await self._serve(SCRAPINGDOG):
+            return self._error(SCRAPINGDOG)
+        link = fixture_link(request.query.get("v", ""))
+        return web.json_response(
+            {
+                "video": {"title": link["title"], "description": link["snippet"]},
+                "channel": {"name": "emulator"},
+            }
+        )
+
+    async def google_search(self, request: web.Request) -> web.Response:
+        if not await self._serve(SCRAPINGDOG):
+            return self._error(SCRAPINGDOG)
+        results = int(request.query.get("results") or len(FIXTURE_LINKS))
+        organic = [
+            {key: link[key] for key in ("title", "link", "snippet")}
+            for link in FIXTURE_LINKS[:results]
+        ]
+        return web.json_response({"organic_results": organic})
+
+    # OpenAI-compatible chat completions
+
+    async def chat_completion(self, request: web.Request) -> web.Response:
+        provider = OPENAI if request.path.startswith("/openai/") else CHUTES
+        payload = await request.json()
+        if not await self._serve(provider):
+            return self._error(provider)
+        return web.json_response(
+            {
+                "id": f"chatcmpl-{uuid.uuid4().hex}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": payload.get("model", ""),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": self.llm_reply},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_tokens": 0,
+                },
+            }
+        )
+
+    # Stats
+
+    def stats(self) -> dict:
+        stats = {}
+        for name, delays in self.served.items():
+            ordered = sorted(delays)
+            stats[name] = {
+                "requests": len(ordered),
+                "errors": self.errors[name],
+                "p50_ms": _quantile(ordered, 0.50) * 1000,
+                "p99_ms": _quantile(ordered, 0.99) * 1000,
+            }
+        return stats
+
+    async def get_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats())
+
+
+def _quantile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def parse_profiles(specs: list[str]) -> dict[str, LatencyProfile]:
+    profiles = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if name not in DEFAULT_PROFILES:
+            raise ValueError(f"unknown provider {name!r} in --profile {spec!r}")
+        profiles[name] = LatencyProfile.parse(values)
+    return profiles
+
+
+def add_profile_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        action="append",
+        default=[],
+        metavar="NAME=MEDIAN_MS[:SIGMA[:ERROR_RATE]]",
+        help=f"override a provider profile; providers: {', '.join(DEFAULT_PROFILES)}",
+    )
+    parser.add_argument("--latency-scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--llm-reply", default=DEFAULT_LLM_REPLY)
+
+
+def emulator_from_args(args: argparse.Namespace) -> ProviderEmulator:
+    emulator = ProviderEmulator(
+        parse_profiles(args.profile), seed=args.seed, llm_reply=args.llm_reply
+    )
+    return emulator.scaled(args.latency_scale)
+
+
+async def serve(args: argparse.Namespace) -> None:
+    emulator = emulator_from_args(args)
+    await emulator.start(args.host, args.port)
+    for name, value in emulator.environ().items():
+        print(f"export {name}={value}")
+    sys.stdout.flush()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await emulator.stop()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    add_profile_args(parser)
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""Build scoring log entries for a deep-mode batch, legacy vs current.
+
+Usage:
+    python -m benchmarks.response_logs [--responses 500] [--repeat 3]
+
+Each response is a ScraperStreamingSynapse filled from tests_data fixtures:
+search results, miner tweets, validator links carrying html bodies and a long
+completion. The legacy path walks ``model_dump(mode="python")`` recursively,
+walks the result again to drop html keys and re-serializes the batch reward
+arrays for every response; the current path dumps each synapse once in JSON
+mode and slices a ``RewardBatch``. Both must produce identical entries.
+"""
+
+import argparse
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from desearch.protocol import ScraperStreamingSynapse, SearchResultItem
+from neurons.validators.clients import miner_response_logger as logger
+from tests_data.links.links import link1, link2, link3
+from tests_data.tweets.tweet1 import tweet1
+
+OWNER = SimpleNamespace(
+    config=SimpleNamespace(netuid=22),
+    validator_identity={"uid": 7, "hotkey": "vhk", "coldkey": "vck", "netuid": 22},
+    metagraph=SimpleNamespace(hotkeys=[], axons=[]),
+)
+
+
+def build_batch(count: int):
+    links = [link1, link2, link3] * 4
+    results = [
+        SearchResultItem(**{k: v for k, v in link.items() if k != "date"})
+        for link in links
+    ]
+    validator_links = [
+        {**link, "html_content": "<p>body</p>" * 400, "html_text": "body " * 400}
+        for link in links
+    ]
+    responses = [
+        ScraperStreamingSynapse(
+            prompt=f"query {i}",
+            model="NOVA",
+            mode="deep",
+            tools=["Web Search", "Twitter Search"],
+            completion="word " * 1500,
+            search_results=results,
+            miner_tweets=[tweet1] * 10,
+            validator_links=validator_links,
+            text_chunks={"summary": ["chunk"] * 200},
+        )
+        for i in range(count)
+    ]
+
+    rng = np.random.default_rng(0)
+    all_rewards = [rng.random(count, dtype=np.float32) for _ in range(3)]
+    event = {
+        "content_raw": rng.random(count).tolist(),
+        "summary_raw": rng.random(count).tolist(),
+        "streaming_penalty_applied": rng.random(count),
+        "uids": list(range(count)),
+    }
+    return responses, all_rewards, event
+
+
+def legacy_to_jsonable(value):
+    if isinstance(value, logger.BaseModel):
+        return {
+            key: legacy_to_jsonable(item)
+            for key, item in value.model_dump(mode="python").items()
+        }
+    if isinstance(value, logger.Enum):
+        return value.value
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {str(key): legacy_to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [legacy_to_jsonable(item) for item in value]
+    return logger.to_jsonable(value)
+
+
+def legacy_entries(responses, all_rewards, event) -> list[dict]:
+    count = len(responses)
+    entries = []
+    for index, response in enumerate(responses):
+        components = {}
+        for name, rewards in zip(
+            logger.REWARD_COMPONENT_NAMES["ai_search"], all_rewards
+        ):
+            components[name] = legacy_to_jsonable(rewards)[index]
+        event_slice = {}
+        for key, value in event.items():
+            if key in {"step_length", "prompts", "uids", "rewards"}:
+                continue
+            serialized = legacy_to_jsonable(value)
+            event_slice[key] = (
+                serialized[index]
+                if isinstance(serialized, list) and len(serialized) == count
+                else serialized
+            )
+        entries.append(
+            {
+                "response_payload": logger._sanitize_response_payload(
+                    legacy_to_jsonable(response)
+                ),
+                "components": components,
+                "event_slice": event_slice,
+            }
+        )
+    return entries
+
+
+def current_entries(responses, all_rewards, event) -> list[dict]:
+    batch = logger.RewardBatch.serialize(all_rewards, all_rewards, all_rewards, event)
+    entries = []
+    for index, response in enumerate(responses):
+        payload = logger.build_reward_payload(
+            search_type="ai_search",
+            response_count=len(responses),
+            index=index,
+            uid=index,
+            total_reward=0.0,
+            batch=batch,
+        )
+        entry = logger.build_log_entry(
+            owner=OWNER,
+            search_type="ai_search",
+            query_kind="scoring",
+            response=response,
+            miner_uid=index,
+            reward_payload=payload,
+        )
+        entries.append(
+            {
+                "response_payload": entry["response_payload"],
+                "components": payload["components"],
+                "event_slice": payload["event_slice"],
+            }
+        )
+    return entries
+
+
+def timed(fn, repeat: int, *args) -> tuple[float, list]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--responses", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    batch = build_batch(args.responses)
+    legacy_seconds, legacy = timed(legacy_entries, args.repeat, *batch)
+    current_seconds, current = timed(current_entries, args.repeat, *batch)
+
+    print(f"legacy  {legacy_seconds * 1000:9.1f} ms")
+    print(f"current {current_seconds * 1000:9.1f} ms")
+    print(f"speedup {legacy_seconds / current_seconds:9.1f}x")
+
+    if legacy != current:
+        print("MISMATCH between legacy and current entries")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
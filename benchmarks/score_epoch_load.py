@@ -0,0 +1,278 @@
+"""Drive ``QueryScheduler.score_epoch`` end to end against the provider emulator.
+
+Usage:
+    python -m benchmarks.score_epoch_load [--uids 16] [--responses 5] [--epochs 3]
+        [--profile apify=3000:0.4:0.01] [--latency-scale 1.0] [--seed 0]
+
+Starts ``benchmarks.provider_emulator`` in-process, points every provider
+client at it and scores ``--epochs`` synthetic epochs with the real AI and X
+search validators: ``--uids`` miners, each with ``--responses`` stored
+responses per search type. Miner tweets and links come from the emulator's
+fixtures, so validator verification fetches the same records. Every epoch
+uses fresh tweet ids and urls, so no epoch is served from an earlier one's
+caches. Miner state lives in a throwaway SQLite database; Redis is optional
+(tweet cache and snapshot writes only log a warning without it).
+
+Reports per-epoch wall time and throughput, their spread across epochs and
+the requests each provider served with the injected latency quantiles.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import numpy as np
+
+from benchmarks.provider_emulator import (
+    add_profile_args,
+    emulator_from_args,
+    fixture_link,
+    fixture_tweet,
+)
+from desearch.miner_config import LANES, lane_key
+from desearch.protocol import (
+    ScoringModel,
+    ScraperStreamingSynapse,
+    ScraperTextRole,
+    SearchMode,
+    TwitterSearchSynapse,
+)
+from neurons.validators.penalty.streaming_penalty import (
+    MAX_TOKENS_PER_CHUNK,
+    encoding,
+)
+from neurons.validators.scoring import miner_db
+from neurons.validators.scoring.query_scheduler import QueryScheduler
+from neurons.validators.scrapers.advanced_scraper_validator import (
+    AdvancedScraperValidator,
+)
+from neurons.validators.scrapers.x_scraper_validator import XScraperValidator
+
+X_QUERY = "crypto"
+AI_PROMPT = "what is the python programming language"
+RESULTS_PER_RESPONSE = 10
+
+
+class NullShipper:
+    def submit(self, logs) -> None:
+        pass
+
+
+class HarnessNeuron:
+    """The parts of the validator neuron that scoring reads."""
+
+    def __init__(self, uid_count: int, scoring_model: ScoringModel) -> None:
+        self.config = SimpleNamespace(
+            netuid=22,
+            wandb_on=False,
+            neuron=SimpleNamespace(
+                scoring_model=scoring_model,
+                disable_log_rewards=True,
+                hedge_quantile=0.9,
+            ),
+        )
+        self.metagraph = SimpleNamespace(
+            hotkeys=[f"hk-{uid}" for uid in range(uid_count)], axons=[]
+        )
+        self.validator_identity = {"uid": 0, "hotkey": "vk", "coldkey": "vck"}
+        self.log_shipper = NullShipper()
+        self.scores: dict[int, float] = {}
+
+    async def update_moving_averaged_scores(self, uids, rewards) -> None:
+        self.scores.update(zip(np.asarray(uids).tolist(), np.asarray(rewards).tolist()))
+
+
+class EpochStore:
+    """``ScoringStore`` stand-in holding one epoch's decoded responses."""
+
+    def __init__(self, synthetics: dict) -> None:
+        self.synthetics = synthetics
+
+    async def get_synthetics_for_range(self, time_range_start):
+        return self.synthetics
+
+    async def get_organics_for_range(self, time_range_start):
+        return {}
+
+
+def stream_chunks(text: str) -> list[str]:
+    """``text`` split the way a miner streams it: at most two tokens a chunk."""
+    tokens = encoding.encode(text)
+    return [
+        encoding.decode(tokens[i : i + MAX_TOKENS_PER_CHUNK])
+        for i in range(0, len(tokens), MAX_TOKENS_PER_CHUNK)
+    ]
+
+
+def _finish(synapse, rng: random.Random):
+    synapse.dendrite.status_code = 200
+    synapse.dendrite.process_time = rng.uniform(1.0, 8.0)
+    return synapse
+
+
+def x_response(epoch: int, uid: int, index: int, rng: random.Random):
+    tweets = [
+        fixture_tweet(f"{epoch + 1}{uid:05d}{index:04d}{j:02d}")
+        for j in range(RESULTS_PER_RESPONSE)
+    ]
+    synapse = TwitterSearchSynapse(
+        query=X_QUERY, count=len(tweets), results=tweets, max_execution_time=10
+    )
+    return _finish(synapse, rng)
+
+
+def ai_response(
+    epoch: int,
+    uid: int,
+    index: int,
+    rng: random.Random,
+    mode: SearchMode = SearchMode.FAST,
+):
+    links = [
+        fixture_link(f"https://bench.example/e{epoch}/u{uid}/r{index}/{j}")
+        for j in range(RESULTS_PER_RESPONSE)
+    ]
+    results = [
+        {
+            "title": link["title"],
+            "link": link["link"],
+            "snippet": link["snippet"],
+            "highlights": [link["snippet"]],
+            "text": link["snippet"],
+        }
+        for link in links
+    ]
+    summary = " ".join(
+        f"{link['snippet']} [{n}]({link['link']})" for n, link in enumerate(links, 1)
+    )
+    twitter = index % 2 == 1
+    tweets = (
+        [
+            fixture_tweet(f"9{epoch + 1}{uid:05d}{index:04d}{j:02d}")
+            for j in range(RESULTS_PER_RESPONSE)
+        ]
+        if twitter
+        else []
+    )
+    synapse = ScraperStreamingSynapse(
+        prompt=AI_PROMPT,
+        tools=["Twitter Search"] if twitter else ["Web Search"],
+        mode=mode,
+        max_execution_time=15,
+        count=RESULTS_PER_RESPONSE,
+        search_results=results,
+        miner_tweets=tweets,
+    )
+    synapse.text_chunks = {ScraperTextRole.FINAL_SUMMARY.value: stream_chunks(summary)}
+    return _finish(synapse, rng)
+
+
+def build_epoch(epoch: int, uid_count: int, per_uid: int, seed: int) -> dict:
+    rng = random.Random(seed + epoch)
+    synthetics = {"ai_search": [], "x_search": []}
+    for uid in range(uid_count):
+        for index in range(per_uid):
+            synthetics["x_search"].append(
+                {"uid": uid, "response": x_response(epoch, uid, index, rng)}
+            )
+            synthetics["ai_search"].append(
+                {"uid": uid, "response": ai_response(epoch, uid, index, rng)}
+            )
+    return synthetics
+
+
+async def register_miners(uid_count: int) -> None:
+    for uid in range(uid_count):
+        for lane in LANES:
+            await miner_db.register_miner(
+                uid=uid,
+                search_type=lane_key(lane),
+                declared=10,
+                hotkey=f"hk-{uid}",
+                coldkey="ck",
+            )
+
+
+def _quantile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run(args: argparse.Namespace) -> int:
+    emulator = emulator_from_args(args)
+    await emulator.start()
+    os.environ.update(emulator.environ())
+
+    neuron = HarnessNeuron(args.uids, ScoringModel(args.scoring_model))
+    validators = {
+        "ai_search": AdvancedScraperValidator(neuron),
+        "x_search": XScraperValidator(neuron),
+    }
+
+    rows = []
+    with tempfile.TemporaryDirectory() as state_dir:
+        await miner_db.initialize(
+            os.path.join(state_dir, "miner.db"), readonly=False, owner=True
+        )
+        await register_miners(args.uids)
+        epoch_start = datetime.now(timezone.utc).replace(
+            minute=0, second=0, microsecond=0
+        )
+        try:
+            for epoch in range(args.epochs):
+                synthetics = build_epoch(epoch, args.uids, args.responses, args.seed)
+                scheduler = QueryScheduler(
+                    neuron, None, EpochStore(synthetics), validators
+                )
+                count = sum(len(items) for items in synthetics.values())
+                started = time.perf_counter()
+                await scheduler.score_epoch(
+                    epoch_start - timedelta(hours=args.epochs - epoch), {}
+                )
+                rows.append((count, time.perf_counter() - started))
+        finally:
+            await miner_db.close()
+            await emulator.stop()
+
+    for epoch, (count, seconds) in enumerate(rows):
+        print(
+            f"epoch {epoch}: {count} responses in {seconds:7.2f} s  "
+            f"{count / seconds:7.1f} responses/s"
+        )
+    durations = [seconds for _, seconds in rows]
+    print(
+        f"score_epoch  p50 {_quantile(durations, 0.50):7.2f} s  "
+        f"p95 {_quantile(durations, 0.95):7.2f} s  max {max(durations):7.2f} s"
+    )
+    for name, stats in emulator.stats().items():
+        print(
+            f"{name:12s} {stats['requests']:6d} requests  {stats['errors']:4d} errors  "
+            f"p50 {stats['p50_ms']:8.1f} ms  p99 {stats['p99_ms']:8.1f} ms"
+        )
+    print(f"scored uids: {len(neuron.scores)}/{args.uids}")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uids", type=int, default=16)
+    parser.add_argument("--responses", type=int, default=5)
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument(
+        "--scoring-model",
+        choices=[model.value for model in ScoringModel],
+        default=ScoringModel.QWEN3_5_397B.value,
+    )
+    add_profile_args(parser)
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,403 @@
+"""Benchmark ``QueryScheduler.score_epoch`` over a stored hour of responses.
+
+Usage:
+    python -m benchmarks.score_epoch_suite [--uids 32] [--responses 4]
+        [--organics 1] [--epochs 2] [--store memory|fakeredis|redis]
+        [--output results.json] [--baseline previous.json]
+        [--profile apify=3000:0.4:0.01] [--latency-scale 1.0] [--seed 0]
+
+Every epoch writes ``--uids`` x ``--responses`` synthetic responses per lane
+(and ``--organics`` organic ones) through ``ScoringStore.save_encoded``, then
+scores the hour with the real AI and X validators against
+``benchmarks.provider_emulator``, so the scheduler's own deep sample picks
+which responses get cheap and which get deep scoring. The store is kept in
+process memory by default; ``--store redis`` uses the Redis at
+``REDIS_HOST``/``REDIS_PORT`` and ``--store fakeredis`` needs the
+``fakeredis`` package. Miner state lives in a throwaway SQLite database.
+
+Per epoch it records wall time, peak RSS, event-loop lag and stalls by task
+(``LoopMonitor`` on a 10 ms ticker), SQLite commits and the time spent in
+each scoring stage.
+``--output`` saves the run as JSON; ``--baseline`` prints the change of every
+summary metric against an earlier result file.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, timedelta, timezone
+
+import aiosqlite
+
+from benchmarks.provider_emulator import add_profile_args, emulator_from_args
+from benchmarks.score_epoch_load import (
+    HarnessNeuron,
+    ai_response,
+    register_miners,
+    x_response,
+)
+from desearch.miner_config import LANES, SearchType
+from desearch.protocol import ScoringModel
+from neurons.validators.scoring import capacity, miner_db
+from neurons.validators.scoring import scoring_store as scoring_store_module
+from neurons.validators.scoring.query_scheduler import QueryScheduler
+from neurons.validators.scoring.scoring_store import ScoringStore
+from neurons.validators.scrapers.advanced_scraper_validator import (
+    AdvancedScraperValidator,
+)
+from neurons.validators.scrapers.x_scraper_validator import XScraperValidator
+from neurons.validators.utils.loop_monitor import LoopMonitor
+
+LAG_INTERVAL = 0.01
+LAG_WINDOW = 1_000_000
+ORGANIC_INDEX_OFFSET = 5000
+
+
+class MemoryRedis:
+    """The hash commands ``ScoringStore`` issues, kept in a dict."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = defaultdict(dict)
+        self._results: list = []
+
+    def pipeline(self, transaction: bool = True) -> "MemoryRedis":
+        return self
+
+    def hset(self, key: str, field: str, value: str) -> None:
+        self.hashes[key][field] = value
+        self._results.append(1)
+
+    def expire(self, key: str, seconds: int) -> None:
+        self._results.append(True)
+
+    def hgetall(self, key: str) -> None:
+        self._results.append(dict(self.hashes.get(key, {})))
+
+    async def execute(self) -> list:
+        results, self._results = self._results, []
+        return results
+
+    async def flushdb(self) -> None:
+        self.hashes.clear()
+
+
+def store_client(kind: str):
+    if kind == "memory":
+        return MemoryRedis()
+    if kind == "fakeredis":
+        try:
+            from fakeredis import aioredis
+        except ImportError:
+            raise SystemExit("--store fakeredis needs the fakeredis package")
+        return aioredis.FakeRedis(decode_responses=True)
+    return scoring_store_module.redis_client
+
+
+class StageTimer:
+    """Accumulates wall time and call counts of patched coroutines."""
+
+    def __init__(self) -> None:
+        self.seconds: dict[str, float] = defaultdict(float)
+        self.calls: dict[str, int] = defaultdict(int)
+
+    @contextmanager
+    def timing(self, owner, name: str, stage: str):
+        original = getattr(owner, name)
+        own = name in vars(owner)
+
+        async def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await original(*args, **kwargs)
+            finally:
+                self.seconds[stage] += time.perf_counter() - started
+                self.calls[stage] += 1
+
+        setattr(owner, name, timed)
+        try:
+            yield
+        finally:
+            if own:
+                setattr(owner, name, original)
+            else:
+                delattr(owner, name)
+
+    def report(self) -> dict:
+        return {
+            stage: {"seconds": round(seconds, 4), "calls": self.calls[stage]}
+            for stage, seconds in sorted(self.seconds.items())
+        }
+
+
+class CommitCounter:
+    """Counts ``commit`` calls on every aiosqlite connection."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __enter__(self) -> "CommitCounter":
+        original = self._original = aiosqlite.Connection.commit
+
+        async def commit(connection):
+            self.count += 1
+            return await original(connection)
+
+        aiosqlite.Connection.commit = commit
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        aiosqlite.Connection.commit = self._original
+
+
+def _quantile(ordered: list[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def build_records(
+    epoch: int,
+    time_range_start: datetime,
+    uid_count: int,
+    per_lane: int,
+    organics: int,
+    seed: int,
+) -> list:
+    """Encoded ``ScoringStore`` records for one epoch, every lane filled."""
+    rng = random.Random(seed + epoch)
+    records = []
+    for uid in range(uid_count):
+        for lane_index, (search_type, mode) in enumerate(LANES):
+            for kind, count, offset in (
+                ("synthetic", per_lane, 0),
+                ("organic", organics, ORGANIC_INDEX_OFFSET),
+            ):
+                for i in range(count):
+                    index = offset + lane_index * count + i
+                    if search_type == SearchType.X_SEARCH:
+                        response = x_response(epoch, uid, index, rng)
+                    else:
+                        response = ai_response(epoch, uid, index, rng, mode)
+                    records.append(
+                        (
+                            time_range_start,
+                            kind,
+                            uid,
+                            SearchType(search_type).value,
+                            ScoringStore.encode(response),
+                        )
+                    )
+    return records
+
+
+async def score_one_epoch(
+    neuron, store: ScoringStore, validators: dict, time_range_start: datetime
+) -> dict:
+    scheduler = QueryScheduler(neuron, None, store, validators)
+    stages = StageTimer()
+    with ExitStack() as patches:
+        for owner, name, stage in [
+            (store, "get_synthetics_for_range", "load_synthetics"),
+            (store, "get_organics_for_range", "load_organics"),
+            (capacity, "record_window_quality", "record_quality"),
+            (capacity, "ramp_after_epoch", "ramp"),
+            (neuron, "update_moving_averaged_scores", "dispatch"),
+        ] + [
+            (validator, method, f"{search_type}.{stage}")
+            for search_type, validator in validators.items()
+            for method, stage in (
+                ("compute_cheap_scores", "cheap"),
+                ("compute_rewards_and_penalties", "deep"),
+            )
+        ]:
+            patches.enter_context(stages.timing(owner, name, stage))
+        commits = patches.enter_context(CommitCounter())
+        monitor = LoopMonitor("score_epoch", interval=LAG_INTERVAL, window=LAG_WINDOW)
+        monitor.start()
+
+        started = time.perf_counter()
+        try:
+            await scheduler.score_epoch(time_range_start, {})
+        finally:
+            seconds = time.perf_counter() - started
+            await monitor.stop()
+
+    return {
+        "wall_seconds": round(seconds, 3),
+        "peak_rss_mb": peak_rss_mb(),
+        "loop_lag": monitor.stats(),
+        "sqlite_commits": commits.count,
+        "stages": stages.report(),
+    }
+
+
+def summarize(epochs: list[dict]) -> dict:
+    """Flat metrics over all epochs, the keys ``--baseline`` compares."""
+    walls = sorted(epoch["wall_seconds"] for epoch in epochs)
+    responses = sum(epoch["responses"] for epoch in epochs)
+    summary = {
+        "wall_seconds_p50": _quantile(walls, 0.50),
+        "wall_seconds_max": walls[-1],
+        "responses_per_second": round(responses / sum(walls), 2),
+        "peak_rss_mb": max(epoch["peak_rss_mb"] for epoch in epochs),
+        "loop_lag_p99_ms": max(epoch["loop_lag"]["lag_p99_ms"] for epoch in epochs),
+        "loop_lag_max_ms": max(epoch["loop_lag"]["lag_max_ms"] for epoch in epochs),
+        "sqlite_commits_per_epoch": round(
+            sum(epoch["sqlite_commits"] for epoch in epochs) / len(epochs), 1
+        ),
+        "store_write_seconds": round(
+            sum(epoch["store_write_seconds"] for epoch in epochs) / len(epochs), 4
+        ),
+    }
+    stage_seconds: dict[str, float] = defaultdict(float)
+    for epoch in epochs:
+        for stage, row in epoch["stages"].items():
+            stage_seconds[stage] += row["seconds"]
+    for stage, seconds in sorted(stage_seconds.items()):
+        summary[f"stage.{stage}_seconds"] = round(seconds / len(epochs), 4)
+    return summary
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_comparison(summary: dict, baseline_path: str) -> None:
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"vs {baseline_path} ({baseline.get('revision') or 'unknown revision'}):")
+    previous = baseline["summary"]
+    for key, value in summary.items():
+        before = previous.get(key)
+        if before is None:
+            print(f"  {key:40s} {value:12} (new)")
+            continue
+        change = f"{(value - before) / before * 100:+7.1f}%" if before else "    n/a"
+        print(f"  {key:40s} {before:12} -> {value:12}  {change}")
+
+
+async def run(args: argparse.Namespace) -> dict:
+    emulator = emulator_from_args(args)
+    await emulator.start()
+    os.environ.update(emulator.environ())
+
+    client = store_client(args.store)
+    original_client = scoring_store_module.redis_client
+    scoring_store_module.redis_client = client
+
+    neuron = HarnessNeuron(args.uids, ScoringModel(args.scoring_model))
+    validators = {
+        "ai_search": AdvancedScraperValidator(neuron),
+        "x_search": XScraperValidator(neuron),
+    }
+    store = ScoringStore()
+
+    epochs = []
+    with tempfile.TemporaryDirectory() as state_dir:
+        await miner_db.initialize(
+            os.path.join(state_dir, "miner.db"), readonly=False, owner=True
+        )
+        await register_miners(args.uids)
+        hour = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        try:
+            for epoch in range(args.epochs):
+                time_range_start = hour - timedelta(hours=args.epochs - epoch)
+                records = build_records(
+                    epoch,
+                    time_range_start,
+                    args.uids,
+                    args.responses,
+                    args.organics,
+                    args.seed,
+                )
+                started = time.perf_counter()
+                await store.save_encoded(records)
+                write_seconds = time.perf_counter() - started
+
+                row = await score_one_epoch(neuron, store, validators, time_range_start)
+                row["responses"] = len(records)
+                row["store_write_seconds"] = round(write_seconds, 4)
+                epochs.append(row)
+                print(
+                    f"epoch {epoch}: {len(records)} responses in "
+                    f"{row['wall_seconds']:7.2f} s  rss {row['peak_rss_mb']:7.1f} MB  "
+                    f"lag p99 {row['loop_lag']['lag_p99_ms']:7.1f} ms  "
+                    f"{row['sqlite_commits']} commits"
+                )
+        finally:
+            scoring_store_module.redis_client = original_client
+            await miner_db.close()
+            await emulator.stop()
+
+    return {
+        "benchmark": "score_epoch_suite",
+        "revision": git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "config": {
+            key: value for key, value in vars(args).items() if key != "baseline"
+        },
+        "summary": summarize(epochs),
+        "epochs": epochs,
+        "providers": emulator.stats(),
+        "scored_uids": len(neuron.scores),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uids", type=int, default=32)
+    parser.add_argument("--responses", type=int, default=4, help="per UID and lane")
+    parser.add_argument("--organics", type=int, default=1, help="per UID and lane")
+    parser.add_argument("--epochs", type=int, default=2)
+    parser.add_argument(
+        "--store", choices=["memory", "fakeredis", "redis"], default="memory"
+    )
+    parser.add_argument(
+        "--scoring-model",
+        choices=[model.value for model in ScoringModel],
+        default=ScoringModel.QWEN3_5_397B.value,
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this results file")
+    add_profile_args(parser)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    for key, value in results["summary"].items():
+        print(f"{key:40s} {value}")
+    print(f"scored uids: {results['scored_uids']}/{args.uids}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"wrote {args.output}")
+    if args.baseline:
+        print_comparison(results["summary"], args.baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
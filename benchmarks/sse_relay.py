@@ -0,0 +1,113 @@
+"""Compare the legacy and current /search SSE relay on a fake miner stream.
+
+Usage:
+    python -m benchmarks.sse_relay [--tokens 4000] [--search-results 300]
+
+The fake miner yields text token events, a search event and a completion,
+the way ScraperStreamingSynapse hands them to the API. Both relays frame
+every event; the legacy one works on JSON strings and keeps the merged
+transcript, the current one encodes decoded events straight to bytes. Frames
+must match byte for byte. Reports wall time, bytes, per-event relay latency
+and peak traced memory.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from desearch.stream import encode_sse_event
+
+
+def fake_events(tokens: int, search_results: int) -> list[dict]:
+    events = [
+        {"type": "text", "role": "final_summary", "content": f"word{i} "}
+        for i in range(tokens)
+    ]
+    results = [
+        {
+            "title": f"Result {i}",
+            "link": f"https://example.com/{i}",
+            "snippet": "lorem ipsum " * 40,
+        }
+        for i in range(search_results)
+    ]
+    events.insert(0, {"type": "search", "content": results})
+    events.append(
+        {"type": "completion", "content": "".join(e["content"] for e in events[1:])}
+    )
+    return events
+
+
+async def miner(events: list[dict], as_strings: bool):
+    for event in events:
+        yield (json.dumps(event) if as_strings else event), time.perf_counter()
+
+
+async def legacy_relay(events):
+    merged_chunks = ""
+    async for response, produced in miner(events, as_strings=True):
+        chunk = str(response)
+        merged_chunks += chunk
+        lines = chunk.split("\n")
+        sse_data = "\n".join(f"data: {line if line else ' '}" for line in lines)
+        yield f"{sse_data}\n\n".encode("utf-8"), produced
+
+
+async def current_relay(events):
+    async for event, produced in miner(events, as_strings=False):
+        yield encode_sse_event(event), produced
+
+
+async def measure(relay, events) -> dict:
+    tracemalloc.start()
+    started = time.perf_counter()
+    frames, lags = [], []
+    async for frame, produced in relay(events):
+        lags.append(time.perf_counter() - produced)
+        frames.append(frame)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "frames": frames,
+        "seconds": elapsed,
+        "bytes": sum(len(frame) for frame in frames),
+        "lag_p50_us": float(np.percentile(lags, 50)) * 1e6,
+        "lag_p99_us": float(np.percentile(lags, 99)) * 1e6,
+        "peak_kb": peak / 1024,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=4000)
+    parser.add_argument("--search-results", type=int, default=300)
+    args = parser.parse_args()
+
+    events = fake_events(args.tokens, args.search_results)
+    results = {
+        "legacy": asyncio.run(measure(legacy_relay, events)),
+        "current": asyncio.run(measure(current_relay, events)),
+    }
+
+    for name, result in results.items():
+        print(
+            f"{name:8s} {result['seconds'] * 1000:8.1f} ms  "
+            f"{result['bytes'] / 1e6:6.2f} MB  "
+            f"lag p50 {result['lag_p50_us']:7.1f} us  p99 {result['lag_p99_us']:7.1f} us  "
+            f"peak {result['peak_kb']:9.1f} KB"
+        )
+
+    if results["legacy"]["frames"] != results["current"]["frames"]:
+        print("MISMATCH between legacy and current frames")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
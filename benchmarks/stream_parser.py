@@ -0,0 +1,128 @@
+"""Replay a miner stream through the legacy and incremental JSON parsers.
+
+Usage:
+    python -m benchmarks.stream_parser [--stream capture.bin] [--size-mb 4]
+
+With ``--stream`` the raw bytes of a recorded miner response body are
+replayed; otherwise a synthetic ScraperStreamingSynapse stream is built from
+tests_data fixtures (token text events plus one large ``tweets`` and one large
+``search`` event, as a deep-mode miner sends them). The body is cut into
+chunk sizes like ``iter_any`` returns and fed to the former
+``extract_json_chunk`` and ``JSONStreamParser``; both must produce the same
+events.
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from desearch.protocol import JSONStreamParser
+from tests_data.links.links import link1, link2, link3
+from tests_data.tweets.tweet1 import tweet1
+from tests_data.tweets.tweet2 import tweet2
+
+
+def legacy_extract_json_chunk(chunk: str, buffer: str = "") -> tuple[list, str]:
+    """The former ``desearch.protocol.extract_json_chunk``: re-decode the
+    buffer from its start after every chunk."""
+    buffer += chunk
+    json_objects = []
+
+    while True:
+        try:
+            json_obj, end = json.JSONDecoder(strict=False).raw_decode(buffer)
+            json_objects.append(json_obj)
+            buffer = buffer[end:]
+        except json.JSONDecodeError:
+            # Incomplete at the end of the buffer, or invalid: wait for more.
+            break
+
+    return json_objects, buffer
+
+
+def synthetic_stream(size_mb: float) -> bytes:
+    target = int(size_mb * 1024 * 1024)
+    tweet_bytes = len(json.dumps([tweet1, tweet2]))
+    tweets = [tweet1, tweet2] * max(1, target // 2 // tweet_bytes)
+    links = [link1, link2, link3] * max(1, target // 6 // 600)
+
+    events = [
+        {"type": "text", "role": "summary", "content": f"token{i} "}
+        for i in range(2000)
+    ]
+    events.insert(500, {"type": "tweets", "content": tweets})
+    events.insert(1000, {"type": "search", "content": links})
+    events.append({"type": "completion", "content": "done"})
+    return "".join(json.dumps(e) for e in events).encode("utf-8")
+
+
+def split(payload: bytes, seed: int) -> list[bytes]:
+    rng = random.Random(seed)
+    chunks, i = [], 0
+    while i < len(payload):
+        size = rng.randint(512, 16384)
+        chunks.append(payload[i : i + size])
+        i += size
+    return chunks
+
+
+def run_legacy(chunks: list[bytes]) -> tuple[float, list]:
+    started = time.perf_counter()
+    events, buffer = [], ""
+    for chunk in chunks:
+        objects, buffer = legacy_extract_json_chunk(
+            chunk.decode("utf-8", errors="ignore"), buffer
+        )
+        for obj in objects:
+            json.dumps(obj)
+        events.extend(objects)
+    return time.perf_counter() - started, events
+
+
+def run_incremental(chunks: list[bytes], decoded: bool) -> tuple[float, list]:
+    started = time.perf_counter()
+    events, parser = [], JSONStreamParser()
+    for chunk in chunks:
+        objects = parser.feed(chunk)
+        if not decoded:
+            for obj in objects:
+                json.dumps(obj)
+        events.extend(objects)
+    return time.perf_counter() - started, events
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stream", help="Raw miner response body to replay.")
+    parser.add_argument("--size-mb", type=float, default=4.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    if args.stream:
+        with open(args.stream, "rb") as f:
+            payload = f.read()
+    else:
+        payload = synthetic_stream(args.size_mb)
+    chunks = split(payload, args.seed)
+    print(f"stream: {len(payload) / 1e6:.2f} MB in {len(chunks)} chunks")
+
+    elapsed, events = run_incremental(chunks, decoded=False)
+    print(f"incremental (json strings): {elapsed:.3f}s, {len(events)} events")
+    elapsed, _ = run_incremental(chunks, decoded=True)
+    print(f"incremental (decoded):      {elapsed:.3f}s")
+
+    if not args.skip_legacy:
+        legacy_elapsed, legacy_events = run_legacy(chunks)
+        print(f"legacy:                     {legacy_elapsed:.3f}s")
+        if legacy_events != events:
+            print("MISMATCH between legacy and incremental events")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
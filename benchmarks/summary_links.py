@@ -0,0 +1,332 @@
+"""Canonicalize the links of link-heavy AI search responses, legacy vs current.
+
+Usage:
+    python -m benchmarks.summary_links [--responses 500] [--results 40] [--repeat 3]
+
+Each response carries ``--results`` search results (with ``www.``, trailing
+slash and tracking-parameter variants of shared URLs), ten miner tweets, a
+summary citing most of them and a few fetched validator links. For every
+response the benchmark does the link work one scoring pass does: the
+summary structure penalty, the duplicate results penalty, link sampling of
+the web and X relevance models, the miner metadata lookup and the summary
+groundedness bodies and markers.
+
+The legacy path normalizes every URL at every call site and re-parses the
+summary for each model; the current path takes the memoized, interned keys
+of ``response_checks`` and the ``ResponseLinks`` kept on the response. URL
+caches are cleared before each current run, so only reuse within one pass
+counts. Both must pick the same links and build the same bodies.
+"""
+
+import argparse
+import random
+import sys
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from desearch.protocol import ScraperStreamingSynapse, ScraperTextRole
+from neurons.validators.reward.twitter_content_relevance import (
+    TwitterContentRelevanceModel,
+)
+from neurons.validators.utils.response_checks import (
+    _is_tracking_param,
+    extract_markdown_links,
+    first_duplicate_id,
+    normalize_source_url,
+    response_links,
+    source_key,
+)
+from neurons.validators.utils.source_bodies import (
+    _CITATION_MARKER,
+    _TWEET_ID,
+    align_citation_markers,
+    collect_cited_bodies,
+    sample_cited_and_uncited,
+)
+
+MAX_CITED_SAMPLE = 2
+MAX_SAMPLED_LINKS = 3
+MAX_SAMPLED_TWEETS = 3
+SUMMARY = ScraperTextRole.FINAL_SUMMARY.value
+
+
+def build_responses(count: int, results: int, seed: int) -> list:
+    rng = random.Random(seed)
+    shared = [f"https://news{i}.example.com/story/{i}" for i in range(200)]
+    responses = []
+    for i in range(count):
+        links = []
+        for j in range(results):
+            url = rng.choice(shared) if j % 2 else f"https://site{i}.example/{j}"
+            variant = rng.randrange(4)
+            if variant == 1:
+                url = url.replace("https://", "https://www.")
+            elif variant == 2:
+                url += "/"
+            elif variant == 3:
+                url += f"?utm_source=feed&id={j}"
+            links.append(url)
+        tweets = [
+            {
+                "id": f"{i}{j:03d}",
+                "url": f"https://x.com/user{j}/status/{i}{j:03d}",
+                "user": {"username": f"user{j}"},
+            }
+            for j in range(10)
+        ]
+        cited = links[: results * 2 // 3] + [tweet["url"] for tweet in tweets[:5]]
+        summary = " ".join(f"Claim {n} [{n}]({url})." for n, url in enumerate(cited, 1))
+        responses.append(
+            ScraperStreamingSynapse(
+                prompt=f"query {i}",
+                tools=["Web Search", "Twitter Search"],
+                search_results=[
+                    {"title": f"T{j}", "link": url, "snippet": "s"}
+                    for j, url in enumerate(links)
+                ],
+                miner_tweets=tweets,
+                text_chunks={SUMMARY: [summary]},
+                validator_links=[
+                    {"link": url, "title": "T", "body": f"body of {url}"}
+                    for url in links[:5]
+                ],
+            )
+        )
+    return responses
+
+
+def legacy_normalize(url):
+    url = (url or "").strip().lower()
+    if url.startswith("https://www."):
+        url = "https://" + url[len("https://www.") :]
+    elif url.startswith("http://www."):
+        url = "http://" + url[len("http://www.") :]
+    return url.removesuffix("/")
+
+
+def legacy_source_key(url):
+    parts = urlsplit(url or "")
+    base = legacy_normalize(
+        urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+    )
+    kept = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(k)
+    )
+    return f"{base}?{urlencode(kept)}" if kept else base
+
+
+def legacy_sources(response) -> set:
+    sources = set()
+    for tweet in response.miner_tweets or []:
+        username = tweet.get("user", {}).get("username", "")
+        if username and tweet.get("id"):
+            sources.add(
+                legacy_normalize(f"https://x.com/{username}/status/{tweet['id']}")
+            )
+    for result in response.search_results or []:
+        if result.link:
+            sources.add(legacy_normalize(result.link))
+    return sources
+
+
+def legacy_cited(summary) -> set:
+    return {legacy_normalize(u) for _, u in extract_markdown_links(summary)}
+
+
+def legacy_sample(urls, cited_norm, max_cited, max_total):
+    cited = [u for u in urls if legacy_normalize(u) in cited_norm]
+    other = [u for u in urls if legacy_normalize(u) not in cited_norm]
+    picks = random.sample(cited, min(max_cited, len(cited)))
+    if other:
+        picks.append(random.choice(other))
+    while len(picks) < max_total:
+        pool = [u for u in urls if u not in picks]
+        if not pool:
+            break
+        picks.append(random.choice(pool))
+    return picks
+
+
+def legacy_dedup_richest(bodies):
+    best = {}
+    for b in bodies:
+        key = legacy_source_key(b.get("url", ""))
+        if key not in best or len(b.get("text") or "") > len(
+            best[key].get("text") or ""
+        ):
+            best[key] = b
+    return list(best.values())
+
+
+def legacy_cited_bodies(response, cited_urls):
+    link_map = {
+        legacy_source_key(link["link"]): {
+            "url": link["link"],
+            "title": link.get("title", ""),
+            "text": link["body"],
+        }
+        for link in response.validator_links
+    }
+    bodies = []
+    for u in cited_urls:
+        hit = link_map.get(legacy_source_key(u))
+        if not hit and _TWEET_ID.search(u):
+            continue
+        if hit:
+            bodies.append({**hit, "url": u})
+    return legacy_dedup_richest(bodies)
+
+
+def legacy_align(summary, bodies):
+    index_by_key = {
+        legacy_source_key(b.get("url", "")): i for i, b in enumerate(bodies, 1)
+    }
+
+    def renumber(match):
+        i = index_by_key.get(legacy_source_key(match.group(1)))
+        return f"[{i}]({match.group(1)})" if i else match.group(0)
+
+    return _CITATION_MARKER.sub(renumber, summary)
+
+
+def legacy_pass(responses) -> list:
+    out = []
+    for response in responses:
+        summary = response.texts.get(SUMMARY, "")
+        links = [url for _, url in extract_markdown_links(summary)]
+        sources = legacy_sources(response)
+        structure_ok = not any(legacy_normalize(link) not in sources for link in links)
+
+        duplicate = first_duplicate_id(
+            response.search_results, key="link", normalize=legacy_source_key
+        )
+
+        summary = response.texts.get(SUMMARY, "")
+        cited_norm = legacy_cited(summary)
+        flat, _ = response.get_links_from_search_results()
+        picks = legacy_sample(flat, cited_norm, MAX_CITED_SAMPLE, MAX_SAMPLED_LINKS)
+        uncited = [link for link in picks if legacy_normalize(link) not in cited_norm]
+
+        summary = response.texts.get(SUMMARY, "")
+        cited_norm = legacy_cited(summary)
+        tweet_urls = [tweet["url"] for tweet in response.miner_tweets]
+        tweet_picks = legacy_sample(
+            tweet_urls, cited_norm, MAX_CITED_SAMPLE, MAX_SAMPLED_TWEETS
+        )
+
+        meta = {
+            legacy_normalize(result.link): result.title
+            for result in response.search_results
+        }
+        titles = [meta.get(legacy_normalize(url)) for url in picks]
+
+        summary = response.texts.get(SUMMARY, "")
+        cited = list(dict.fromkeys(url for _, url in extract_markdown_links(summary)))
+        bodies = legacy_cited_bodies(response, cited)
+        grounded = legacy_align(summary, bodies)
+
+        out.append(
+            (structure_ok, duplicate, picks, uncited, tweet_picks, titles, grounded)
+        )
+    return out
+
+
+def current_pass(responses) -> list:
+    out = []
+    for response in responses:
+        links = response_links(response)
+        structure_ok = links.cited <= links.sources
+
+        duplicate = first_duplicate_id(
+            response.search_results, key="link", normalize=source_key
+        )
+
+        cited_norm = response_links(response).cited
+        flat, _ = response.get_links_from_search_results()
+        picks = sample_cited_and_uncited(
+            flat, cited_norm, MAX_CITED_SAMPLE, MAX_SAMPLED_LINKS
+        )
+        uncited = [
+            link for link in picks if normalize_source_url(link) not in cited_norm
+        ]
+
+        tweet_picks = TwitterContentRelevanceModel._sample_cited_and_other_tweets(
+            response
+        )
+
+        meta = {
+            normalize_source_url(result.link): result.title
+            for result in response.search_results
+        }
+        titles = [meta.get(normalize_source_url(url)) for url in picks]
+
+        summary = response.texts.get(SUMMARY, "")
+        cited = list(dict.fromkeys(response_links(response).summary))
+        bodies = collect_cited_bodies(response, cited)
+        grounded = align_citation_markers(summary, bodies)
+
+        out.append(
+            (structure_ok, duplicate, picks, uncited, tweet_picks, titles, grounded)
+        )
+    return out
+
+
+def timed(fn, batches: list, seed: int, before=None) -> tuple[float, list]:
+    best, result = float("inf"), None
+    for responses in batches:
+        if before is not None:
+            before()
+        random.seed(seed)
+        started = time.perf_counter()
+        result = fn(responses)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def clear_url_caches() -> None:
+    normalize_source_url.cache_clear()
+    source_key.cache_clear()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--responses", type=int, default=500)
+    parser.add_argument("--results", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Fresh responses per run, so no run reuses links kept by an earlier one.
+    legacy_batches = [
+        build_responses(args.responses, args.results, args.seed)
+        for _ in range(args.repeat)
+    ]
+    current_batches = [
+        build_responses(args.responses, args.results, args.seed)
+        for _ in range(args.repeat)
+    ]
+
+    legacy_seconds, legacy_result = timed(legacy_pass, legacy_batches, args.seed)
+    current_seconds, current_result = timed(
+        current_pass, current_batches, args.seed, before=clear_url_caches
+    )
+
+    info = normalize_source_url.cache_info()
+    print(f"{args.responses} responses x {args.results} results")
+    print(
+        f"legacy {legacy_seconds * 1000:8.1f} ms  "
+        f"current {current_seconds * 1000:8.1f} ms  "
+        f"speedup {legacy_seconds / current_seconds:6.2f}x"
+    )
+    print(f"normalize_source_url cache: {info.hits} hits, {info.misses} misses")
+
+    if legacy_result != current_result:
+        print("MISMATCH between legacy and current results")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""Normalize tweet texts for X verification, legacy vs current.
+
+Usage:
+    python -m benchmarks.text_normalization [--copies 2000] [--repeat 5]
+
+The corpus is every text in tests_data/tweets (tweets and quoted tweets),
+each repeated ``--copies`` times with a distinct id suffix so nothing is
+served from a cache. The legacy path runs uncompiled ``re.sub`` calls and a
+per-character ``unicodedata.category`` filter; the current path is
+``desearch.text_normalization``. Both must produce identical strings.
+
+When the ``regex`` package is installed, the current URL pattern (the only
+one that backtracks) is also timed under ``regex``, with ``\\S`` spelled out
+as the characters ``str.isspace`` accepts: ``regex`` follows its own Unicode
+tables for ``\\s`` and ``\\w`` and would not match ``re`` byte for byte.
+"""
+
+import argparse
+import html
+import re
+import sys
+import time
+import unicodedata
+
+from desearch.text_normalization import clean_text, format_text_for_match
+from tests_data.tweets.tweet1 import tweet1
+from tests_data.tweets.tweet2 import tweet2
+
+URL_PATTERN = r"(?<!\S)\S+\.\S+"
+
+
+def legacy_clean_text(text):
+    text = html.unescape(text)
+    text = re.sub(r"(https?://)?\S+\.\S+\/?(\S+)?", "", text)
+    text = re.sub(r"^(@\w+\s*)+", "", text)
+    text = re.sub(r"[^\w\s,]", "", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return "".join(
+        char
+        for char in text
+        if char.isprintable() and not unicodedata.category(char).startswith("C")
+    )
+
+
+def legacy_format_text_for_match(text):
+    text = html.unescape(text)
+    text = re.sub(r"(https?://)?\S+\.\S+\/?(\S+)?", "", text)
+    text = re.sub(r"^(@\w+\s*)+", "", text)
+    text = re.sub(r"\s+", "", text)
+    return text[:280]
+
+
+def build_corpus(copies: int) -> list[str]:
+    texts = []
+    for tweet in (tweet1, tweet2):
+        texts.append(tweet["text"])
+        if tweet.get("quote"):
+            texts.append(tweet["quote"]["text"])
+    return [f"{text} #{i}" for i in range(copies) for text in texts]
+
+
+def regex_url_pattern():
+    try:
+        import regex
+    except ImportError:
+        return None
+    spaces = "".join(
+        chr(code) for code in range(sys.maxunicode + 1) if chr(code).isspace()
+    )
+    not_space = f"[^{re.escape(spaces)}]"
+    return regex.compile(rf"(?<!{not_space}){not_space}+\.{not_space}+")
+
+
+def timed(fn, repeat: int, corpus: list[str]) -> tuple[float, list]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = [fn(text) for text in corpus]
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--copies", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.copies)
+    rows = []
+    mismatch = False
+    for name, legacy, current in (
+        ("clean_text", legacy_clean_text, clean_text),
+        ("format_text_for_match", legacy_format_text_for_match, format_text_for_match),
+    ):
+        legacy_seconds, legacy_result = timed(legacy, args.repeat, corpus)
+        current_seconds, current_result = timed(current, args.repeat, corpus)
+        mismatch |= legacy_result != current_result
+        rows.append((name, legacy_seconds, current_seconds))
+
+    compiled_url = re.compile(URL_PATTERN)
+    regex_url = regex_url_pattern()
+    if regex_url is not None:
+        re_seconds, re_result = timed(
+            lambda text: compiled_url.sub("", text), args.repeat, corpus
+        )
+        regex_seconds, regex_result = timed(
+            lambda text: regex_url.sub("", text), args.repeat, corpus
+        )
+        mismatch |= re_result != regex_result
+        rows.append(("url pattern, re vs regex", re_seconds, regex_seconds))
+
+    print(f"{len(corpus)} texts")
+    for name, legacy_seconds, current_seconds in rows:
+        print(
+            f"{name:26s} {legacy_seconds * 1000:8.1f} ms -> "
+            f"{current_seconds * 1000:8.1f} ms  "
+            f"speedup {legacy_seconds / current_seconds:6.2f}x"
+        )
+
+    if mismatch:
+        print("MISMATCH between implementations")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
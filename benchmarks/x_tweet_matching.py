@@ -0,0 +1,179 @@
+"""Match validator tweets and score an X search epoch, legacy vs current.
+
+Usage:
+    python -m benchmarks.x_tweet_matching [--responses 1000] [--results 20] [--repeat 3]
+
+Each response is a TwitterSearchSynapse with ``--results`` distinct miner
+tweets built from tests_data fixtures and a query carrying operators; one
+link per response is sampled, as ``APIFY_LINK_SCRAPE_AMOUNT`` does. The
+legacy path scans the whole fetched list against a per-response id list and
+dumps the full synapse for every validator tweet before re-parsing the
+query with ``str.split`` chains; the current path looks ids up in one index
+per batch and takes the memoized ``x_search_constraints``. Both must attach
+the same validator tweets and produce the same filters.
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from desearch.protocol import TwitterScraperTweet, TwitterSearchSynapse
+from desearch.services.twitter_utils import TwitterUtils
+from desearch.utils import tweets_for_links
+from neurons.validators.reward.twitter_basic_search_content_relevance import (
+    TwitterBasicSearchContentRelevanceModel,
+)
+from neurons.validators.utils.x_query_operators import x_search_constraints
+from tests_data.tweets.tweet1 import tweet1
+
+QUERY = "bitcoin from:brett_crypto_x min_faves:5 lang:en since:2024-01-01"
+
+
+def build_epoch(count: int, results: int):
+    rng = random.Random(0)
+    responses = []
+    sampled = []
+    fetched = {}
+    for i in range(count):
+        tweets = []
+        for j in range(results):
+            tweet_id = str(10**12 + i * results + j)
+            tweets.append(
+                {
+                    **tweet1,
+                    "id": tweet_id,
+                    "url": f"https://x.com/Brett_Crypto_X/status/{tweet_id}",
+                }
+            )
+        responses.append(TwitterSearchSynapse(query=QUERY, results=tweets))
+        link = rng.choice(tweets)["url"]
+        sampled.append([link])
+        fetched.setdefault(link, TwitterScraperTweet(**tweets[0]))
+    fetched_tweets = [
+        tweet.model_copy(update={"id": TwitterUtils.extract_tweet_id(link)})
+        for link, tweet in fetched.items()
+    ]
+    return responses, sampled, fetched_tweets
+
+
+def legacy_match(sampled, tweets_list) -> list[list[str]]:
+    matched = []
+    for links in sampled:
+        ids = [TwitterUtils.extract_tweet_id(link) for link in links]
+        matched.append([tweet.id for tweet in tweets_list if tweet.id in ids])
+    return matched
+
+
+def current_match(sampled, tweets_list) -> list[list[str]]:
+    tweets_by_id = {tweet.id: tweet for tweet in tweets_list}
+    return [
+        [tweet.id for tweet in tweets_for_links(links, tweets_by_id)]
+        for links in sampled
+    ]
+
+
+LEGACY_VALUE_OPERATORS = {
+    "from:": ("user", str),
+    "min_faves:": ("min_likes", int),
+    "min_retweets:": ("min_retweets", int),
+    "min_replies:": ("min_replies", int),
+    "since:": ("start_date", str),
+    "until:": ("end_date", str),
+    "lang:": ("lang", str),
+}
+LEGACY_FLAG_OPERATORS = {
+    "filter:verified": "verified",
+    "filter:blue_verified": "blue_verified",
+    "filter:quote": "is_quote",
+    "filter:images": "is_image",
+    "filter:videos": "is_video",
+}
+FILTER_FIELDS = [name for name, _ in LEGACY_VALUE_OPERATORS.values()] + list(
+    LEGACY_FLAG_OPERATORS.values()
+)
+
+
+def legacy_filters(responses, tweets_per_response: int) -> list[dict]:
+    filters = []
+    for response in responses:
+        for _ in range(tweets_per_response):
+            synapse = response.model_dump()
+            query = response.query.strip().lower()
+            for operator, (name, cast) in LEGACY_VALUE_OPERATORS.items():
+                if operator in query:
+                    try:
+                        synapse[name] = cast(
+                            query.split(operator)[1].split(" ")[0].strip()
+                        )
+                    except ValueError:
+                        pass
+            for operator, name in LEGACY_FLAG_OPERATORS.items():
+                if operator in query:
+                    synapse[name] = True
+        filters.append({name: synapse[name] for name in FILTER_FIELDS})
+    return filters
+
+
+def current_filters(responses, tweets_per_response: int) -> list[dict]:
+    filters = []
+    for response in responses:
+        constraints = x_search_constraints(response)
+        filters.append({name: getattr(constraints, name) for name in FILTER_FIELDS})
+    return filters
+
+
+def timed(fn, repeat: int, *args) -> tuple[float, list]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--responses", type=int, default=1000)
+    parser.add_argument("--results", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    model = TwitterBasicSearchContentRelevanceModel(None, neuron=None)
+    responses, sampled, tweets_list = build_epoch(args.responses, args.results)
+
+    rows = []
+    mismatch = False
+    for name, legacy, current, fn_args in (
+        ("match", legacy_match, current_match, (sampled, tweets_list)),
+        ("filters", legacy_filters, current_filters, (responses, 1)),
+    ):
+        legacy_seconds, legacy_result = timed(legacy, args.repeat, *fn_args)
+        current_seconds, current_result = timed(current, args.repeat, *fn_args)
+        mismatch |= legacy_result != current_result
+        rows.append((name, legacy_seconds, current_seconds))
+
+    matched = current_match(sampled, tweets_list)
+    tweets_by_id = {tweet.id: tweet for tweet in tweets_list}
+    for response, ids in zip(responses, matched):
+        response.validator_tweets = [tweets_by_id[tweet_id] for tweet_id in ids]
+    check_seconds, _ = timed(
+        lambda: [model.check_tweet_content(r) for r in responses], 1
+    )
+
+    for name, legacy_seconds, current_seconds in rows:
+        print(
+            f"{name:8s} legacy {legacy_seconds * 1000:8.1f} ms  "
+            f"current {current_seconds * 1000:8.1f} ms  "
+            f"speedup {legacy_seconds / current_seconds:6.1f}x"
+        )
+    print(f"check_tweet_content (current, whole epoch) {check_seconds * 1000:8.1f} ms")
+
+    if mismatch:
+        print("MISMATCH between legacy and current results")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 import asyncio
 import json
+import re
 import time
 import traceback
 from enum import Enum
@@ -321,7 +322,22 @@ class ChatHistoryItem(BaseModel):
     completion: str = ""
 
 
+# Stream event type -> ScraperStreamingSynapse field holding its results.
+SEARCH_RESULT_FIELDS = {
+    "search": "search_results",
+    "wikipedia_search": "wikipedia_search_results",
+    "youtube_search": "youtube_search_results",
+    "arxiv_search": "arxiv_search_results",
+    "reddit_search": "reddit_search_results",
+    "hacker_news_search": "hacker_news_search_results",
+}
+
+
 class ScraperStreamingSynapse(StreamingSynapse):
+    _yield_decoded: bool = pydantic.PrivateAttr(default=False)
+    # Memoized by ``response_checks.response_links`` during scoring.
+    _response_links: Optional[Any] = pydantic.PrivateAttr(default=None)
+
     scoring_model: ScoringModel = pydantic.Field(
         ScoringModel.OPENAI_GPT4_1_NANO,
         title="scoring model",
@@ -605,108 +621,71 @@ class ScraperStreamingSynapse(StreamingSynapse):
 
         return all_unique_links, links_per_tool_group
 
+    def stream_decoded(self) -> "ScraperStreamingSynapse":
+        """Have ``process_streaming_response`` yield event dicts instead of
+        JSON strings, for callers that only consume the final synapse."""
+        self._yield_decoded = True
+        return self
+
+    def apply_stream_event(self, json_data: dict) -> Optional[dict]:
+        """Fold one miner event into the synapse and return the event to
+        forward to the caller, or ``None`` for unknown types."""
+        content_type = json_data.get("type")
+
+        if content_type == "text":
+            text_content = json_data.get("content", "")
+            role = json_data.get("role")
+
+            if role not in self.text_chunks:
+                self.text_chunks[role] = []
+
+            self.text_chunks[role].append(text_content)
+
+            return {"type": "text", "role": role, "content": text_content}
+
+        elif content_type == "completion":
+            completion = json_data.get("content", "")
+            self.completion = completion
+
+            return {"type": "completion", "content": completion}
+
+        elif content_type == "tweets":
+            tweets = json_data.get("content", "[]")
+            self.miner_tweets.extend(tweets)
+            return {"type": "tweets", "content": tweets}
+
+        elif content_type in SEARCH_RESULT_FIELDS:
+            search_json = json_data.get("content", "{}")
+            setattr(self, SEARCH_RESULT_FIELDS[content_type], search_json)
+            return {"type": content_type, "content": search_json}
+
+        elif content_type == "flow":
+            content = json_data.get("content", {})
+            self.flow_items.append(FlowItem(**content, time=int(time.time())))
+            return {"type": "flow", "content": content}
+
+        return None
+
     async def process_streaming_response(self, response: StreamingResponse):
         if self.completion is None:
             self.completion = ""
 
-        buffer = ""  # Initialize an empty buffer to accumulate data across chunks
+        parser = JSONStreamParser(
+            label=f"Host: {response.real_url.host}:{response.real_url.port}; hotkey: {self.axon.hotkey}"
+        )
 
         try:
             async for chunk in response.content.iter_any():
-                chunk_str = chunk.decode("utf-8", errors="ignore")
-
-                # Attempt to parse the chunk as JSON, updating the buffer with remaining incomplete JSON data
-                json_objects, buffer = extract_json_chunk(
-                    chunk_str, response, self.axon.hotkey, buffer
-                )
-                for json_data in json_objects:
-                    content_type = json_data.get("type")
-
-                    if content_type == "text":
-                        text_content = json_data.get("content", "")
-                        role = json_data.get("role")
-
-                        if role not in self.text_chunks:
-                            self.text_chunks[role] = []
-
-                        self.text_chunks[role].append(text_content)
-
-                        yield json.dumps(
-                            {"type": "text", "role": role, "content": text_content}
-                        )
-
-                    elif content_type == "completion":
-                        completion = json_data.get("content", "")
-                        self.completion = completion
-
-                        yield json.dumps({"type": "completion", "content": completion})
-
-                    elif content_type == "tweets":
-                        tweets = json_data.get("content", "[]")
-                        self.miner_tweets.extend(tweets)
-                        yield json.dumps({"type": "tweets", "content": tweets})
-
-                    elif content_type == "search":
-                        search_json = json_data.get("content", "{}")
-                        self.search_results = search_json
-                        yield json.dumps({"type": "search", "content": search_json})
-
-                    elif content_type == "wikipedia_search":
-                        search_json = json_data.get("content", "{}")
-                        self.wikipedia_search_results = search_json
-                        yield json.dumps(
-                            {"type": "wikipedia_search", "content": search_json}
-                        )
-
-                    elif content_type == "youtube_search":
-                        search_json = json_data.get("content", "{}")
-                        self.youtube_search_results = search_json
-                        yield json.dumps(
-                            {"type": "youtube_search", "content": search_json}
-                        )
-
-                    elif content_type == "arxiv_search":
-                        search_json = json_data.get("content", "{}")
-                        self.arxiv_search_results = search_json
-                        yield json.dumps(
-                            {"type": "arxiv_search", "content": search_json}
-                        )
-
-                    elif content_type == "reddit_search":
-                        search_json = json_data.get("content", "{}")
-                        self.reddit_search_results = search_json
-                        yield json.dumps(
-                            {"type": "reddit_search", "content": search_json}
-                        )
-
-                    elif content_type == "hacker_news_search":
-                        search_json = json_data.get("content", "{}")
-                        self.hacker_news_search_results = search_json
-                        yield json.dumps(
-                            {"type": "hacker_news_search", "content": search_json}
-                        )
-
-                    elif content_type == "flow":
-                        yield json.dumps(
-                            {
-                                "type": "flow",
-                                "content": json_data.get("content", {}),
-                            }
-                        )
-                        self.flow_items.append(
-                            FlowItem(
-                                **json_data.get("content", {}),
-                                time=int(time.time()),
-                            )
-                        )
+                for json_data in parser.feed(chunk):
+                    if not isinstance(json_data, dict):
+                        continue
+
+                    event = self.apply_stream_event(json_data)
+                    if event is None:
+                        continue
+
+                    yield event if self._yield_decoded else json.dumps(event)
 
-        except json.JSONDecodeError as e:
-            port = response.real_url.port
-            host = response.real_url.host
-            hotkey = self.axon.hotkey
-            bt.logging.debug(
-                f"process_streaming_response: Host: {host}:{port}, hotkey: {hotkey}, ERROR: json.JSONDecodeError: {e}, "
-            )
         except (TimeoutError, asyncio.exceptions.TimeoutError) as e:
             port = response.real_url.port
             host = response.real_url.host
@@ -720,7 +699,7 @@ class ScraperStreamingSynapse(StreamingSynapse):
             hotkey = self.axon.hotkey
             error_details = traceback.format_exc()
             bt.logging.debug(
-                f"process_streaming_response: Host: {host}:{port}, hotkey: {hotkey}, ERROR: {e}, DETAILS: {error_details}, chunk: {chunk}"
+                f"process_streaming_response: Host: {host}:{port}, hotkey: {hotkey}, ERROR: {e}, DETAILS: {error_details}"
             )
 
     def deserialize(self) -> str:
@@ -786,40 +765,95 @@ class ScraperStreamingSynapse(StreamingSynapse):
         arbitrary_types_allowed = True
 
 
-def extract_json_chunk(chunk, response, hotkey, buffer=""):
-    """
-    Extracts JSON objects from a chunk of data, handling cases where JSON objects are split across multiple chunks.
+_JSON_STRUCTURAL = re.compile(rb'[{}\[\]"]')
+_JSON_STRING_SPECIAL = re.compile(rb'["\\]')
+_QUOTE = ord('"')
+_OPENERS = (ord("{"), ord("["))
 
-    :param chunk: The current chunk of data to process.
-    :param response: The response object, used for logging.
-    :param buffer: A buffer holding incomplete JSON data from previous chunks.
-    :return: A tuple containing a list of extracted JSON objects and the updated buffer.
+
+class JSONStreamParser:
+    """
+    Incremental parser for a byte stream of concatenated JSON objects.
+
+    Bytes are appended to one buffer and scanned once from a saved offset,
+    tracking nesting depth and string state, so a value is decoded exactly
+    once, when its closing bracket arrives, by a single reused decoder.
+    Unlike the former ``extract_json_chunk``, which re-decoded the whole
+    buffer from its start on every chunk, this stays linear in the stream size
+    however large a single event is, and never splits a UTF-8 sequence
+    that straddles two chunks.
     """
-    buffer += chunk  # Add the current chunk to the buffer
-    json_objects = []
 
-    while True:
-        try:
-            json_obj, end = json.JSONDecoder(strict=False).raw_decode(buffer)
-            json_objects.append(json_obj)
-            buffer = buffer[end:]
-        except json.JSONDecodeError as e:
-            if e.pos == len(buffer):
-                # Reached the end of the buffer without finding a complete JSON object
-                break
-            elif e.msg.startswith("Unterminated string"):
-                # Incomplete JSON object at the end of the chunk
-                break
-            else:
-                # Invalid JSON data encountered
-                port = response.real_url.port
-                host = response.real_url.host
-                bt.logging.debug(
-                    f"Host: {host}:{port}; hotkey: {hotkey}; Failed to decode JSON object: {e} from {buffer}"
-                )
+    def __init__(self, label: str = "") -> None:
+        self.label = label
+        self._buffer = bytearray()
+        self._decoder = json.JSONDecoder(strict=False)
+        self._start = 0  # first byte of the value being scanned
+        self._pos = 0  # next byte to scan
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, data: bytes) -> list:
+        """Add ``data`` and return every value completed by it."""
+        buffer = self._buffer
+        buffer += data
+        values = []
+        pos, end = self._pos, len(buffer)
+
+        while pos < end:
+            if self._in_string:
+                match = _JSON_STRING_SPECIAL.search(buffer, pos)
+                if match is None:
+                    pos = end
+                elif buffer[match.start()] == _QUOTE:
+                    self._in_string = False
+                    pos = match.end()
+                elif match.end() < end:
+                    pos = match.end() + 1  # skip the escaped byte
+                else:
+                    pos = match.start()  # escape split across chunks
+                    break
+                continue
+
+            match = _JSON_STRUCTURAL.search(buffer, pos)
+            if match is None:
+                pos = end
                 break
 
-    return json_objects, buffer
+            char = buffer[match.start()]
+            pos = match.end()
+            if char == _QUOTE:
+                self._in_string = True
+            elif char in _OPENERS:
+                if self._depth == 0:
+                    self._start = match.start()
+                self._depth += 1
+            elif self._depth:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._decode(buffer, pos, values)
+                    self._start = pos
+
+        self._pos = pos
+        if self._depth == 0 and not self._in_string:
+            # Nothing pending: whatever sits between values is dropped.
+            self._start = pos
+
+        # Compact only once the consumed prefix dominates, so a large value
+        # arriving in many chunks is not copied once per chunk.
+        if self._start and self._start * 2 >= len(buffer):
+            del buffer[: self._start]
+            self._pos -= self._start
+            self._start = 0
+
+        return values
+
+    def _decode(self, buffer: bytearray, end: int, values: list) -> None:
+        text = buffer[self._start : end].decode("utf-8", errors="ignore")
+        try:
+            values.append(self._decoder.raw_decode(text)[0])
+        except json.JSONDecodeError as e:
+            bt.logging.debug(f"{self.label}; Failed to decode JSON object: {e}")
 
 
 class WebSearchResult(BaseModel):
@@ -0,0 +1,41 @@
+"""
+Base URLs of the paid providers miners and validators call.
+
+Provider clients build their request URLs here instead of hard-coding hosts,
+so a deployment can point them at a proxy and a load test at the local
+emulator (``benchmarks/provider_emulator.py``) through environment variables.
+The URLs are read on every call, so changing the environment takes effect
+without re-importing any client.
+"""
+
+import os
+
+APIFY = "apify"
+SCRAPINGDOG = "scrapingdog"
+OPENAI = "openai"
+CHUTES = "chutes"
+
+DEFAULT_BASE_URLS = {
+    APIFY: "https://api.apify.com",
+    SCRAPINGDOG: "https://api.scrapingdog.com",
+    OPENAI: "https://api.openai.com/v1",
+    CHUTES: "https://llm.chutes.ai/v1",
+}
+
+BASE_URL_ENV_VARS = {
+    APIFY: "APIFY_BASE_URL",
+    SCRAPINGDOG: "SCRAPINGDOG_BASE_URL",
+    # Also read by the OpenAI SDK itself, so clients built without
+    # ``base_url`` follow it too.
+    OPENAI: "OPENAI_BASE_URL",
+    CHUTES: "CHUTES_BASE_URL",
+}
+
+
+def base_url(provider: str) -> str:
+    value = os.environ.get(BASE_URL_ENV_VARS[provider]) or DEFAULT_BASE_URLS[provider]
+    return value.rstrip("/")
+
+
+def provider_url(provider: str, path: str) -> str:
+    return f"{base_url(provider)}/{path.lstrip('/')}"
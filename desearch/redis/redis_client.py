@@ -11,6 +11,9 @@ redis_client = redis.Redis(
     host=REDIS_HOST, port=REDIS_PORT, db=0, decode_responses=True
 )
 
+# Same database without response decoding, for binary values such as gzip.
+redis_bytes_client = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, db=0)
+
 
 async def initialize_redis():
     """Initialize Redis and check version"""
@@ -26,3 +29,4 @@ async def initialize_redis():
 async def close_redis():
     """Close Redis connection"""
     await redis_client.close()
+    await redis_bytes_client.close()
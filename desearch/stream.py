@@ -1,9 +1,26 @@
 import asyncio
+import json
 import random
 import time
 import bittensor as bt
 from desearch.protocol import ScraperStreamingSynapse
 
+SSE_PREFIX = b"data: "
+SSE_TERMINATOR = b"\n\n"
+
+
+def encode_sse_event(value) -> bytes:
+    """Frame one stream event as SSE bytes. Decoded events are serialized
+    once; ``json.dumps`` escapes newlines, so they need no line splitting."""
+    if isinstance(value, (dict, list)):
+        return SSE_PREFIX + json.dumps(value).encode("utf-8") + SSE_TERMINATOR
+
+    text = str(value)
+    if "\n" in text:
+        text = "\n".join(f"data: {line if line else ' '}" for line in text.split("\n"))
+        return text.encode("utf-8") + SSE_TERMINATOR
+    return SSE_PREFIX + text.encode("utf-8") + SSE_TERMINATOR
+
 
 async def collect_response(response: ScraperStreamingSynapse, uid, start_time):
     async for chunk in response:
@@ -0,0 +1,67 @@
+"""
+Tweet text normalization used by X verification and duplicate detection.
+
+``clean_text`` reduces a tweet to words for relevance prompts and
+``format_text_for_match`` to a whitespace-free prefix for comparing miner and
+validator copies of the same tweet. Both run for every tweet of every scored
+response, so patterns are compiled once and the steps that ``str`` methods
+cover exactly are done without regular expressions:
+
+- ``str.split`` splits on the same characters as ``\\s`` (``str.isspace``).
+- A character is printable only if it is not in a ``C*`` or ``Z*`` category
+  other than the space, so the printable check alone decides what the final
+  filter of ``clean_text`` drops, and ``str.isprintable`` answers it for the
+  whole string before any per-character work.
+- The URL pattern needs a ``.`` and the mention pattern a leading ``@``, so
+  texts without one skip the pattern.
+"""
+
+import html
+import re
+
+TWEET_MATCH_LENGTH = 280
+
+# Historically ``(https?://)?\S+\.\S+\/?(\S+)?``. A match of that pattern
+# always runs from the start of a whitespace-delimited token to its end, and
+# only needs a "." with a character on each side, so anchoring it at token
+# starts removes the same text without retrying every position of long
+# tokens (such as unspaced CJK text) in quadratic time.
+_URL = re.compile(r"(?<!\S)\S+\.\S+")
+_LEADING_MENTIONS = re.compile(r"^(@\w+\s*)+")
+_SYMBOLS = re.compile(r"[^\w\s,]")
+
+
+def _strip_urls_and_mentions(text: str) -> str:
+    text = html.unescape(text)
+    # Url shorteners can cause problems with tweet verification.
+    if "." in text:
+        text = _URL.sub("", text)
+    # Some scrapers put the mentions at the front of the text.
+    if text.startswith("@"):
+        text = _LEADING_MENTIONS.sub("", text)
+    return text
+
+
+def _drop_unprintable(text: str) -> str:
+    if text.isprintable():
+        return text
+    return text.translate(
+        {ord(char): None for char in set(text) if not char.isprintable()}
+    )
+
+
+def clean_text(text: str) -> str:
+    text = _strip_urls_and_mentions(text)
+    # Remove emojis and other symbols.
+    text = _SYMBOLS.sub("", text)
+    # Normalize whitespace and newlines.
+    text = " ".join(text.split())
+    return _drop_unprintable(text)
+
+
+def format_text_for_match(text: str) -> str:
+    text = _strip_urls_and_mentions(text)
+    # Some scrapers trim trailing whitespace at the end of lines, so ignore
+    # whitespace. The validator actor returns ``text`` rather than the longer
+    # note tweet, so compare only the first 280 characters.
+    return "".join(text.split())[:TWEET_MATCH_LENGTH]
@@ -1,29 +1,91 @@
 import asyncio
 import json
+from dataclasses import dataclass
+from typing import Optional
 
 import bittensor as bt
 from starlette.types import Send
 
-from desearch.protocol import ScraperTextRole
+from desearch.protocol import ScraperTextRole, SearchMode
+
+
+@dataclass(frozen=True)
+class CoalescePolicy:
+    """Buffer text events until ``max_bytes`` are pending or the oldest has
+    waited ``max_delay`` seconds. Events stay separate JSON objects, so a
+    frame is just several of them back to back and validators parse it the
+    same way as one-event frames."""
+
+    max_delay: float
+    max_bytes: int
+
+
+COALESCE_POLICIES = {
+    SearchMode.FAST: CoalescePolicy(max_delay=0.01, max_bytes=128),
+    SearchMode.BALANCED: CoalescePolicy(max_delay=0.02, max_bytes=256),
+    SearchMode.DEEP: CoalescePolicy(max_delay=0.05, max_bytes=1024),
+}
+DEFAULT_COALESCE_POLICY = COALESCE_POLICIES[SearchMode.BALANCED]
+
+
+def coalesce_policy_for(mode) -> CoalescePolicy:
+    if not mode:
+        return DEFAULT_COALESCE_POLICY
+    return COALESCE_POLICIES.get(SearchMode(mode), DEFAULT_COALESCE_POLICY)
 
 
 class ResponseStreamer:
-    def __init__(self, send: Send) -> None:
+    def __init__(
+        self,
+        send: Send,
+        mode: Optional[SearchMode] = None,
+        policy: Optional[CoalescePolicy] = None,
+    ) -> None:
         self.texts = {}
         self.role_order = []
         self.send = send
+        self.policy = policy or coalesce_policy_for(mode)
+
+        self._pending = bytearray()
+        self._send_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._first_text_sent = False
+
+    async def _send_body(self, body: bytes = b"", more_body: bool = True):
+        """Send pending text events followed by ``body`` as one frame."""
+        async with self._send_lock:
+            if self._pending:
+                body = bytes(self._pending) + body
+                self._pending.clear()
+            if not body and more_body:
+                return
+            await self.send(
+                {
+                    "type": "http.response.body",
+                    "body": body,
+                    "more_body": more_body,
+                }
+            )
+
+    async def flush(self):
+        await self._send_body()
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.policy.max_delay)
+        await self.flush()
 
     async def send_text_event(self, text: str, role: ScraperTextRole):
         text_data_json = json.dumps(
             {"type": "text", "role": role.value, "content": text}
         )
-        await self.send(
-            {
-                "type": "http.response.body",
-                "body": text_data_json.encode("utf-8"),
-                "more_body": True,
-            }
-        )
+        self._pending += text_data_json.encode("utf-8")
+
+        # The first token goes out at once so coalescing never delays it.
+        if not self._first_text_sent or len(self._pending) >= self.policy.max_bytes:
+            self._first_text_sent = True
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
 
     async def stream_response(self, response, role: ScraperTextRole, wait_time=None):
         if role not in self.role_order:
@@ -43,19 +105,15 @@ class ResponseStreamer:
 
             bt.logging.trace(f"Streamed tokens: {token}")
 
+        await self.flush()
+
     async def send_event(self, event_type: str, content, more_body: bool = True):
         body = {
             "type": event_type,
             "content": content,
         }
 
-        await self.send(
-            {
-                "type": "http.response.body",
-                "body": json.dumps(body).encode("utf-8"),
-                "more_body": more_body,
-            }
-        )
+        await self._send_body(json.dumps(body).encode("utf-8"), more_body)
 
         bt.logging.trace(f"Sent event: {body}")
 
@@ -65,12 +123,8 @@ class ResponseStreamer:
             "content": self.get_full_text(),
         }
 
-        await self.send(
-            {
-                "type": "http.response.body",
-                "body": json.dumps(completion_response_body).encode("utf-8"),
-                "more_body": False,
-            }
+        await self._send_body(
+            json.dumps(completion_response_body).encode("utf-8"), more_body=False
         )
 
     def get_full_text(self):
@@ -4,6 +4,8 @@ from typing import List, Optional
 import aiohttp
 import bittensor as bt
 
+from desearch.provider_endpoints import SCRAPINGDOG, provider_url
+
 
 def _clean_domains(raw: Optional[List[str]]) -> List[str]:
     seen = []
@@ -20,7 +22,9 @@ def _clean_domains(raw: Optional[List[str]]) -> List[str]:
 
 
 class ScrapingDogGoogleSearch:
-    api_url = "https://api.scrapingdog.com/google"
+    @property
+    def api_url(self) -> str:
+        return provider_url(SCRAPINGDOG, "google")
 
     def __init__(
         self,
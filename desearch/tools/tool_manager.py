@@ -29,7 +29,7 @@ class ToolManager:
         self.start_time = start_time
         self.max_execution_time = synapse.max_execution_time
 
-        self.response_streamer = ResponseStreamer(send=send)
+        self.response_streamer = ResponseStreamer(send=send, mode=synapse.mode)
         self.send = send
 
         self.all_tools = get_all_tools()
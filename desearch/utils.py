@@ -1,10 +1,7 @@
 import asyncio
-import html
 import math
 import os
-import re
 import time
-import unicodedata
 from typing import List
 
 import aiohttp
@@ -20,8 +17,11 @@ from desearch.protocol import (
     TwitterScraperTweet,
     WebSearchResult,
 )
+from desearch.provider_endpoints import CHUTES, OPENAI, base_url, provider_url
 from desearch.redis.utils import save_moving_averaged_scores
 from desearch.services.twitter_utils import TwitterUtils
+from desearch.text_normalization import clean_text, format_text_for_match
+from neurons.validators.apify.tweet_cache import tweet_cache
 from neurons.validators.apify.twitter_scraper_actor import TwitterScraperActor
 
 
@@ -34,15 +34,20 @@ class LazyAsyncOpenAIClient:
         self._client_kwargs = client_kwargs
         self._client = None
         self._api_key = None
+        self._base_url = None
 
     def _get_client(self):
         api_key = get_openai_api_key()
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY is not set.")
 
-        if self._client is None or self._api_key != api_key:
-            self._client = AsyncOpenAI(api_key=api_key, **self._client_kwargs)
+        url = base_url(OPENAI)
+        if self._client is None or (self._api_key, self._base_url) != (api_key, url):
+            self._client = AsyncOpenAI(
+                api_key=api_key, base_url=url, **self._client_kwargs
+            )
             self._api_key = api_key
+            self._base_url = url
 
         return self._client
 
@@ -99,7 +104,7 @@ async def call_chutes(messages, temperature, model, seed=1234, response_format=N
         return None
 
     model_name = getattr(model, "value", model)
-    url = "https://llm.chutes.ai/v1/chat/completions"
+    url = provider_url(CHUTES, "chat/completions")
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
@@ -251,52 +256,26 @@ async def resync_metagraph(self):
     self.hotkeys = list(self.metagraph.hotkeys)
 
 
-def clean_text(text):
-    # Unescape HTML entities
-    text = html.unescape(text)
-
-    # Remove URLs
-    text = re.sub(r"(https?://)?\S+\.\S+\/?(\S+)?", "", text)
-
-    # Remove mentions at the beginning of the text
-    text = re.sub(r"^(@\w+\s*)+", "", text)
-
-    # Remove emojis and other symbols
-    text = re.sub(r"[^\w\s,]", "", text)
-
-    # Normalize whitespace and newlines
-    text = re.sub(r"\s+", " ", text).strip()
-
-    # Remove non-printable characters and other special Unicode characters
-    text = "".join(
-        char
-        for char in text
-        if char.isprintable() and not unicodedata.category(char).startswith("C")
-    )
-
-    return text
-
-
-def format_text_for_match(text):
-    # Unescape HTML entities first
-    text = html.unescape(text)
-    # url shorteners can cause problems with tweet verification, so remove urls from the text comparison.
-    text = re.sub(r"(https?://)?\S+\.\S+\/?(\S+)?", "", text)
-    # Some scrapers put the mentions at the front of the text, remove them.
-    text = re.sub(r"^(@\w+\s*)+", "", text)
-    # And some trim trailing whitespace at the end of newlines, so ignore whitespace.
-    text = re.sub(r"\s+", "", text)
-    # The validator apify actor uses the tweet.text field and not the note_tweet field (> 280) charts, so only
-    # use the first 280 chars for comparison.
-    text = text[:280]
-    return text
-
-
 async def scrape_tweets_with_retries(
     urls: List[str], group_size: int, max_attempts: int
 ):
-    fetched_tweets = []
-    non_fetched_links = urls.copy()
+    cached = await tweet_cache.get_many(
+        tweet_id for tweet_id in map(TwitterUtils.extract_tweet_id, urls) if tweet_id
+    )
+    fetched_tweets = list(cached.values())
+    non_fetched_links = [
+        url for url in urls if TwitterUtils.extract_tweet_id(url) not in cached
+    ]
+    tweet_cache.record_runs(
+        runs=0,
+        avoided=math.ceil(len(urls) / group_size)
+        - math.ceil(len(non_fetched_links) / group_size),
+    )
+    if cached:
+        bt.logging.info(
+            f"Tweet cache served {len(cached)}/{len(urls)} links, "
+            f"fetching {len(non_fetched_links)}."
+        )
     attempt = 1
 
     while attempt <= max_attempts and non_fetched_links:
@@ -313,6 +292,7 @@ async def scrape_tweets_with_retries(
             asyncio.create_task(TwitterScraperActor().get_tweets(urls=group))
             for group in url_groups
         ]
+        tweet_cache.record_runs(runs=len(tasks), avoided=0)
 
         # Wait for tasks to complete
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -325,6 +305,7 @@ async def scrape_tweets_with_retries(
                 )
                 continue
             fetched_tweets.extend(result)
+            await tweet_cache.put_many(result)
 
         # Update non_fetched_links
         fetched_tweet_ids = {tweet.id for tweet in fetched_tweets}
@@ -345,6 +326,17 @@ async def scrape_tweets_with_retries(
     return fetched_tweets, non_fetched_links
 
 
+def tweets_for_links(
+    links: List[str], tweets_by_id: dict[str, TwitterScraperTweet]
+) -> List[TwitterScraperTweet]:
+    """Fetched tweets for ``links``, looked up in an id index built once per
+    batch; each tweet is returned once."""
+    tweet_ids = dict.fromkeys(map(TwitterUtils.extract_tweet_id, links))
+    return [
+        tweets_by_id[tweet_id] for tweet_id in tweet_ids if tweet_id in tweets_by_id
+    ]
+
+
 def is_valid_tweet(tweet):
     try:
         _ = TwitterScraperTweet(**tweet)
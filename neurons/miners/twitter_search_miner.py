@@ -5,6 +5,7 @@ from desearch.protocol import (
     TwitterURLsSearchSynapse,
 )
 from neurons.validators.apify.twitter_scraper_actor import TwitterScraperActor
+from neurons.validators.utils.x_query_operators import x_search_constraints
 
 
 class TwitterSearchMiner:
@@ -15,20 +16,22 @@ class TwitterSearchMiner:
     async def search(self, synapse: TwitterSearchSynapse):
         # Extract the query parameters from the synapse
         query = synapse.query
+        # Same constraints validators score against, query operators included.
+        constraints = x_search_constraints(synapse)
         search_params = {
-            "sort": synapse.sort,
-            "start": synapse.start_date,
-            "end": synapse.end_date,
-            "tweetLanguage": synapse.lang,
-            "onlyVerifiedUsers": synapse.verified,
-            "onlyTwitterBlue": synapse.blue_verified,
-            "onlyQuote": synapse.is_quote,
-            "onlyVideo": synapse.is_video,
-            "onlyImage": synapse.is_image,
-            "minimumRetweets": synapse.min_retweets,
-            "minimumReplies": synapse.min_replies,
-            "minimumFavorites": synapse.min_likes,
-            "author": synapse.user,
+            "sort": constraints.sort,
+            "start": constraints.start_date,
+            "end": constraints.end_date,
+            "tweetLanguage": constraints.lang,
+            "onlyVerifiedUsers": constraints.verified,
+            "onlyTwitterBlue": constraints.blue_verified,
+            "onlyQuote": constraints.is_quote,
+            "onlyVideo": constraints.is_video,
+            "onlyImage": constraints.is_image,
+            "minimumRetweets": constraints.min_retweets,
+            "minimumReplies": constraints.min_replies,
+            "minimumFavorites": constraints.min_likes,
+            "author": constraints.user,
             "maxItems": synapse.count,
         }
 
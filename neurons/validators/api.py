@@ -1,21 +1,22 @@
 import asyncio
+import gzip
 import json
 import traceback
-from contextlib import asynccontextmanager
+from contextlib import aclosing, asynccontextmanager
 from typing import List, Optional, Union
 
 import aiohttp
 import bittensor as bt
 import uvicorn
-from fastapi import Depends, FastAPI, HTTPException, Path
+from fastapi import Depends, FastAPI, HTTPException, Path, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field, conint
 
 from desearch import __version__
 from desearch.dataset.date_filters import DateFilterType
-from desearch.miner_config import LANES, SearchType, lane_key
+from desearch.miner_config import LANES, lane_key
 from desearch.protocol import (
     ChatHistoryItem,
     ResultType,
@@ -23,10 +24,11 @@ from desearch.protocol import (
     SearchMode,
     TwitterScraperTweet,
 )
+from desearch.stream import encode_sse_event
 from neurons.validators.clients.validator_service_client import ValidatorServiceClient
 from neurons.validators.dependencies import verify_access_key
 from neurons.validators.env import MINER_DB_PATH, PORT
-from neurons.validators.scoring import miner_db
+from neurons.validators.scoring import miner_db, public_snapshot
 from neurons.validators.validator_api import ValidatorAPI
 
 
@@ -238,24 +240,24 @@ def _build_query(body: SearchRequest) -> dict:
 
 
 async def response_stream_event(data: SearchRequest):
+    """Relay the organic stream as SSE bytes, one frame per event. Nothing is
+    buffered: each frame is awaited through the response, so a slow client
+    holds the miner stream back instead of growing memory here, and a client
+    disconnect closes the miner stream at once."""
     try:
         query = _build_query(data)
 
-        merged_chunks = ""
-
-        async for response in api.advanced_scraper_validator.organic(
-            query,
-            result_type=data.result_type,
-        ):
-            # Decode the chunk if necessary and merge
-            chunk = str(response)  # Assuming response is already a string
-            merged_chunks += chunk
-            lines = chunk.split("\n")
-            sse_data = "\n".join(f"data: {line if line else ' '}" for line in lines)
-            yield f"{sse_data}\n\n"
+        async with aclosing(
+            api.advanced_scraper_validator.organic(
+                query,
+                result_type=data.result_type,
+            )
+        ) as events:
+            async for event in events:
+                yield encode_sse_event(event)
     except Exception as e:
         bt.logging.error(f"error in response_stream {traceback.format_exc()}")
-        yield f"data: {json.dumps({'error': str(e)})}\n\n"
+        yield encode_sse_event({"error": str(e)})
 
 
 async def aggregate_search_results(responses: List[bt.Synapse], tools: List[str]):
@@ -548,7 +550,13 @@ async def health_check(_=Depends(verify_access_key)):
     async with ValidatorServiceClient() as client:
         try:
             await client.health_check()
-            return {"status": "healthy", "version": __version__}
+            return {
+                "status": "healthy",
+                "version": __version__,
+                "organic_persistence": api.organic_persistence.stats(),
+                "log_shipper": api.log_shipper.stats(),
+                "event_loop": api.loop_monitor.stats(),
+            }
         except aiohttp.ClientError:
             raise HTTPException(status_code=503)
 
@@ -557,11 +565,18 @@ async def health_check(_=Depends(verify_access_key)):
 # TODO: refactor API in the next release
 
 
+class LatencyOut(BaseModel):
+    ewma: float
+    p90: float
+    samples: int
+
+
 class MinerTypeStateOut(BaseModel):
     verified: Optional[int] = None
     declared: Optional[int] = None
     quality_avg: Optional[float] = None
     unreachable_since: Optional[str] = None
+    latency: Optional[LatencyOut] = None
     modes: Optional[dict[str, "MinerTypeStateOut"]] = None
 
 
@@ -604,42 +619,27 @@ class MinerDetailResponse(BaseModel):
     miner: MinerDetailOut
 
 
-def _empty_miner_state() -> dict:
-    return {
-        "verified": 1,
-        "declared": 0,
-        "quality_avg": 0.0,
-        "unreachable_since": None,
-    }
-
+def _snapshot_response(request: Request, entry: public_snapshot.SnapshotEntry):
+    """Serve a stored gzip body, or 304 when the client already has it."""
+    headers = {"ETag": entry.etag, "Age": str(entry.age()), "Vary": "Accept-Encoding"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if entry.etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
 
-def _miner_state_from_row(row: dict) -> dict:
-    return {
-        "verified": row["verified"],
-        "declared": row["declared"],
-        "quality_avg": row["quality_avg"],
-        "unreachable_since": row["unreachable_since"],
-    }
-
-
-AI_MODES = [lane[1] for lane in LANES if lane[0] == SearchType.AI_SEARCH]
-
-
-def _per_type_from_rows(rows: list[dict]) -> dict:
-    by_key = {row["search_type"]: _miner_state_from_row(row) for row in rows}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(entry.body, media_type="application/json", headers=headers)
+    return Response(
+        gzip.decompress(entry.body), media_type="application/json", headers=headers
+    )
 
-    modes = {
-        mode.value: by_key.get(
-            lane_key((SearchType.AI_SEARCH, mode)), _empty_miner_state()
-        )
-        for mode in AI_MODES
-    }
 
-    x_key = lane_key((SearchType.X_SEARCH, None))
-    return {
-        SearchType.AI_SEARCH.value: {"modes": modes},
-        x_key: by_key.get(x_key, _empty_miner_state()),
-    }
+async def _load_snapshot(load, *args) -> Optional[public_snapshot.SnapshotEntry]:
+    try:
+        return await load(*args)
+    except Exception as e:
+        bt.logging.warning(f"/public/miners snapshot read failed: {e}")
+        return None
 
 
 @app.get(
@@ -648,27 +648,31 @@ def _per_type_from_rows(rows: list[dict]) -> dict:
     response_model_exclude_none=True,
     summary="List active miners (no auth)",
     description="Aggregated miner state this validator has observed over the "
-    "last scoring windows. No authentication required.",
+    "last scoring windows. No authentication required. Supports "
+    "``If-None-Match``.",
     tags=["miners"],
 )
-async def public_list_miners():
+async def public_list_miners(request: Request):
+    entry = await _load_snapshot(public_snapshot.load_list)
+    if entry is not None:
+        return _snapshot_response(request, entry)
+
+    # No snapshot yet (validator service still starting): build it live.
     try:
         rows = await miner_db.get_all_rows()
     except Exception as e:
         bt.logging.error(f"/public/miners read failed: {e}")
         raise HTTPException(status_code=503, detail="Miner state unavailable")
 
-    rows_by_hotkey: dict[str, list] = {}
-    for row in rows:
-        rows_by_hotkey.setdefault(row["hotkey"], []).append(row)
+    rows_by_hotkey = public_snapshot.group_rows(rows)
+    latency_by_uid = await public_snapshot.latency_by_uid(
+        sorted({hotkey_rows[0]["uid"] for hotkey_rows in rows_by_hotkey.values()})
+    )
 
     miners = [
-        {
-            "hotkey": hotkey,
-            "uid": hotkey_rows[0]["uid"],
-            "coldkey": hotkey_rows[0]["coldkey"],
-            "per_type": _per_type_from_rows(hotkey_rows),
-        }
+        public_snapshot.list_item(
+            hotkey, hotkey_rows, latency_by_uid.get(hotkey_rows[0]["uid"])
+        )
         for hotkey, hotkey_rows in rows_by_hotkey.items()
     ]
 
@@ -684,12 +688,19 @@ async def public_list_miners():
     response_model_exclude_none=True,
     summary="Per-miner state and 72h scoring history (no auth)",
     description="Current per-search-type state plus the last 72 hours of "
-    "scoring windows. No authentication required.",
+    "scoring windows. No authentication required. Supports "
+    "``If-None-Match``.",
     tags=["miners"],
 )
 async def public_miner_detail(
+    request: Request,
     hotkey: str = Path(..., description="Miner hotkey (ss58)"),
 ):
+    entry = await _load_snapshot(public_snapshot.load_detail, hotkey)
+    if entry is not None:
+        return _snapshot_response(request, entry)
+
+    # Not in the snapshot: a miner registered since the last rebuild, or none.
     try:
         rows = await miner_db.get_rows_for_hotkey(hotkey)
     except Exception as e:
@@ -699,45 +710,23 @@ async def public_miner_detail(
     if not rows:
         raise HTTPException(status_code=404, detail="Miner not found")
 
-    per_type = _per_type_from_rows(rows)
-
-    async def lane_windows(lane) -> list:
-        rows_win = await miner_db.get_windows_for_hotkey(
-            hotkey, lane_key(lane), since_hours=72
-        )
-        return [
-            {
-                "window_start": w["window_start"],
-                "quality_score": w["quality_score"],
-                "passed": bool(w["passed"]),
-                "verified_concurrency": w["verified_concurrency"],
-            }
-            for w in rows_win
-        ]
+    uid = rows[0]["uid"]
+    latency_by_uid = await public_snapshot.latency_by_uid([uid])
 
-    windows: dict = {}
     try:
-        windows[SearchType.AI_SEARCH.value] = {
-            mode.value: await lane_windows((SearchType.AI_SEARCH, mode))
-            for mode in AI_MODES
+        windows_by_key = {
+            lane_key(lane): await miner_db.get_windows_for_hotkey(
+                hotkey, lane_key(lane), since_hours=public_snapshot.WINDOW_HOURS
+            )
+            for lane in LANES
         }
-        windows[lane_key((SearchType.X_SEARCH, None))] = await lane_windows(
-            (SearchType.X_SEARCH, None)
-        )
     except Exception as e:
         bt.logging.error(f"/public/miners/{hotkey} windows read failed: {e}")
         raise HTTPException(status_code=503, detail="Miner state unavailable")
 
-    return {
-        "validator": validator_identity or {},
-        "miner": {
-            "hotkey": hotkey,
-            "uid": rows[0]["uid"],
-            "coldkey": rows[0]["coldkey"],
-            "per_type": per_type,
-            "windows": windows,
-        },
-    }
+    miner = public_snapshot.list_item(hotkey, rows, latency_by_uid.get(uid))
+    miner["windows"] = public_snapshot.windows_by_lane(windows_by_key)
+    return {"validator": validator_identity or {}, "miner": miner}
 
 
 def custom_openapi():
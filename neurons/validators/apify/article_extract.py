@@ -0,0 +1,78 @@
+"""
+Article text and metadata extraction with trafilatura.
+
+Runs inside the extraction worker processes (see ``extract_pool``), so this
+module imports nothing from bittensor or the validator; workers preload it
+together with trafilatura and stay warm between pages.
+"""
+
+import os
+import re
+from typing import Tuple
+
+RAW_CACHE_CHARS = 16000
+
+_VERDICT_INJECTION = re.compile(r"(?i)\bverdict\b\s*:")
+
+_WARM_PAGE = (
+    "<html><head><title>Warm</title></head><body><article>"
+    "<p>Loads the trafilatura and lxml code paths before the first page.</p>"
+    "</article></body></html>"
+)
+
+
+def sanitize_body_text(text: str) -> str:
+    return _VERDICT_INJECTION.sub("verdict-", text or "")
+
+
+def extract_article_text(html: str, url: str, max_chars: int = RAW_CACHE_CHARS) -> str:
+    if not html:
+        return ""
+
+    text = ""
+    try:
+        import trafilatura
+
+        text = (
+            trafilatura.extract(
+                html,
+                include_comments=False,
+                include_tables=True,
+                favor_recall=True,
+                url=url,
+            )
+            or ""
+        ).strip()
+    except Exception:
+        pass
+
+    return sanitize_body_text(text)[:max_chars]
+
+
+def _extract_meta(html: str, url: str) -> Tuple[str, str, str]:
+    try:
+        import trafilatura
+
+        md = trafilatura.extract_metadata(html, default_url=url)
+        if md:
+            return (md.title or "", md.date or "", md.author or "")
+    except Exception:
+        pass
+    return "", "", ""
+
+
+def extract_pair(html: str, url: str, max_chars: int) -> Tuple[str, str, str, str]:
+    """(title, text, published_date, author) of one page."""
+    title, published_date, author = _extract_meta(html, url)
+    return (
+        title,
+        extract_article_text(html, url, max_chars),
+        published_date,
+        author,
+    )
+
+
+def warm() -> int:
+    """Worker initializer: run one tiny extraction; returns the worker pid."""
+    extract_pair(_WARM_PAGE, "https://warm.invalid/", 100)
+    return os.getpid()
@@ -2,20 +2,24 @@ from __future__ import annotations
 
 import asyncio
 import re
-import threading
 import time
 from typing import Dict, List, Optional, Tuple
 
 import bittensor as bt
 
-_EXTRACT_LOCK = threading.Lock()
+from neurons.validators.apify.article_extract import RAW_CACHE_CHARS as _RAW_CACHE_CHARS
+from neurons.validators.apify.article_extract import (
+    _extract_meta,
+    extract_article_text,
+    sanitize_body_text,
+)
+from neurons.validators.apify.extract_pool import get_extract_pool
+from neurons.validators.utils.source_bodies import normalized_text
 
-_RAW_CACHE_CHARS = 16000
 _CACHE_TTL_S = 600
 _MAX_CACHE_ENTRIES = 2000
 _MIN_ARTICLE_CHARS = 200
 
-_VERDICT_INJECTION = re.compile(r"(?i)\bverdict\b\s*:")
 _JS_GATE = re.compile(
     r"(?i)(please enable javascript|enable javascript and refresh|"
     r"something went wrong\.?\s*(wait a moment|please|try)|"
@@ -23,65 +27,14 @@ _JS_GATE = re.compile(
 )
 
 
-def sanitize_body_text(text: str) -> str:
-    return _VERDICT_INJECTION.sub("verdict-", text or "")
-
-
 def is_usable_article(text: str) -> bool:
     return bool(text) and len(text) >= _MIN_ARTICLE_CHARS and not _JS_GATE.search(text)
 
 
-def extract_article_text(html: str, url: str, max_chars: int = _RAW_CACHE_CHARS) -> str:
-    if not html:
-        return ""
-
-    text = ""
-    try:
-        import trafilatura
-
-        text = (
-            trafilatura.extract(
-                html,
-                include_comments=False,
-                include_tables=True,
-                favor_recall=True,
-                url=url,
-            )
-            or ""
-        ).strip()
-    except Exception as e:
-        bt.logging.trace(f"trafilatura failed for {url}: {e}")
-
-    return sanitize_body_text(text)[:max_chars]
-
-
-def _extract_meta(html: str, url: str) -> Tuple[str, str, str]:
-    try:
-        import trafilatura
-
-        md = trafilatura.extract_metadata(html, default_url=url)
-        if md:
-            return (md.title or "", md.date or "", md.author or "")
-    except Exception:
-        pass
-    return "", "", ""
-
-
-def _extract_pair(html: str, url: str, max_chars: int) -> Tuple[str, str, str, str]:
-    with _EXTRACT_LOCK:
-        title, published_date, author = _extract_meta(html, url)
-        return (
-            title,
-            extract_article_text(html, url, max_chars),
-            published_date,
-            author,
-        )
-
-
 async def extract_article_async(
     html: str, url: str, max_chars: int = _RAW_CACHE_CHARS
 ) -> Tuple[str, str, str, str]:
-    return await asyncio.to_thread(_extract_pair, html, url, max_chars)
+    return await get_extract_pool().extract(html, url, max_chars)
 
 
 class BodyFetcher:
@@ -158,6 +111,9 @@ class BodyFetcher:
                 ]
             if not is_usable_article(text):
                 text = ""
+            else:
+                # Normalize for the highlight checks off the event loop.
+                await asyncio.to_thread(normalized_text, text)
             return url, {
                 "url": url,
                 "title": title or item.get("title", "") or "",
@@ -4,6 +4,7 @@ from typing import List
 import bittensor as bt
 from apify_client import ApifyClientAsync
 from desearch.protocol import TwitterScraperTweet
+from desearch.provider_endpoints import APIFY, base_url
 
 
 def get_apify_api_key() -> str:
@@ -19,7 +20,11 @@ class CheerioScraperActor:
         # Actor: https://apify.com/apify/cheerio-scraper
         self.actor_id = "YrQuEkowkNCLdk4j2"
         api_key = get_apify_api_key()
-        self.client = ApifyClientAsync(token=api_key) if api_key else None
+        self.client = (
+            ApifyClientAsync(token=api_key, api_url=base_url(APIFY))
+            if api_key
+            else None
+        )
 
     async def scrape_metadata(self, urls: List[str]) -> List[TwitterScraperTweet]:
         if not has_apify_api_key() or self.client is None:
@@ -0,0 +1,208 @@
+"""
+Process pool for trafilatura article extraction.
+
+trafilatura parses in Python and holds the GIL, and was not safe to run on
+several threads at once, so body extraction used to be serialized onto a
+single thread behind a lock. The pool runs it in worker processes instead,
+so an epoch's pages are extracted on as many cores as there are workers.
+
+- Workers are forked from a forkserver that has already imported
+  ``article_extract`` and trafilatura, and each runs one warm-up extraction
+  before taking pages. ``start()`` brings all of them up ahead of the first
+  epoch. Where forkserver is unavailable, workers are spawned.
+- At most one page per worker is in flight, so a page's timeout measures
+  its own extraction rather than time spent queued behind other pages.
+- A page that runs past ``timeout`` gets empty results and the pool is
+  killed and replaced: a process pool cannot cancel one running task, and
+  pathological HTML can keep lxml busy indefinitely. Other pages in flight
+  on the killed pool, like pages on a pool whose worker crashed, are retried
+  once on the new pool.
+- Workers are recycled after ``max_tasks_per_worker`` pages to bound the
+  memory lxml keeps between parses.
+- Each page crosses to the worker once as the HTML string, and only the
+  extracted fields come back.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, Tuple
+
+import bittensor as bt
+
+from neurons.validators import env
+from neurons.validators.apify import article_extract
+
+EXTRACT_TIMEOUT_SECONDS = 20.0
+MAX_TASKS_PER_WORKER = 500
+
+EMPTY_EXTRACTION = ("", "", "", "")
+
+_PRELOAD = [article_extract.__name__, "trafilatura"]
+
+
+def default_workers() -> int:
+    """One worker per core, leaving one core to the event loop."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+def _mp_context():
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        # Besides the extraction modules, preload the entry script so that
+        # workers fork from a server that already imported it instead of
+        # each importing it again.
+        context.set_forkserver_preload(["__main__", *_PRELOAD])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+class ExtractPool:
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        timeout: float = EXTRACT_TIMEOUT_SECONDS,
+        max_tasks_per_worker: Optional[int] = MAX_TASKS_PER_WORKER,
+        target: Callable = article_extract.extract_pair,
+        initializer: Optional[Callable] = article_extract.warm,
+    ) -> None:
+        self.workers = workers or default_workers()
+        self.timeout = timeout
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.target = target
+        self.initializer = initializer
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # (loop, semaphore): asyncio primitives belong to one event loop.
+        self._slots: Optional[tuple] = None
+
+        self.extracted = 0
+        self.timeouts = 0
+        self.crashes = 0
+        self.restarts = 0
+        self.busy_seconds = 0.0
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            kwargs = {}
+            if sys.version_info >= (3, 11):
+                kwargs["max_tasks_per_child"] = self.max_tasks_per_worker
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=_mp_context(),
+                initializer=self.initializer,
+                **kwargs,
+            )
+        return self._executor
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots[0] is not loop:
+            self._slots = (loop, asyncio.Semaphore(self.workers))
+        return self._slots[1]
+
+    async def start(self) -> None:
+        """Start and warm every worker; pages submitted later find them idle."""
+        pool = self._pool()
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        # The executor adds a worker per submitted task while none is idle.
+        await asyncio.gather(
+            *[loop.run_in_executor(pool, os.getpid) for _ in range(self.workers)]
+        )
+        bt.logging.info(
+            f"[ExtractPool] {self.workers} extraction workers ready in "
+            f"{time.monotonic() - started:.1f}s"
+        )
+
+    async def extract(
+        self, html: str, url: str, max_chars: int
+    ) -> Tuple[str, str, str, str]:
+        """(title, text, published_date, author) of a page, or empty fields
+        if its extraction timed out or kept crashing workers."""
+        if not html:
+            return EMPTY_EXTRACTION
+
+        loop = asyncio.get_running_loop()
+        async with self._semaphore():
+            for _ in range(2):
+                pool = self._pool()
+                started = time.monotonic()
+                try:
+                    result = await asyncio.wait_for(
+                        loop.run_in_executor(pool, self.target, html, url, max_chars),
+                        self.timeout,
+                    )
+                except asyncio.TimeoutError:
+                    self.timeouts += 1
+                    bt.logging.warning(
+                        f"[ExtractPool] extraction of {url} ran over "
+                        f"{self.timeout:.0f}s; restarting workers"
+                    )
+                    self._restart(pool)
+                    return EMPTY_EXTRACTION
+                except BrokenProcessPool:
+                    self.crashes += 1
+                    bt.logging.debug(
+                        f"[ExtractPool] worker lost while extracting {url}"
+                    )
+                    self._restart(pool)
+                    continue
+                self.extracted += 1
+                self.busy_seconds += time.monotonic() - started
+                return result
+        return EMPTY_EXTRACTION
+
+    def _restart(self, pool: ProcessPoolExecutor) -> None:
+        """Kill ``pool``'s workers and let the next page start a new pool;
+        a no-op if another page already replaced it."""
+        if pool is not self._executor:
+            return
+        self._executor = None
+        self.restarts += 1
+        self._kill(pool)
+
+    @staticmethod
+    def _kill(pool: ProcessPoolExecutor) -> None:
+        # Pages still queued on the pool fail with BrokenProcessPool once its
+        # workers are gone, which sends them to the retry in ``extract``.
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.kill()
+        pool.shutdown(wait=False)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._kill(self._executor)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "running": self._executor is not None,
+            "extracted": self.extracted,
+            "timeouts": self.timeouts,
+            "crashes": self.crashes,
+            "restarts": self.restarts,
+            "busy_seconds": round(self.busy_seconds, 3),
+        }
+
+
+_extract_pool: Optional[ExtractPool] = None
+
+
+def get_extract_pool() -> ExtractPool:
+    global _extract_pool
+    if _extract_pool is None:
+        _extract_pool = ExtractPool(workers=env.EXTRACT_WORKERS or None)
+    return _extract_pool
+
+
+def close_extract_pool() -> None:
+    global _extract_pool
+    if _extract_pool is not None:
+        _extract_pool.close()
+        _extract_pool = None
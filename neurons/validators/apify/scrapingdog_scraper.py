@@ -10,6 +10,8 @@ from urllib.parse import parse_qs, urlparse
 import aiohttp
 import bittensor as bt
 
+from desearch.provider_endpoints import SCRAPINGDOG, provider_url
+
 _YOUTUBE_HOSTS = {"youtube.com", "www.youtube.com", "youtu.be"}
 _REDDIT_HOSTS = {"reddit.com", "www.reddit.com"}
 
@@ -199,12 +201,18 @@ class _ScrapingDogHTMLParser(HTMLParser):
 
 
 class ScrapingDogScraper:
-    api_url = "https://api.scrapingdog.com/scrape"
-    youtube_api_url = "https://api.scrapingdog.com/youtube/video"
     request_timeout_seconds = 30
     max_concurrent_requests = 30
     _shared_semaphores = weakref.WeakKeyDictionary()
 
+    @property
+    def api_url(self) -> str:
+        return provider_url(SCRAPINGDOG, "scrape")
+
+    @property
+    def youtube_api_url(self) -> str:
+        return provider_url(SCRAPINGDOG, "youtube/video")
+
     @classmethod
     def _get_shared_semaphore(cls) -> asyncio.Semaphore:
         loop = asyncio.get_running_loop()
@@ -0,0 +1,126 @@
+"""
+Redis store of Apify-fetched tweets keyed by tweet id.
+
+``scrape_tweets_with_retries`` consults it before starting any actor run,
+so a tweet sampled again by another scoring batch, reward model or process
+within its TTL costs nothing. Only tweets returned by the validator's own
+actor runs are stored; miner responses never are, since these records are
+the ground truth miners are scored against.
+
+Engagement counts keep moving while a tweet is young, so the TTL grows with
+tweet age and never exceeds an hour.
+"""
+
+from datetime import datetime, timezone
+from typing import Iterable, Optional
+
+import bittensor as bt
+
+from desearch.protocol import TwitterScraperTweet
+from desearch.redis.redis_client import redis_client
+
+KEY_PREFIX = "tweet"
+
+# (max tweet age in seconds, TTL in seconds), youngest first.
+TTL_BY_AGE = (
+    (3600, 60),
+    (6 * 3600, 5 * 60),
+    (24 * 3600, 15 * 60),
+)
+MAX_TTL = 3600
+
+
+def _key(tweet_id: str) -> str:
+    return f"{KEY_PREFIX}:{tweet_id}"
+
+
+def _parse_created_at(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%a %b %d %H:%M:%S %z %Y")
+    except ValueError:
+        pass
+    try:
+        created_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if created_at.tzinfo is None:
+        return created_at.replace(tzinfo=timezone.utc)
+    return created_at
+
+
+def ttl_for(tweet: TwitterScraperTweet, now: Optional[datetime] = None) -> int:
+    created_at = _parse_created_at(tweet.created_at)
+    if created_at is None:
+        return TTL_BY_AGE[0][1]
+
+    age = ((now or datetime.now(timezone.utc)) - created_at).total_seconds()
+    for max_age, ttl in TTL_BY_AGE:
+        if age < max_age:
+            return ttl
+    return MAX_TTL
+
+
+class TweetCache:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.apify_runs = 0
+        self.apify_runs_avoided = 0
+
+    async def get_many(
+        self, tweet_ids: Iterable[str]
+    ) -> dict[str, TwitterScraperTweet]:
+        tweet_ids = list(dict.fromkeys(tweet_ids))
+        if not tweet_ids:
+            return {}
+
+        try:
+            raw = await redis_client.mget([_key(tweet_id) for tweet_id in tweet_ids])
+        except Exception as e:
+            bt.logging.warning(f"[TweetCache] read failed: {e}")
+            raw = [None] * len(tweet_ids)
+
+        tweets = {}
+        for tweet_id, value in zip(tweet_ids, raw):
+            if value is None:
+                continue
+            try:
+                tweets[tweet_id] = TwitterScraperTweet.model_validate_json(value)
+            except Exception as e:
+                bt.logging.warning(f"[TweetCache] dropping bad entry {tweet_id}: {e}")
+
+        self.hits += len(tweets)
+        self.misses += len(tweet_ids) - len(tweets)
+        return tweets
+
+    async def put_many(self, tweets: Iterable[TwitterScraperTweet]) -> None:
+        now = datetime.now(timezone.utc)
+        try:
+            pipeline = redis_client.pipeline(transaction=False)
+            for tweet in tweets:
+                if tweet.id:
+                    pipeline.set(
+                        _key(tweet.id),
+                        tweet.model_dump_json(),
+                        ex=ttl_for(tweet, now),
+                    )
+            await pipeline.execute()
+        except Exception as e:
+            bt.logging.warning(f"[TweetCache] write failed: {e}")
+
+    def record_runs(self, runs: int, avoided: int) -> None:
+        self.apify_runs += runs
+        self.apify_runs_avoided += avoided
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "apify_runs": self.apify_runs,
+            "apify_runs_avoided": self.apify_runs_avoided,
+        }
+
+
+tweet_cache = TweetCache()
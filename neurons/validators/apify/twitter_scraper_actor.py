@@ -1,6 +1,7 @@
 import os
 import traceback
-from typing import List, Optional
+from contextlib import aclosing
+from typing import AsyncIterator, Callable, List, Optional
 
 import bittensor as bt
 from apify_client import ApifyClientAsync
@@ -10,6 +11,7 @@ from desearch.protocol import (
     TwitterScraperTweet,
     TwitterScraperUser,
 )
+from desearch.provider_endpoints import APIFY, base_url
 from desearch.services.twitter_utils import TwitterUtils
 
 APIFY_API_KEY_MESSAGE = (
@@ -18,6 +20,12 @@ APIFY_API_KEY_MESSAGE = (
 )
 
 
+# Seconds to wait on the run between dataset polls while it is still going.
+STREAM_POLL_SECONDS = 1
+STREAM_PAGE_SIZE = 1000
+TERMINAL_RUN_STATUSES = {"SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT"}
+
+
 def get_apify_api_key() -> str:
     return os.environ.get("APIFY_API_KEY", "")
 
@@ -107,7 +115,11 @@ class TwitterScraperActor:
         self.new_actor_id = "CJdippxWmn9uRfooo"
         self.user_scraper_actor_id = "V38PZzpEgOfeeWvZY"
         api_key = get_apify_api_key()
-        self.client = ApifyClientAsync(token=api_key) if api_key else None
+        self.client = (
+            ApifyClientAsync(token=api_key, api_url=base_url(APIFY))
+            if api_key
+            else None
+        )
 
     async def get_tweets(
         self, urls: List[str], add_user_info: bool = True
@@ -125,13 +137,26 @@ class TwitterScraperActor:
                 "tweetIDs": tweet_ids,
             }
 
-            run = await self.client.actor(self.new_actor_id).call(run_input=run_input)
-
-            tweets: List[TwitterScraperTweet] = []
+            return [tweet async for tweet in self._stream_tweets(run_input, tweet_ids)]
+        except Exception as e:
+            error_message = (
+                f"TwitterScraperActor: Failed to scrape tweets {urls}: {str(e)}"
+            )
+            tb_str = traceback.format_exception(type(e), e, e.__traceback__)
+            bt.logging.error("\n".join(tb_str) + error_message)
+            return []
 
-            async for item in self.client.dataset(
-                run["defaultDatasetId"]
-            ).iterate_items():
+    async def _stream_tweets(
+        self, run_input: dict, tweet_ids: List[str]
+    ) -> AsyncIterator[TwitterScraperTweet]:
+        """Tweets of ``tweet_ids`` as the actor pushes them; the run is
+        aborted as soon as every requested id has arrived."""
+        pending = set(tweet_ids)
+        stream = self.stream_items(
+            self.new_actor_id, run_input, is_done=lambda: not pending
+        )
+        async with aclosing(stream) as items:
+            async for item in items:
                 try:
                     if (
                         item.get("noResults")
@@ -141,22 +166,65 @@ class TwitterScraperActor:
                         continue
 
                     tweet = toTwitterScraperTweet(item)
-                    tweets.append(tweet)
                 except Exception as e:
                     error_message = (
                         f"TwitterScraperActor: Failed to scrape tweet: {str(e)}"
                     )
                     tb_str = traceback.format_exception(type(e), e, e.__traceback__)
                     bt.logging.warning("\n".join(tb_str) + error_message)
+                    continue
 
-            return tweets
-        except Exception as e:
-            error_message = (
-                f"TwitterScraperActor: Failed to scrape tweets {urls}: {str(e)}"
-            )
-            tb_str = traceback.format_exception(type(e), e, e.__traceback__)
-            bt.logging.error("\n".join(tb_str) + error_message)
-            return []
+                pending.discard(tweet.id)
+                yield tweet
+
+    async def stream_items(
+        self,
+        actor_id: str,
+        run_input: dict,
+        is_done: Callable[[], bool] = lambda: False,
+    ) -> AsyncIterator[dict]:
+        """Start ``actor_id`` and yield its dataset items as they land.
+
+        The dataset is read from the last offset after every
+        ``STREAM_POLL_SECONDS`` wait on the run, instead of after the whole
+        run. Once ``is_done()`` holds after an item, or the consumer stops
+        iterating, a run that is still going gets aborted so it stops
+        producing (and billing) results nobody reads.
+        """
+        run = await self.client.actor(actor_id).start(run_input=run_input)
+        run_id = run["id"]
+        run_client = self.client.run(run_id)
+        dataset = self.client.dataset(run["defaultDatasetId"])
+        finished = run.get("status") in TERMINAL_RUN_STATUSES
+        offset = 0
+
+        try:
+            while True:
+                # Read once more after the run finishes: items pushed right
+                # before the end may not have been visible on the last poll.
+                drain = finished
+                page = await dataset.list_items(offset=offset, limit=STREAM_PAGE_SIZE)
+                for item in page.items:
+                    offset += 1
+                    yield item
+                    if is_done():
+                        return
+
+                if len(page.items) == STREAM_PAGE_SIZE:
+                    continue
+                if drain:
+                    return
+
+                run = await run_client.wait_for_finish(wait_secs=STREAM_POLL_SECONDS)
+                finished = run is None or run.get("status") in TERMINAL_RUN_STATUSES
+        finally:
+            if not finished:
+                try:
+                    await run_client.abort()
+                except Exception as e:
+                    bt.logging.warning(
+                        f"TwitterScraperActor: Failed to abort run {run_id}: {e}"
+                    )
 
     async def get_tweets_advanced(
         self,
@@ -220,18 +288,22 @@ class TwitterScraperActor:
             }
             run_input = {k: v for k, v in run_input.items() if v is not None}
 
-            run = await self.client.actor(self.actor_id).call(run_input=run_input)
-
             tweets: List[dict] = []
 
-            async for item in self.client.dataset(
-                run["defaultDatasetId"]
-            ).iterate_items():
-                if item.get("noResults"):
-                    continue
+            # maxItems is only a hint to the actor, which may overshoot it;
+            # stop reading (and abort the run) once we have enough.
+            stream = self.stream_items(
+                self.actor_id,
+                run_input,
+                is_done=lambda: maxItems is not None and len(tweets) >= maxItems,
+            )
+            async with aclosing(stream) as items:
+                async for item in items:
+                    if item.get("noResults"):
+                        continue
 
-                tweet = toTwitterScraperTweet(item)
-                tweets.append(tweet)
+                    tweet = toTwitterScraperTweet(item)
+                    tweets.append(tweet)
 
             return tweets
         except Exception as e:
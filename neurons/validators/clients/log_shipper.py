@@ -0,0 +1,313 @@
+"""
+Batched, gzip-compressed shipping of miner response logs to the utility API.
+
+Callers hand logs to ``LogShipper.submit`` and return immediately. A single
+task ships them in batches of up to ``MAX_BATCH_LOGS`` or every
+``FLUSH_INTERVAL_SECONDS``, whichever comes first, retrying with exponential
+backoff. Only transport errors and 5xx (plus 408/429) responses are
+retried; a batch the API rejects with any other 4xx would be rejected again,
+so it is dropped. A batch that still fails is written, already compressed,
+to a SQLite spool and replayed once the utility API accepts requests again,
+up to ``SPOOL_MAX_REPLAYS`` times. The in-memory buffer and the spool are
+both capped; overflow is counted and dropped rather than growing without
+bound.
+"""
+
+import asyncio
+import contextlib
+import gzip
+import json
+import os
+import random
+import time
+from typing import Optional
+
+import aiohttp
+import aiosqlite
+import bittensor as bt
+
+MAX_BATCH_LOGS = 200
+FLUSH_INTERVAL_SECONDS = 5.0
+MAX_BUFFERED_LOGS = 5000
+
+MAX_ATTEMPTS = 4
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 30.0
+
+SPOOL_MAX_BYTES = 256 * 1024 * 1024
+SPOOL_REPLAY_BATCHES = 10
+SPOOL_MAX_REPLAYS = 20
+GZIP_LEVEL = 6
+
+# Client errors worth retrying: the request itself was fine.
+RETRYABLE_CLIENT_STATUSES = frozenset({408, 429})
+
+SHIPPED = "shipped"
+REJECTED = "rejected"
+FAILED = "failed"
+
+_SPOOL_SCHEMA = """
+CREATE TABLE IF NOT EXISTS log_spool (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at REAL NOT NULL,
+    body BLOB NOT NULL,
+    logs INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0
+);
+"""
+# Columns added after the first spool release.
+_SPOOL_COLUMNS = {
+    "logs": "INTEGER NOT NULL DEFAULT 0",
+    "attempts": "INTEGER NOT NULL DEFAULT 0",
+}
+
+
+def encode_logs_body(logs: list[dict]) -> bytes:
+    """Gzip the ``{"logs": [...]}`` body the utility API expects."""
+    return gzip.compress(json.dumps({"logs": logs}).encode("utf-8"), GZIP_LEVEL)
+
+
+def is_retryable(error: Exception) -> bool:
+    """Transport errors and 5xx may succeed later; other 4xx will not."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= 500 or error.status in RETRYABLE_CLIENT_STATUSES
+    return True
+
+
+class LogSpool:
+    """Append-only SQLite spool of compressed request bodies."""
+
+    def __init__(self, path: str, max_bytes: int = SPOOL_MAX_BYTES) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self._db: Optional[aiosqlite.Connection] = None
+
+    async def open(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._db = await aiosqlite.connect(self.path)
+        await self._db.execute("PRAGMA journal_mode = WAL")
+        await self._db.execute("PRAGMA busy_timeout = 5000")
+        await self._db.executescript(_SPOOL_SCHEMA)
+        async with self._db.execute("PRAGMA table_info(log_spool)") as cursor:
+            existing = {row[1] for row in await cursor.fetchall()}
+        for column, definition in _SPOOL_COLUMNS.items():
+            if column not in existing:
+                await self._db.execute(
+                    f"ALTER TABLE log_spool ADD COLUMN {column} {definition}"
+                )
+        await self._db.commit()
+
+    async def close(self) -> None:
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+
+    async def push(self, body: bytes, logs: int, attempts: int = 0) -> None:
+        """Spool a body of ``logs`` logs that replay has tried ``attempts`` times."""
+        await self._db.execute(
+            "INSERT INTO log_spool (created_at, body, logs, attempts) "
+            "VALUES (?, ?, ?, ?)",
+            (time.time(), body, logs, attempts),
+        )
+        await self._trim()
+        await self._db.commit()
+
+    async def _trim(self) -> None:
+        async with self._db.execute(
+            "SELECT COALESCE(SUM(LENGTH(body)), 0) FROM log_spool"
+        ) as cursor:
+            (size,) = await cursor.fetchone()
+        if size <= self.max_bytes:
+            return
+        async with self._db.execute(
+            "SELECT id, LENGTH(body) FROM log_spool ORDER BY id"
+        ) as cursor:
+            rows = await cursor.fetchall()
+        cutoff = None
+        for row_id, length in rows:
+            if size <= self.max_bytes:
+                break
+            size -= length
+            cutoff = row_id
+        if cutoff is not None:
+            await self._db.execute("DELETE FROM log_spool WHERE id <= ?", (cutoff,))
+            bt.logging.warning(f"[LogShipper] spool full, dropped rows <= {cutoff}")
+
+    async def pop(self) -> Optional[tuple[bytes, int, int]]:
+        """Remove and return the oldest ``(body, logs, attempts)``. Claiming by
+        delete keeps API workers sharing the spool from replaying the same
+        batch twice."""
+        async with self._db.execute(
+            "DELETE FROM log_spool WHERE id = "
+            "(SELECT id FROM log_spool ORDER BY id LIMIT 1) "
+            "RETURNING body, logs, attempts"
+        ) as cursor:
+            row = await cursor.fetchone()
+        await self._db.commit()
+        return tuple(row) if row else None
+
+    async def count(self) -> int:
+        async with self._db.execute("SELECT COUNT(*) FROM log_spool") as cursor:
+            (count,) = await cursor.fetchone()
+        return count
+
+
+class LogShipper:
+    def __init__(
+        self,
+        utility_api,
+        spool: Optional[LogSpool] = None,
+        max_batch: int = MAX_BATCH_LOGS,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        max_buffered: int = MAX_BUFFERED_LOGS,
+    ) -> None:
+        self.utility_api = utility_api
+        self.spool = spool
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+
+        self._buffer: list[dict] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        self.shipped = 0
+        self.spooled = 0
+        self.dropped = 0
+
+    async def start(self) -> None:
+        if self.spool is not None:
+            try:
+                await self.spool.open()
+            except Exception as e:
+                bt.logging.warning(f"[LogShipper] spool unavailable: {e}")
+                self.spool = None
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            # A batch the task was shipping goes back to the buffer (or the
+            # spool, during replay) when it is cancelled; wait for that.
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        while self._buffer:
+            await self._ship(self._take_batch())
+        if self.spool is not None:
+            await self.spool.close()
+
+    def submit(self, logs: list[dict]) -> None:
+        room = self.max_buffered - len(self._buffer)
+        if room < len(logs):
+            self.dropped += len(logs) - max(room, 0)
+            bt.logging.warning(
+                f"[LogShipper] buffer full, dropped {len(logs) - max(room, 0)} logs"
+            )
+            logs = logs[: max(room, 0)]
+        self._buffer.extend(logs)
+        if len(self._buffer) >= self.max_batch:
+            self._wakeup.set()
+
+    def stats(self) -> dict:
+        return {
+            "buffered": len(self._buffer),
+            "shipped": self.shipped,
+            "spooled": self.spooled,
+            "dropped": self.dropped,
+        }
+
+    def _take_batch(self) -> list[dict]:
+        batch = self._buffer[: self.max_batch]
+        del self._buffer[: self.max_batch]
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                while self._buffer:
+                    await self._ship(self._take_batch())
+                await self._replay_spool()
+            except Exception as e:
+                bt.logging.error(f"[LogShipper] cycle failed: {e}")
+
+    async def _post(self, body: bytes, attempts: int = MAX_ATTEMPTS) -> str:
+        """``SHIPPED``, ``REJECTED`` (4xx, never worth resending) or ``FAILED``
+        once ``attempts`` tries with backoff have not got through."""
+        for attempt in range(attempts):
+            try:
+                await self.utility_api.save_logs_body(body)
+                return SHIPPED
+            except Exception as e:
+                if not is_retryable(e):
+                    bt.logging.error(f"[LogShipper] batch rejected: {e}")
+                    return REJECTED
+                if attempt == attempts - 1:
+                    if attempts > 1:
+                        bt.logging.error(f"[LogShipper] giving up after retries: {e}")
+                    return FAILED
+                delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2**attempt)
+                await asyncio.sleep(delay * (0.5 + random.random() / 2))
+        return FAILED
+
+    async def _ship(self, batch: list[dict]) -> None:
+        if not batch:
+            return
+        try:
+            body = await asyncio.to_thread(encode_logs_body, batch)
+            outcome = await self._post(body)
+        except asyncio.CancelledError:
+            # Stopping mid-request: the drain in ``stop`` ships it instead.
+            self._buffer[:0] = batch
+            raise
+        if outcome == SHIPPED:
+            self.shipped += len(batch)
+            return
+
+        if outcome == REJECTED or self.spool is None:
+            self.dropped += len(batch)
+            return
+        try:
+            await self.spool.push(body, len(batch))
+            self.spooled += len(batch)
+        except Exception as e:
+            self.dropped += len(batch)
+            bt.logging.error(f"[LogShipper] spool write failed: {e}")
+
+    async def _replay_spool(self) -> None:
+        if self.spool is None:
+            return
+        for _ in range(SPOOL_REPLAY_BATCHES):
+            row = await self.spool.pop()
+            if row is None:
+                return
+            body, logs, attempts = row
+            try:
+                outcome = await self._post(body, attempts=1)
+            except asyncio.CancelledError:
+                await self.spool.push(body, logs, attempts)
+                raise
+            if outcome == SHIPPED:
+                self.shipped += logs
+                continue
+            if outcome == REJECTED:
+                self.dropped += logs
+                continue
+
+            attempts += 1
+            if attempts >= SPOOL_MAX_REPLAYS:
+                self.dropped += logs
+                bt.logging.error(
+                    f"[LogShipper] dropped a spooled batch of {logs} logs "
+                    f"after {attempts} replays"
+                )
+                continue
+            bt.logging.debug("[LogShipper] spool replay deferred")
+            await self.spool.push(body, logs, attempts)
+            return
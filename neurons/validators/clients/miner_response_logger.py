@@ -1,26 +1,86 @@
 import asyncio
 import math
+import types
+from dataclasses import dataclass
 from datetime import date, datetime
 from enum import Enum
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Optional, Union, get_args, get_origin
 
 import bittensor as bt
 import numpy as np
 from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError
 
 REWARD_COMPONENT_NAMES = {
     "ai_search": ["content", "summary", "performance"],
     "x_search": ["twitter", "performance"],
 }
-_RESPONSE_PAYLOAD_EXCLUDED_KEYS = {"html_content", "html_text"}
+_RESPONSE_PAYLOAD_EXCLUDED_KEYS = frozenset({"html_content", "html_text"})
+_EVENT_SKIPPED_KEYS = {"step_length", "prompts", "uids", "rewards"}
+
+
+def _dump_model(model: BaseModel, exclude: Optional[dict] = None) -> Any:
+    """Serialize in one pass with pydantic's JSON mode, walking the Python dump
+    only when some field holds a type pydantic cannot encode."""
+    try:
+        return model.model_dump(mode="json", exclude=exclude, warnings=False)
+    except (PydanticSerializationError, TypeError, ValueError):
+        dumped = model.model_dump(mode="python", exclude=exclude, warnings=False)
+        return {key: to_jsonable(item) for key, item in dumped.items()}
+
+
+def _payload_exclude_for(annotation: Any, seen: frozenset) -> Any:
+    """Exclude spec hiding the html keys wherever ``annotation`` can hold an
+    untyped dict, or ``None`` when it cannot."""
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is Union or origin is types.UnionType:
+        for arg in args:
+            spec = _payload_exclude_for(arg, seen)
+            if spec:
+                return spec
+        return None
+    if annotation is dict or origin is dict:
+        return set(_RESPONSE_PAYLOAD_EXCLUDED_KEYS)
+    if origin in (list, tuple, set, frozenset):
+        inner = _payload_exclude_for(args[0], seen) if args else None
+        return {"__all__": inner} if inner else None
+    if (
+        isinstance(annotation, type)
+        and issubclass(annotation, BaseModel)
+        and annotation not in seen
+    ):
+        return _build_payload_exclude(annotation, seen) or None
+    return None
+
+
+def _build_payload_exclude(model_cls: type[BaseModel], seen: frozenset) -> dict:
+    seen = seen | {model_cls}
+    spec = {}
+    for name, field in model_cls.model_fields.items():
+        if name in _RESPONSE_PAYLOAD_EXCLUDED_KEYS:
+            spec[name] = True
+            continue
+        inner = _payload_exclude_for(field.annotation, seen)
+        if inner:
+            spec[name] = inner
+    return spec
+
+
+@lru_cache(maxsize=None)
+def response_payload_exclude(model_cls: type[BaseModel]) -> dict:
+    """``model_dump`` exclude spec that drops html bodies from a response
+    model, derived once per class from its field annotations. It only
+    reaches the first level of dict fields; deeper keys are left to
+    ``_sanitize_response_payload``."""
+    return _build_payload_exclude(model_cls, frozenset())
 
 
 def to_jsonable(value: Any) -> Any:
     if isinstance(value, BaseModel):
-        return {
-            key: to_jsonable(item)
-            for key, item in value.model_dump(mode="python").items()
-        }
+        return _dump_model(value)
     if isinstance(value, Enum):
         return value.value
     if isinstance(value, datetime):
@@ -139,13 +199,22 @@ def _extract_request_query(response) -> str:
     return ""
 
 
-def _slice_event_value(value: Any, index: int, response_count: int) -> Any:
-    serialized = to_jsonable(value)
+def _slice_event_value(serialized: Any, index: int, response_count: int) -> Any:
     if isinstance(serialized, list) and len(serialized) == response_count:
         return serialized[index]
     return serialized
 
 
+def _serialize_response_payload(response) -> Any:
+    if isinstance(response, BaseModel):
+        # The exclude spec keeps the html bodies it can see from the
+        # annotations out of the dump; untyped subtrees can still nest them.
+        return _sanitize_response_payload(
+            _dump_model(response, response_payload_exclude(type(response)))
+        )
+    return _sanitize_response_payload(to_jsonable(response))
+
+
 def _sanitize_response_payload(value: Any) -> Any:
     if isinstance(value, dict):
         return {
@@ -160,27 +229,58 @@ def _sanitize_response_payload(value: Any) -> Any:
     return value
 
 
+@dataclass(frozen=True)
+class RewardBatch:
+    """A scoring batch's reward arrays and event, serialized once so each
+    response's payload only slices them."""
+
+    rewards: list
+    original_rewards: list
+    validator_scores: list
+    event: dict[str, Any]
+
+    @classmethod
+    def serialize(
+        cls, all_rewards, all_original_rewards, validator_scores, event
+    ) -> "RewardBatch":
+        return cls(
+            rewards=[to_jsonable(rewards) for rewards in all_rewards],
+            original_rewards=[to_jsonable(rewards) for rewards in all_original_rewards],
+            validator_scores=[to_jsonable(scores) for scores in validator_scores],
+            event={
+                key: to_jsonable(value)
+                for key, value in (event or {}).items()
+                if key not in _EVENT_SKIPPED_KEYS
+            },
+        )
+
+
 def build_reward_payload(
     search_type: str,
     response_count: int,
     index: int,
     uid: int,
     total_reward: float,
-    all_rewards,
-    all_original_rewards,
-    validator_scores,
-    event: dict[str, Any],
+    all_rewards=None,
+    all_original_rewards=None,
+    validator_scores=None,
+    event: Optional[dict[str, Any]] = None,
+    batch: Optional[RewardBatch] = None,
 ) -> dict[str, Any]:
+    """Per-response reward payload. Pass a ``RewardBatch`` when building
+    payloads for a whole batch so the shared arrays are converted once."""
+    if batch is None:
+        batch = RewardBatch.serialize(
+            all_rewards or [], all_original_rewards or [], validator_scores or [], event
+        )
+
     component_names = REWARD_COMPONENT_NAMES[search_type]
     components = {}
     original_components = {}
 
-    for component_name, rewards, original_rewards in zip(
-        component_names, all_rewards, all_original_rewards
+    for component_name, reward_values, original_values in zip(
+        component_names, batch.rewards, batch.original_rewards
     ):
-        reward_values = to_jsonable(rewards)
-        original_values = to_jsonable(original_rewards)
-
         if isinstance(reward_values, list) and len(reward_values) > index:
             components[component_name] = reward_values[index]
         else:
@@ -192,9 +292,9 @@ def build_reward_payload(
             original_components[component_name] = original_values
 
     validator_score_payload = {}
-    for component_name, scores in zip(component_names, validator_scores):
-        serialized_scores = to_jsonable(scores)
-
+    for component_name, serialized_scores in zip(
+        component_names, batch.validator_scores
+    ):
         if isinstance(serialized_scores, list) and len(serialized_scores) > index:
             validator_score_payload[component_name] = serialized_scores[index]
         elif isinstance(serialized_scores, dict):
@@ -206,10 +306,7 @@ def build_reward_payload(
 
     event_slice = {}
     penalties = {}
-    for key, value in (event or {}).items():
-        if key in {"step_length", "prompts", "uids", "rewards"}:
-            continue
-
+    for key, value in batch.event.items():
         sliced_value = _slice_event_value(value, index, response_count)
         event_slice[key] = sliced_value
 
@@ -241,7 +338,7 @@ def build_log_entry(
     scoring_epoch_start: Optional[datetime] = None,
 ) -> dict[str, Any]:
     validator_identity = get_validator_identity(owner)
-    response_payload = _sanitize_response_payload(to_jsonable(response))
+    response_payload = _serialize_response_payload(response)
     response_axon = getattr(response, "axon", None)
 
     miner_hotkey = miner_hotkey or getattr(response_axon, "hotkey", None)
@@ -296,7 +393,14 @@ async def submit_logs(owner, logs: list[dict[str, Any]]) -> None:
 
 
 def submit_logs_best_effort(owner, logs: list[dict[str, Any]]) -> None:
+    """Queue logs on the owner's batching shipper, or send them in a task of
+    their own when it has none."""
     if not logs:
         return
 
+    shipper = getattr(owner, "log_shipper", None)
+    if shipper is not None:
+        shipper.submit(logs)
+        return
+
     asyncio.create_task(submit_logs(owner, logs))
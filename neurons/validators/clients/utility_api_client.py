@@ -3,6 +3,8 @@ import time
 import aiohttp
 import bittensor as bt
 
+from neurons.validators.clients.log_shipper import encode_logs_body
+
 
 class UtilityAPIClient:
     """
@@ -51,10 +53,18 @@ class UtilityAPIClient:
         response.raise_for_status()
 
     async def save_logs(self, logs: list[dict]) -> dict:
+        return await self.save_logs_body(encode_logs_body(logs))
+
+    async def save_logs_body(self, body: bytes) -> dict:
+        """POST an already gzip-encoded ``{"logs": [...]}`` body."""
         async with self._session.post(
             f"{self.base_url}/logs",
-            headers=self._auth_headers(),
-            json={"logs": logs},
+            headers={
+                **self._auth_headers(),
+                "Content-Type": "application/json",
+                "Content-Encoding": "gzip",
+            },
+            data=body,
             timeout=aiohttp.ClientTimeout(total=120),
         ) as response:
             await self._raise_for_status_with_context(
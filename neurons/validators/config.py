@@ -80,6 +80,27 @@ def add_args(cls, parser):
         default=ScoringModel.QWEN3_5_397B,
     )
 
+    parser.add_argument(
+        "--neuron.organic_hedging",
+        action="store_true",
+        help="Hedge FAST organic searches to a second miner when the first is slow to stream.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--neuron.hedge_quantile",
+        type=float,
+        help="Time-to-first-chunk quantile after which a FAST organic search is hedged.",
+        default=0.9,
+    )
+
+    parser.add_argument(
+        "--neuron.loop_stall_ms",
+        type=float,
+        help="Event-loop stall, in milliseconds, that is logged with the blocking task's stack.",
+        default=250,
+    )
+
     parser.add_argument(
         "--neuron.utility_api_url",
         type=str,
@@ -11,6 +11,14 @@ MINER_DB_PATH = os.environ.get(
     os.path.join(_REPO_ROOT, ".state", "miner_state.db"),
 )
 
+LOG_SPOOL_PATH = os.environ.get(
+    "LOG_SPOOL_PATH",
+    os.path.join(_REPO_ROOT, ".state", "log_spool.db"),
+)
+
+# Article extraction worker processes; 0 means one per core but one.
+EXTRACT_WORKERS = int(os.environ.get("EXTRACT_WORKERS", 0))
+
 MIN_ACCESS_KEY_LENGTH = 16
 
 
@@ -4,12 +4,14 @@ from desearch.protocol import (
 )
 from neurons.validators.penalty.penalty import CheapPenaltyModel, PenaltyModelType
 from neurons.validators.utils.response_checks import tweet_date_in_range
+from neurons.validators.utils.x_query_operators import x_search_constraints
 
 
 class DateRangePenaltyModel(CheapPenaltyModel):
     """Penalize responses whose tweets fall outside the requested
-    [start_date, end_date]. Pure code — checks the miner's claimed
-    ``created_at``; the deep model verifies the claim against Apify."""
+    [start_date, end_date], including ``since:``/``until:`` in an X query.
+    Pure code — checks the miner's claimed ``created_at``; the deep model
+    verifies the claim against Apify."""
 
     name = PenaltyModelType.date_range_penalty.value
 
@@ -35,7 +37,8 @@ class DateRangePenaltyModel(CheapPenaltyModel):
     @staticmethod
     def _tweets_and_bounds(response):
         if isinstance(response, TwitterSearchSynapse):
-            return response.results or [], response.start_date, response.end_date
+            constraints = x_search_constraints(response)
+            return response.results or [], constraints.start_date, constraints.end_date
         if isinstance(response, ScraperStreamingSynapse):
             return response.miner_tweets or [], response.start_date, response.end_date
         return [], None, None
@@ -1,6 +1,7 @@
 from desearch.protocol import TwitterSearchSynapse
 from neurons.validators.penalty.penalty import CheapPenaltyModel, PenaltyModelType
 from neurons.validators.utils.response_checks import is_descending_by_created_at
+from neurons.validators.utils.x_query_operators import x_search_constraints
 
 
 class SortOrderPenaltyModel(CheapPenaltyModel):
@@ -12,7 +13,7 @@ class SortOrderPenaltyModel(CheapPenaltyModel):
     def penalty_for(self, response) -> float:
         if not isinstance(response, TwitterSearchSynapse):
             return 0.0
-        if getattr(response, "sort", None) != "Latest":
+        if x_search_constraints(response).sort != "Latest":
             return 0.0
         if not is_descending_by_created_at(response.results or []):
             return self.max_penalty
@@ -2,9 +2,7 @@ from desearch.protocol import ResultType, ScraperStreamingSynapse, ScraperTextRo
 from neurons.validators.penalty.penalty import CheapPenaltyModel, PenaltyModelType
 from neurons.validators.utils.response_checks import (
     check_markdown_structure,
-    collect_summary_sources,
-    extract_markdown_links,
-    normalize_source_url,
+    response_links,
 )
 
 
@@ -25,11 +23,10 @@ class SummaryStructurePenaltyModel(CheapPenaltyModel):
         if not ok_structure:
             return self.max_penalty
 
-        links = [url for _, url in extract_markdown_links(summary)]
-        if not links:
+        links = response_links(response)
+        if not links.summary:
             return self.max_penalty
 
-        sources = collect_summary_sources(response)
-        if any(normalize_source_url(link) not in sources for link in links):
+        if not links.cited <= links.sources:
             return self.max_penalty
         return 0.0
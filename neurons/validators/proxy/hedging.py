@@ -0,0 +1,214 @@
+"""
+Hedged organic streams for FAST-mode search.
+
+If the routed miner has not streamed its first chunk within the configured
+quantile of recently observed time-to-first-byte, the same synapse is sent to
+a second weighted miner and the client gets whichever stream starts first.
+The loser never reaches the client: it is watched only until its own first
+chunk (or failure) so reachability and the savings stats stay honest, then
+cancelled.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+import bittensor as bt
+import numpy as np
+
+from neurons.validators.scoring import capacity
+
+DEFAULT_HEDGE_QUANTILE = 0.9
+DEFAULT_HEDGE_DELAY_SECONDS = 2.0
+TTFB_WINDOW = 200
+MIN_TTFB_SAMPLES = 20
+STATS_LOG_EVERY = 100
+
+
+class TTFBTracker:
+    """Rolling window of time-to-first-chunk observations (seconds)."""
+
+    def __init__(self, window: int = TTFB_WINDOW) -> None:
+        self.samples: deque[float] = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def hedge_delay(self, quantile: float) -> float:
+        if len(self.samples) < MIN_TTFB_SAMPLES:
+            return DEFAULT_HEDGE_DELAY_SECONDS
+        return float(np.quantile(self.samples, quantile))
+
+
+class HedgeStats:
+    """Process-wide hedge counters, logged every ``STATS_LOG_EVERY`` requests."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.hedged = 0
+        self.secondary_wins = 0
+        self.savings: deque[float] = deque(maxlen=TTFB_WINDOW)
+
+    def snapshot(self) -> dict:
+        savings = list(self.savings)
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_rate": self.hedged / self.requests if self.requests else 0.0,
+            "secondary_wins": self.secondary_wins,
+            "savings_p50": float(np.quantile(savings, 0.5)) if savings else 0.0,
+            "savings_p90": float(np.quantile(savings, 0.9)) if savings else 0.0,
+        }
+
+    def count_request(self) -> None:
+        self.requests += 1
+        if self.requests % STATS_LOG_EVERY == 0:
+            bt.logging.info(f"[Hedging] {self.snapshot()}")
+
+
+ttfb_tracker = TTFBTracker()
+hedge_stats = HedgeStats()
+
+# Settling losers outlive the request; keep references so they are not GC'd.
+_background: set[asyncio.Task] = set()
+
+
+class _Contender:
+    def __init__(self, uid: int, axon, stream: AsyncIterator) -> None:
+        self.uid = uid
+        self.axon = axon
+        self.stream = stream
+        self.started = time.monotonic()
+        self.first_at: Optional[float] = None
+        self.first = asyncio.ensure_future(self._first())
+
+    async def _first(self):
+        value = await self.stream.__anext__()
+        if not isinstance(value, bt.Synapse):
+            self.first_at = time.monotonic()
+        return value
+
+    def streaming(self) -> bool:
+        """First value arrived and is a chunk, not a bare final synapse."""
+        return self.first.done() and self.first_at is not None
+
+    async def drain(self) -> None:
+        async for _ in self.stream:
+            pass
+
+
+class HedgedStream:
+    """Async iterator over the winning miner's stream. ``uid`` / ``axon``
+    point at the winner once the first chunk has been yielded."""
+
+    def __init__(
+        self,
+        uid: int,
+        axon,
+        stream: AsyncIterator,
+        launch_secondary: Callable[[], Awaitable[Optional[tuple]]],
+        search_type: str,
+        mode,
+        quantile: float = DEFAULT_HEDGE_QUANTILE,
+    ) -> None:
+        self.uid = uid
+        self.axon = axon
+        self._primary = (uid, axon, stream)
+        self._launch_secondary = launch_secondary
+        self._search_type = search_type
+        self._mode = mode
+        self._delay = ttfb_tracker.hedge_delay(quantile)
+
+    async def __aiter__(self):
+        hedge_stats.count_request()
+        primary = _Contender(*self._primary)
+        contenders = [primary]
+        winner = None
+
+        try:
+            done, _ = await asyncio.wait({primary.first}, timeout=self._delay)
+            if not done:
+                secondary = await self._launch_secondary()
+                if secondary is not None:
+                    hedge_stats.hedged += 1
+                    contenders.append(_Contender(*secondary))
+                    bt.logging.debug(
+                        f"[Hedging] uid={primary.uid} silent after {self._delay:.2f}s, "
+                        f"hedging to uid={secondary[0]}"
+                    )
+
+            winner = await self._race(contenders)
+        finally:
+            # Also on a client disconnect during the wait or the race, so no
+            # contender's dendrite call is left running unobserved.
+            for contender in contenders:
+                if contender is not winner:
+                    self._settle_in_background(
+                        contender,
+                        winner if contender is primary else None,
+                    )
+
+        if winner is None:
+            # Nobody streamed: surface the primary's final synapse, if any.
+            if not primary.first.cancelled() and primary.first.exception() is None:
+                yield primary.first.result()
+            return
+
+        self.uid, self.axon = winner.uid, winner.axon
+        ttfb_tracker.observe(winner.first_at - winner.started)
+        if winner is not primary:
+            hedge_stats.secondary_wins += 1
+
+        try:
+            yield winner.first.result()
+            async for value in winner.stream:
+                yield value
+        finally:
+            await winner.stream.aclose()
+
+    @staticmethod
+    async def _race(contenders: list[_Contender]) -> Optional[_Contender]:
+        waiting = {contender.first: contender for contender in contenders}
+        while waiting:
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            # Iterate in launch order so the primary wins ties.
+            for contender in contenders:
+                if contender.first in done and contender.first in waiting:
+                    waiting.pop(contender.first)
+                    if contender.streaming():
+                        return contender
+        return None
+
+    def _settle_in_background(
+        self, loser: _Contender, hedge_winner: Optional[_Contender]
+    ) -> None:
+        task = asyncio.create_task(self._settle(loser, hedge_winner))
+        _background.add(task)
+        task.add_done_callback(_background.discard)
+
+    async def _settle(
+        self, loser: _Contender, hedge_winner: Optional[_Contender]
+    ) -> None:
+        """Wait for the loser's first value, then cancel it. A stream that
+        finished or failed on its own already recorded its result through
+        the dendrite wrapper; one that was alive counts as a success.
+        ``hedge_winner`` is set when the loser is a primary that a hedge
+        beat, so the head start it would have cost is recorded as savings."""
+        try:
+            await asyncio.wait({loser.first})
+            if loser.first.cancelled() or loser.first.exception() is not None:
+                return
+            if not loser.streaming():
+                await loser.drain()
+                return
+
+            ttfb_tracker.observe(loser.first_at - loser.started)
+            if hedge_winner is not None:
+                hedge_stats.savings.append(loser.first_at - hedge_winner.first_at)
+            await capacity.note_call_result(
+                loser.uid, self._search_type, True, mode=self._mode
+            )
+            await loser.stream.aclose()
+        except Exception as e:
+            bt.logging.warning(f"[Hedging] settling uid={loser.uid} failed: {e}")
@@ -0,0 +1,122 @@
+"""
+Cluster-wide in-flight miner calls per (uid, lane).
+
+Each dendrite call adds a member ``{uid}:{token}`` to the Redis sorted set
+``inflight:{lane_key}``, scored by the call's deadline. The validator
+service (router) and every API worker share the same sets, and entries
+left behind by a crashed worker age out at their deadline instead of
+leaking capacity forever.
+"""
+
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import Optional
+from uuid import uuid4
+
+import bittensor as bt
+
+from desearch.miner_config import Lane, lane_key
+from desearch.redis.redis_client import redis_client
+
+KEY_PREFIX = "inflight"
+KEY_EXPIRY = 10 * 60
+
+# Routing holds a short reservation so a burst of picks sees its own
+# choices before the API worker's dendrite call registers the real entry;
+# ``track`` then takes the reservation over, so a call is never counted twice.
+RESERVATION_TTL_SECONDS = 3
+DEADLINE_GRACE_SECONDS = 5
+# Reservations already aged out of the lane set that ``track`` skips before
+# giving up on finding a live one.
+MAX_STALE_RESERVATIONS = 8
+
+
+def _key(lane: Lane) -> str:
+    return f"{KEY_PREFIX}:{lane_key(lane)}"
+
+
+def _reserved_key(uid: int, lane: Lane) -> str:
+    """Oldest-first list of ``uid``'s reservation members in ``lane``."""
+    return f"{KEY_PREFIX}:reserved:{lane_key(lane)}:{uid}"
+
+
+async def acquire(uid: int, lane: Lane, ttl: float) -> Optional[str]:
+    """Register one in-flight call; returns the member to release, or
+    ``None`` when Redis is unavailable (tracking is best-effort)."""
+    member = f"{uid}:{uuid4().hex[:8]}"
+    key = _key(lane)
+    try:
+        pipeline = redis_client.pipeline()
+        pipeline.zadd(key, {member: time.time() + ttl})
+        pipeline.expire(key, KEY_EXPIRY)
+        await pipeline.execute()
+    except Exception as e:
+        bt.logging.warning(f"[Inflight] acquire failed uid={uid}: {e}")
+        return None
+    return member
+
+
+async def release(lane: Lane, member: Optional[str]) -> None:
+    if member is None:
+        return
+    try:
+        await redis_client.zrem(_key(lane), member)
+    except Exception as e:
+        bt.logging.warning(f"[Inflight] release failed {member}: {e}")
+
+
+async def reserve(uid: int, lane: Lane) -> Optional[str]:
+    """Hold a slot for a routed call until its ``track`` takes it over or
+    ``RESERVATION_TTL_SECONDS`` pass; returns the reservation member."""
+    member = await acquire(uid, lane, RESERVATION_TTL_SECONDS)
+    if member is None:
+        return None
+    key = _reserved_key(uid, lane)
+    try:
+        pipeline = redis_client.pipeline()
+        pipeline.rpush(key, member)
+        pipeline.expire(key, RESERVATION_TTL_SECONDS)
+        await pipeline.execute()
+    except Exception as e:
+        bt.logging.warning(f"[Inflight] reserve failed uid={uid}: {e}")
+    return member
+
+
+async def _take_over_reservation(uid: int, lane: Lane) -> None:
+    """Drop the oldest live reservation for ``uid``, now that its call is
+    tracked on its own."""
+    key = _reserved_key(uid, lane)
+    try:
+        for _ in range(MAX_STALE_RESERVATIONS):
+            member = await redis_client.lpop(key)
+            if member is None or await redis_client.zrem(_key(lane), member):
+                return
+    except Exception as e:
+        bt.logging.warning(f"[Inflight] reservation take-over failed uid={uid}: {e}")
+
+
+@asynccontextmanager
+async def track(uid: int, lane: Lane, timeout: float):
+    """Count a dendrite call as in flight for its whole duration."""
+    member = await acquire(uid, lane, timeout + DEADLINE_GRACE_SECONDS)
+    if member is not None:
+        await _take_over_reservation(uid, lane)
+    try:
+        yield
+    finally:
+        await release(lane, member)
+
+
+async def counts(lane: Lane) -> dict[int, int]:
+    """``{uid: in_flight}`` for one lane, after dropping expired entries."""
+    key = _key(lane)
+    try:
+        pipeline = redis_client.pipeline()
+        pipeline.zremrangebyscore(key, "-inf", time.time())
+        pipeline.zrange(key, 0, -1)
+        _, members = await pipeline.execute()
+    except Exception as e:
+        bt.logging.warning(f"[Inflight] counts failed {key}: {e}")
+        return {}
+    return dict(Counter(int(member.split(":", 1)[0]) for member in members))
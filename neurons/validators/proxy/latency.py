@@ -0,0 +1,98 @@
+"""
+Live per-(uid, lane) response-time model for routing.
+
+Every dendrite completion (organic or synthetic) pushes its wall-clock
+latency, or its full timeout if the call failed, onto a capped Redis list
+``latency:{lane_key}:{uid}``, so the validator service and API workers feed
+and read the same window. EWMA and p90 are derived from that window on read.
+"""
+
+import time
+from typing import Iterable, Optional
+
+import bittensor as bt
+import numpy as np
+
+from desearch.miner_config import Lane, lane_key
+from desearch.redis.redis_client import redis_client
+
+KEY_PREFIX = "latency"
+KEY_EXPIRY = 6 * 3600
+
+WINDOW_SIZE = 50
+EWMA_ALPHA = 0.3
+MIN_SAMPLES = 3
+
+# Router-side snapshot lifetime; stats move slower than request rate.
+SNAPSHOT_TTL_SECONDS = 15
+
+
+def _key(lane: Lane, uid: int) -> str:
+    return f"{KEY_PREFIX}:{lane_key(lane)}:{uid}"
+
+
+async def record(uid: int, lane: Lane, seconds: float) -> None:
+    key = _key(lane, uid)
+    try:
+        pipeline = redis_client.pipeline()
+        pipeline.lpush(key, f"{seconds:.3f}")
+        pipeline.ltrim(key, 0, WINDOW_SIZE - 1)
+        pipeline.expire(key, KEY_EXPIRY)
+        await pipeline.execute()
+    except Exception as e:
+        bt.logging.warning(f"[Latency] record failed uid={uid}: {e}")
+
+
+def summarize(samples: list[float]) -> Optional[dict]:
+    """``samples`` newest first, as stored. ``None`` below ``MIN_SAMPLES``."""
+    if len(samples) < MIN_SAMPLES:
+        return None
+    ewma = samples[-1]
+    for value in reversed(samples[:-1]):
+        ewma = EWMA_ALPHA * value + (1 - EWMA_ALPHA) * ewma
+    return {
+        "ewma": round(ewma, 3),
+        "p90": round(float(np.percentile(samples, 90)), 3),
+        "samples": len(samples),
+    }
+
+
+async def stats_for(lane: Lane, uids: Iterable[int]) -> dict[int, dict]:
+    """``{uid: {ewma, p90, samples}}`` for uids with enough samples."""
+    uids = list(uids)
+    if not uids:
+        return {}
+    try:
+        pipeline = redis_client.pipeline()
+        for uid in uids:
+            pipeline.lrange(_key(lane, uid), 0, -1)
+        raw = await pipeline.execute()
+    except Exception as e:
+        bt.logging.warning(f"[Latency] stats read failed {lane_key(lane)}: {e}")
+        return {}
+
+    stats = {}
+    for uid, values in zip(uids, raw):
+        summary = summarize([float(value) for value in values])
+        if summary is not None:
+            stats[uid] = summary
+    return stats
+
+
+class LatencySnapshot:
+    """Per-lane stats cached for ``SNAPSHOT_TTL_SECONDS`` so routing does not
+    hit Redis for every uid on every pick."""
+
+    def __init__(self) -> None:
+        self._stats: dict[Lane, dict[int, dict]] = {}
+        self._fetched_at: dict[Lane, float] = {}
+
+    async def get(self, lane: Lane, uids: list[int]) -> dict[int, dict]:
+        now = time.monotonic()
+        if now - self._fetched_at.get(lane, float("-inf")) > SNAPSHOT_TTL_SECONDS:
+            self._stats[lane] = await stats_for(lane, uids)
+            self._fetched_at[lane] = now
+        return self._stats.get(lane, {})
+
+    def invalidate(self) -> None:
+        self._fetched_at.clear()
@@ -6,6 +6,9 @@ from bittensor.core.metagraph import AsyncMetagraph
 
 from desearch.miner_config import LANES, Lane, SearchType, lane_key
 from desearch.protocol import SearchMode
+from desearch.utils import get_mode_serving_budget
+from neurons.validators.proxy import inflight
+from neurons.validators.proxy.latency import LatencySnapshot
 from neurons.validators.scoring import miner_db
 from neurons.validators.scoring.constants import (
     QUALITY_EXPONENT,
@@ -22,6 +25,12 @@ class UIDManager:
     """
     Routes organic requests to miners weighted by quality * verified concurrency
     per lane. Snapshots are refreshed on metagraph resync.
+
+    Picks use power-of-two-choices over the weight distribution: two weighted
+    draws, keep the one with the lower in-flight / verified load. Miners
+    already at their verified concurrency are never picked. FAST picks
+    also skip miners whose live latency EWMA exceeds the mode's serving
+    budget, unless that would leave nobody to route to.
     """
 
     metagraph: AsyncMetagraph
@@ -29,6 +38,8 @@ class UIDManager:
     def __init__(self) -> None:
         self.available_uids: List[int] = []
         self.weights_by_lane: dict[Lane, dict[int, float]] = {}
+        self.capacity_by_lane: dict[Lane, dict[int, int]] = {}
+        self.latency = LatencySnapshot()
 
     def _top_half_by_incentive(self, available_uids: List[int]) -> set[int]:
         available_set = set(available_uids)
@@ -86,6 +97,10 @@ class UIDManager:
             any_ramped = any(v >= RAMP_EVIDENCE_VERIFIED for _q, v in rows.values())
             lane_modes[key] = "ramped" if any_ramped else "migration"
 
+            self.capacity_by_lane[lane] = {
+                uid: max(rows.get(uid, (0.0, 1))[1], 1) for uid in available_uids
+            }
+
             weights: dict[int, float] = {}
             for uid in available_uids:
                 if uid in unreachable:
@@ -116,14 +131,48 @@ class UIDManager:
             for uid in await miner_db.get_unreachable_uids(lane_key(lane)):
                 self.mark_unreachable(uid, lane[0])
 
-    def _pick(self, weights_map: dict[int, float]) -> Optional[int]:
-        uids = self.available_uids
-        weights = [weights_map.get(uid, 0.0) for uid in uids]
-        if sum(weights) > 0:
-            return random.choices(uids, weights=weights, k=1)[0]
-        return None
+    @staticmethod
+    def _load(uid: int, capacity: dict[int, int], in_flight: dict[int, int]) -> float:
+        return in_flight.get(uid, 0) / capacity.get(uid, 1)
+
+    def _has_room(
+        self, uid: int, capacity: dict[int, int], in_flight: dict[int, int]
+    ) -> bool:
+        return in_flight.get(uid, 0) < capacity.get(uid, 1)
 
-    def get_miner_uid(
+    def _pick(
+        self,
+        weights_map: dict[int, float],
+        capacity: dict[int, int],
+        in_flight: dict[int, int],
+        skip: set[int] = frozenset(),
+    ) -> Optional[int]:
+        uids = [
+            uid
+            for uid in self.available_uids
+            if weights_map.get(uid, 0.0) > 0
+            and uid not in skip
+            and self._has_room(uid, capacity, in_flight)
+        ]
+        if not uids:
+            return None
+        weights = [weights_map[uid] for uid in uids]
+        first, second = random.choices(uids, weights=weights, k=2)
+        if self._load(second, capacity, in_flight) < self._load(
+            first, capacity, in_flight
+        ):
+            return second
+        return first
+
+    async def _slow_uids(self, lane: Lane) -> set[int]:
+        mode = lane[1]
+        if mode != SearchMode.FAST:
+            return set()
+        budget = get_mode_serving_budget(mode)
+        stats = await self.latency.get(lane, self.available_uids)
+        return {uid for uid, s in stats.items() if s["ewma"] > budget}
+
+    async def get_miner_uid(
         self,
         search_type: Optional[SearchType] = None,
         mode: Optional[SearchMode] = None,
@@ -131,11 +180,33 @@ class UIDManager:
         if not self.available_uids:
             raise RuntimeError("UIDManager has no available UIDs")
 
-        if search_type:
-            weights = self.weights_by_lane.get(self.lane_for(search_type, mode))
-            if weights:
-                selected = self._pick(weights)
-                if selected is not None:
-                    return selected
-
-        return random.choice(self.available_uids)
+        if not search_type:
+            return random.choice(self.available_uids)
+
+        lane = self.lane_for(search_type, mode)
+        capacity = self.capacity_by_lane.get(lane, {})
+        in_flight = await inflight.counts(lane)
+
+        selected = None
+        weights = self.weights_by_lane.get(lane)
+        if weights:
+            slow = await self._slow_uids(lane)
+            selected = self._pick(weights, capacity, in_flight, skip=slow)
+            if selected is None and slow:
+                selected = self._pick(weights, capacity, in_flight)
+
+        if selected is None:
+            free = [
+                uid
+                for uid in self.available_uids
+                if self._has_room(uid, capacity, in_flight)
+            ]
+            if not free:
+                raise RuntimeError(
+                    f"UIDManager: every miner in {lane_key(lane)} is at "
+                    f"verified concurrency"
+                )
+            selected = random.choice(free)
+
+        await inflight.reserve(selected, lane)
+        return selected
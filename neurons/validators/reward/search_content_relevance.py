@@ -4,7 +4,7 @@ from typing import List
 
 import bittensor as bt
 
-from desearch.protocol import ScraperStreamingSynapse, ScraperTextRole
+from desearch.protocol import ScraperStreamingSynapse
 from neurons.validators.apify.body_fetch import get_body_fetcher
 from neurons.validators.base_validator import AbstractNeuron
 from neurons.validators.penalty.count_penalty import SEARCH_SUMMARY_TOOLS
@@ -16,10 +16,10 @@ from neurons.validators.utils.prompts import (
 from neurons.validators.utils.response_checks import (
     normalize_source_url,
     parse_tweet_date,
+    response_links,
     tweet_date_in_range,
 )
 from neurons.validators.utils.source_bodies import (
-    cited_urls_normalized,
     highlights_in_order,
     sample_cited_and_uncited,
 )
@@ -124,8 +124,7 @@ class WebSearchContentRelevanceModel(BaseRewardModel):
         return meta
 
     def _sample_cited_and_other(self, response, links_per_tool_group):
-        summary = response.texts.get(ScraperTextRole.FINAL_SUMMARY.value, "")
-        cited_norm = cited_urls_normalized(summary)
+        cited_norm = response_links(response).cited
 
         flat = [link for group in links_per_tool_group.values() for link in group]
         picks = sample_cited_and_uncited(
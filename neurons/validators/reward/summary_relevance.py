@@ -18,7 +18,7 @@ from neurons.validators.utils.prompts import (
     SummaryGroundednessPrompt,
     render_cited_sources,
 )
-from neurons.validators.utils.response_checks import extract_markdown_links
+from neurons.validators.utils.response_checks import response_links
 from neurons.validators.utils.source_bodies import (
     align_citation_markers,
     collect_cited_bodies,
@@ -43,8 +43,7 @@ class SummaryRelevanceRewardModel(BaseRewardModel):
         self.scoring_type = scoring_type
 
     def _cited_source_urls(self, response: ScraperStreamingSynapse) -> List[str]:
-        summary = response.texts.get(ScraperTextRole.FINAL_SUMMARY.value, "")
-        cited = list(dict.fromkeys(url for _, url in extract_markdown_links(summary)))
+        cited = list(dict.fromkeys(response_links(response).summary))
         if not cited:
             search_links, _ = response.get_links_from_search_results()
             cited = list(dict.fromkeys(search_links))
@@ -19,8 +19,10 @@ from desearch.utils import (
     format_text_for_match,
     is_valid_tweet,
     scrape_tweets_with_retries,
+    tweets_for_links,
 )
 from neurons.validators.base_validator import AbstractNeuron
+from neurons.validators.utils.x_query_operators import x_search_constraints
 
 from .config import RewardModelType
 from .reward import BaseRewardEvent, BaseRewardModel, log_reward_aggregates
@@ -141,14 +143,11 @@ class TwitterBasicSearchContentRelevanceModel(BaseRewardModel):
             )
 
             # 2) For each response, match tweets by ID and append to validator_tweets
+            tweets_by_id = {tweet.id: tweet for tweet in tweets_list}
             for response, random_links in zip(responses, responses_random_links):
-                ids = [
-                    self.twitter_utils.extract_tweet_id(link) for link in random_links
-                ]
-                for fetched_tweet in tweets_list:
-                    if fetched_tweet.id in ids:
-                        # Append the newly fetched tweet to validator_tweets
-                        response.validator_tweets.append(fetched_tweet)
+                response.validator_tweets.extend(
+                    tweets_for_links(random_links, tweets_by_id)
+                )
 
             end_time = time.time()
             bt.logging.info(
@@ -336,6 +335,15 @@ class TwitterBasicSearchContentRelevanceModel(BaseRewardModel):
 
                 return 0.0
 
+            # Query operators are the same for every validator tweet.
+            constraints = start_date = end_date = None
+            if isinstance(response, TwitterSearchSynapse):
+                constraints = x_search_constraints(response)
+                if constraints.start_date is not None:
+                    start_date = _parse_synapse_date(constraints.start_date)
+                if constraints.end_date is not None:
+                    end_date = _parse_synapse_date(constraints.end_date)
+
             tweet_scores = []
 
             # 3) Iterate over validator tweets
@@ -365,83 +373,7 @@ class TwitterBasicSearchContentRelevanceModel(BaseRewardModel):
 
                 tweet_score = []
                 # d) If it's TwitterSearchSynapse => check min_likes/min_retweets/min_replies
-                if isinstance(response, TwitterSearchSynapse):
-                    synapse = response.model_dump()
-                    query = response.query.strip().lower()
-
-                    if "from:" in query:
-                        try:
-                            synapse["user"] = (
-                                query.split("from:")[1].split(" ")[0].strip()
-                            )
-                        except:
-                            pass
-
-                    if "min_faves:" in query:
-                        try:
-                            synapse["min_likes"] = int(
-                                query.split("min_faves:")[1].split(" ")[0].strip()
-                            )
-                        except:
-                            pass
-
-                    if "min_retweets:" in query:
-                        try:
-                            synapse["min_retweets"] = int(
-                                query.split("min_retweets:")[1].split(" ")[0].strip()
-                            )
-                        except:
-                            pass
-
-                    if "min_replies:" in query:
-                        try:
-                            synapse["min_replies"] = int(
-                                query.split("min_replies:")[1].split(" ")[0].strip()
-                            )
-                        except:
-                            pass
-
-                    if "filter:verified" in query:
-                        synapse["verified"] = True
-
-                    if "filter:blue_verified" in query:
-                        synapse["blue_verified"] = True
-
-                    if "filter:quote" in query:
-                        synapse["is_quote"] = True
-
-                    if "filter:images" in query:
-                        synapse["is_image"] = True
-
-                    if "filter:videos" in query:
-                        synapse["is_video"] = True
-
-                    if "since:" in query:
-                        try:
-                            synapse["start_date"] = (
-                                query.split("since:")[1].split(" ")[0].strip()
-                            )
-                        except:
-                            pass
-
-                    if "until:" in query:
-                        try:
-                            synapse["end_date"] = (
-                                query.split("until:")[1].split(" ")[0].strip()
-                            )
-                        except:
-                            pass
-
-                    if "lang:" in query:
-                        try:
-                            synapse["lang"] = (
-                                query.split("lang:")[1].split(" ")[0].strip()
-                            )
-                        except:
-                            pass
-
-                    query_words = synapse.get("query", "").strip().lower().split(" ")
-
+                if constraints is not None:
                     texts = [
                         val_tweet.text.lower(),
                         val_tweet.user.username.lower(),
@@ -449,74 +381,74 @@ class TwitterBasicSearchContentRelevanceModel(BaseRewardModel):
                     ]
 
                     # Check any of query words to be in tweet text
-                    if synapse.get("query") and not any(
-                        word in text for word in query_words for text in texts
+                    if constraints.query and not any(
+                        word in text for word in constraints.words for text in texts
                     ):
                         tweet_score.append(0)
                     else:
                         tweet_score.append(1)
 
-                    if synapse.get("min_likes") is not None:
+                    if constraints.min_likes is not None:
                         if (
                             val_tweet.like_count is None
-                            or val_tweet.like_count < synapse.get("min_likes")
+                            or val_tweet.like_count < constraints.min_likes
                         ):
                             tweet_score.append(0)
                         else:
                             tweet_score.append(1)
 
-                    if synapse.get("min_retweets") is not None:
+                    if constraints.min_retweets is not None:
                         if (
                             val_tweet.retweet_count is None
-                            or val_tweet.retweet_count < synapse.get("min_retweets")
+                            or val_tweet.retweet_count < constraints.min_retweets
                         ):
                             tweet_score.append(0)
                         else:
                             tweet_score.append(1)
 
-                    if synapse.get("min_replies") is not None:
+                    if constraints.min_replies is not None:
                         if (
                             val_tweet.reply_count is None
-                            or val_tweet.reply_count < synapse.get("min_replies")
+                            or val_tweet.reply_count < constraints.min_replies
                         ):
                             tweet_score.append(0)
                         else:
                             tweet_score.append(1)
 
-                    if synapse.get("user") is not None:
-                        if synapse.get("user") != val_tweet.user.username:
+                    if constraints.user is not None:
+                        if constraints.user != val_tweet.user.username:
                             tweet_score.append(0)
                         else:
                             tweet_score.append(1)
 
-                    if synapse.get("verified") is not None:
-                        if synapse.get("verified") != val_tweet.user.verified:
+                    if constraints.verified is not None:
+                        if constraints.verified != val_tweet.user.verified:
                             tweet_score.append(0)
                         else:
                             tweet_score.append(1)
 
-                    if synapse.get("is_quote") is not None:
-                        if synapse.get("is_quote") != val_tweet.is_quote_tweet:
+                    if constraints.is_quote is not None:
+                        if constraints.is_quote != val_tweet.is_quote_tweet:
                             tweet_score.append(0)
                         else:
                             tweet_score.append(1)
 
-                    if synapse.get("is_image") is not None:
+                    if constraints.is_image is not None:
                         has_image_media = any(
                             m.type == "photo" for m in val_tweet.media
                         )
 
-                        if synapse.get("is_image") != has_image_media:
+                        if constraints.is_image != has_image_media:
                             tweet_score.append(0)
                         else:
                             tweet_score.append(1)
 
-                    if synapse.get("is_video") is not None:
+                    if constraints.is_video is not None:
                         has_video_media = any(
                             m.type == "video" for m in val_tweet.media
                         )
 
-                        if synapse.get("is_video") != has_video_media:
+                        if constraints.is_video != has_video_media:
                             tweet_score.append(0)
                         else:
                             tweet_score.append(1)
@@ -525,33 +457,26 @@ class TwitterBasicSearchContentRelevanceModel(BaseRewardModel):
                         val_tweet.created_at, "%a %b %d %H:%M:%S %z %Y"
                     ).replace(tzinfo=pytz.UTC)
 
-                    if synapse.get("start_date") is not None:
-                        start_date = _parse_synapse_date(synapse.get("start_date"))
-
+                    if start_date is not None:
                         if tweet_date < start_date:
                             tweet_score.append(0)
                         else:
                             tweet_score.append(1)
 
-                    if synapse.get("end_date") is not None:
-                        end_date = _parse_synapse_date(synapse.get("end_date"))
-
+                    if end_date is not None:
                         if tweet_date > end_date:
                             tweet_score.append(0)
                         else:
                             tweet_score.append(1)
 
-                    if synapse.get("lang") is not None:
-                        if synapse.get("lang") != val_tweet.lang:
+                    if constraints.lang is not None:
+                        if constraints.lang != val_tweet.lang:
                             tweet_score.append(0)
                         else:
                             tweet_score.append(1)
 
-                    if synapse.get("blue_verified") is not None:
-                        if (
-                            synapse.get("blue_verified")
-                            != val_tweet.user.is_blue_verified
-                        ):
+                    if constraints.blue_verified is not None:
+                        if constraints.blue_verified != val_tweet.user.is_blue_verified:
                             tweet_score.append(0)
                         else:
                             tweet_score.append(1)
@@ -7,11 +7,7 @@ from typing import List
 import bittensor as bt
 import pytz
 
-from desearch.protocol import (
-    ScraperStreamingSynapse,
-    ScraperTextRole,
-    TwitterScraperTweet,
-)
+from desearch.protocol import ScraperStreamingSynapse, TwitterScraperTweet
 from desearch.services.twitter_api_wrapper import TwitterAPIClient
 from desearch.services.twitter_utils import TwitterUtils
 from desearch.utils import (
@@ -19,6 +15,7 @@ from desearch.utils import (
     format_text_for_match,
     is_valid_tweet,
     scrape_tweets_with_retries,
+    tweets_for_links,
 )
 from neurons.validators.base_validator import AbstractNeuron
 from neurons.validators.penalty.count_penalty import TWITTER_TOOL
@@ -27,8 +24,8 @@ from neurons.validators.utils.prompts import (
     TweetRelevancePrompt,
     build_tweet_relevance_messages,
 )
+from neurons.validators.utils.response_checks import response_links
 from neurons.validators.utils.source_bodies import (
-    cited_urls_normalized,
     sample_cited_and_uncited,
     tweet_relevance_text,
 )
@@ -96,8 +93,7 @@ class TwitterContentRelevanceModel(BaseRewardModel):
 
     @staticmethod
     def _sample_cited_and_other_tweets(response) -> List[str]:
-        summary = response.texts.get(ScraperTextRole.FINAL_SUMMARY.value, "")
-        cited_norm = cited_urls_normalized(summary)
+        cited_norm = response_links(response).cited
         urls = [
             tweet.get("url")
             for tweet in response.miner_tweets
@@ -138,14 +134,11 @@ class TwitterContentRelevanceModel(BaseRewardModel):
                 unique_links, group_size=200, max_attempts=4
             )
 
+            tweets_by_id = {tweet.id: tweet for tweet in tweets_list}
             for response, random_links in zip(responses, responses_random_links):
-                ids = [
-                    self.tw_client.utils.extract_tweet_id(link) for link in random_links
-                ]
-
-                for tweet in tweets_list:
-                    if tweet.id in ids:
-                        response.validator_tweets.append(tweet)
+                response.validator_tweets.extend(
+                    tweets_for_links(random_links, tweets_by_id)
+                )
 
             end_time = time.time()
             bt.logging.info(
@@ -7,7 +7,7 @@ import bittensor as bt
 
 from desearch.miner_config import LANES, lane_from_key, lane_key
 from neurons.validators.scoring.constants import DEFAULT_PER_UID, QUALITY_THRESHOLDS
-from neurons.validators.scoring import miner_db
+from neurons.validators.scoring import miner_db, public_snapshot
 
 QUALITY_EMA_ALPHA = 0.5
 
@@ -117,6 +117,7 @@ async def ramp_after_epoch(uids: list[int]) -> None:
     for key, updates in updates_by_lane.items():
         if updates:
             await miner_db.bulk_update_verified(key, updates)
+    await public_snapshot.mark_dirty()
 
     bt.logging.info(f"[Capacity] ramp_after_epoch: {passed}/{total} lanes passed gate")
 
@@ -134,6 +135,7 @@ async def note_call_result(uid: int, search_type, success: bool, mode=None) -> N
             if success:
                 recovered = await miner_db.record_call_success(uid, key)
                 if recovered:
+                    await public_snapshot.mark_dirty()
                     bt.logging.info(
                         f"[Capacity] uid={uid} {key} recovered from unreachable"
                     )
@@ -142,6 +144,7 @@ async def note_call_result(uid: int, search_type, success: bool, mode=None) -> N
                     uid, key, UNREACHABLE_FAILURE_THRESHOLD
                 )
                 if newly:
+                    await public_snapshot.mark_dirty()
                     if _router is not None:
                         _router.mark_unreachable(uid, search_type)
                     bt.logging.warning(
@@ -157,6 +160,7 @@ async def note_call_result(uid: int, search_type, success: bool, mode=None) -> N
 async def decay_unreachable_tick() -> None:
     """Apply 10% verified decay per elapsed 5-min interval for unreachable miners."""
     now = datetime.now(timezone.utc)
+    decayed = False
 
     for lane in LANES:
         search_type = lane_key(lane)
@@ -182,7 +186,11 @@ async def decay_unreachable_tick() -> None:
                 row["uid"], search_type, new_verified, new_last_decay
             )
             if new_verified != row["verified"]:
+                decayed = True
                 bt.logging.info(
                     f"[Capacity] unreachable uid={row['uid']} {search_type}: "
                     f"verified {row['verified']}->{new_verified} ({ticks} ticks)"
                 )
+
+    if decayed:
+        await public_snapshot.mark_dirty()
@@ -573,3 +573,26 @@ async def get_windows_for_hotkey(
             (hotkey, search_type, cutoff),
         )
         return [dict(row) async for row in cursor]
+
+
+async def get_windows_since(since_hours: int = 72) -> dict[str, dict[str, list[dict]]]:
+    """Every scoring window of the last ``since_hours`` in one query, as
+    ``{hotkey: {search_type: [window, ...]}}`` ordered by ``window_start``."""
+    cutoff = (datetime.now(timezone.utc) - timedelta(hours=since_hours)).isoformat()
+    windows: dict[str, dict[str, list[dict]]] = {}
+    async with _conn() as db:
+        cursor = await db.execute(
+            """
+            SELECT hotkey, search_type, window_start, quality_score, passed,
+                   verified_concurrency, created_at
+            FROM scoring_windows
+            WHERE created_at >= ?
+            ORDER BY hotkey, search_type, window_start ASC
+            """,
+            (cutoff,),
+        )
+        async for row in cursor:
+            windows.setdefault(row["hotkey"], {}).setdefault(
+                row["search_type"], []
+            ).append(dict(row))
+    return windows
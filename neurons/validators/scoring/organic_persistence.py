@@ -0,0 +1,186 @@
+"""
+Background persistence of organic responses, off the API request path.
+
+Serving an organic search only enqueues the final synapse. A single worker
+drains the queue in batches, builds the utility-API log entries and the
+jsonpickle payloads in a worker thread, writes every scoring payload of the
+batch in one Redis pipeline and hands the batch's logs to the log shipper.
+
+The queue is bounded. Above ``HIGH_WATERMARK`` of capacity only a
+``PRESSURE_SAMPLE_RATE`` fraction of new responses is kept, and when it is
+full new responses are dropped; both are counted in ``stats()``.
+"""
+
+import asyncio
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import bittensor as bt
+
+from neurons.validators.clients.miner_response_logger import (
+    build_log_entry,
+    submit_logs_best_effort,
+)
+from neurons.validators.scoring.scoring_store import ScoringStore
+
+MAX_PENDING = 2000
+BATCH_SIZE = 50
+HIGH_WATERMARK = 0.75
+PRESSURE_SAMPLE_RATE = 0.25
+DRAIN_TIMEOUT_SECONDS = 10
+
+
+@dataclass
+class OrganicJob:
+    log_search_type: str
+    response: Any
+    miner_uid: Optional[int]
+    axon: Any
+    hour_bucket: datetime
+    # Scoring store search type; None when the response is only logged.
+    scoring_search_type: Optional[str] = None
+
+
+class OrganicPersistence:
+    def __init__(
+        self,
+        owner,
+        scoring_store: Optional[ScoringStore],
+        max_pending: int = MAX_PENDING,
+        batch_size: int = BATCH_SIZE,
+    ) -> None:
+        self.owner = owner
+        self.scoring_store = scoring_store
+        self.batch_size = batch_size
+        self._queue: asyncio.Queue[OrganicJob] = asyncio.Queue(maxsize=max_pending)
+        self._worker: Optional[asyncio.Task] = None
+
+        self.enqueued = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self.written = 0
+        self.failed_batches = 0
+
+    def start(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Give queued responses ``DRAIN_TIMEOUT_SECONDS`` to flush, then stop."""
+        if self._worker is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), DRAIN_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            bt.logging.warning(
+                f"[OrganicPersistence] stopping with {self._queue.qsize()} unsaved"
+            )
+        self._worker.cancel()
+        self._worker = None
+
+    def submit(
+        self,
+        log_search_type: str,
+        response,
+        miner_uid: Optional[int],
+        axon,
+        scoring_search_type: Optional[str] = None,
+    ) -> bool:
+        """Queue one organic response; ``False`` if shed under pressure."""
+        capacity = self._queue.maxsize
+        if self._queue.full():
+            self.dropped += 1
+            return False
+        if (
+            self._queue.qsize() >= capacity * HIGH_WATERMARK
+            and random.random() >= PRESSURE_SAMPLE_RATE
+        ):
+            self.sampled_out += 1
+            return False
+
+        self._queue.put_nowait(
+            OrganicJob(
+                log_search_type=log_search_type,
+                response=response,
+                miner_uid=miner_uid,
+                axon=axon,
+                hour_bucket=datetime.now(timezone.utc).replace(
+                    minute=0, second=0, microsecond=0
+                ),
+                scoring_search_type=scoring_search_type,
+            )
+        )
+        self.enqueued += 1
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "depth": self._queue.qsize(),
+            "capacity": self._queue.maxsize,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "failed_batches": self.failed_batches,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                await self._write(batch)
+                self.written += len(batch)
+            except Exception as e:
+                self.failed_batches += 1
+                bt.logging.error(
+                    f"[OrganicPersistence] batch of {len(batch)} failed: {e}"
+                )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write(self, batch: list[OrganicJob]) -> None:
+        logs, records = await asyncio.to_thread(self._serialize, batch)
+
+        if records and self.scoring_store is not None:
+            await self.scoring_store.save_encoded(records)
+        submit_logs_best_effort(self.owner, logs)
+
+    def _serialize(self, batch: list[OrganicJob]) -> tuple[list, list]:
+        logs, records = [], []
+        for job in batch:
+            try:
+                logs.append(
+                    build_log_entry(
+                        owner=self.owner,
+                        search_type=job.log_search_type,
+                        query_kind="organic",
+                        response=job.response,
+                        miner_uid=job.miner_uid,
+                        miner_hotkey=getattr(job.axon, "hotkey", None),
+                        miner_coldkey=getattr(job.axon, "coldkey", None),
+                    )
+                )
+                if job.scoring_search_type is not None and job.miner_uid is not None:
+                    records.append(
+                        (
+                            job.hour_bucket,
+                            "organic",
+                            job.miner_uid,
+                            job.scoring_search_type,
+                            ScoringStore.encode(job.response),
+                        )
+                    )
+            except Exception as e:
+                bt.logging.warning(
+                    f"[OrganicPersistence] serialize failed uid={job.miner_uid}: {e}"
+                )
+        return logs, records
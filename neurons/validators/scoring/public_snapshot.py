@@ -0,0 +1,258 @@
+"""
+Pre-serialized public miner state served by ``/public/miners``.
+
+The validator service rebuilds the snapshot whenever ramping or an
+unreachable transition marks it dirty (and at least every
+``REFRESH_SECONDS`` so latency stays current). One build reads every
+visible row and every 72h scoring window in two queries, renders the list
+body and one detail body per hotkey, and stores them gzipped with a content
+ETag in Redis in a single transaction. API workers answer from there with
+one round trip instead of querying SQLite per request.
+
+Dirty marks go through Redis because unreachable transitions are also
+recorded by API workers.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import bittensor as bt
+
+from desearch.miner_config import LANES, SearchType, lane_key
+from desearch.redis.redis_client import redis_bytes_client, redis_client
+from neurons.validators.proxy import latency
+from neurons.validators.scoring import miner_db
+
+# Bump when the stored layout changes so old and new workers never share keys.
+SNAPSHOT_VERSION = 1
+KEY_PREFIX = f"public_miners:v{SNAPSHOT_VERSION}"
+LIST_KEY = f"{KEY_PREFIX}:list"
+DETAIL_ETAG_KEY = f"{KEY_PREFIX}:detail:etag"
+DETAIL_BODY_KEY = f"{KEY_PREFIX}:detail:gzip"
+DIRTY_KEY = f"{KEY_PREFIX}:dirty"
+
+WINDOW_HOURS = 72
+POLL_SECONDS = 5
+REFRESH_SECONDS = 60
+
+AI_MODES = [lane[1] for lane in LANES if lane[0] == SearchType.AI_SEARCH]
+
+
+@dataclass(frozen=True)
+class SnapshotEntry:
+    etag: str
+    body: bytes
+    built_at: float
+
+    def age(self) -> int:
+        return max(0, int(time.time() - self.built_at))
+
+
+def _empty_miner_state() -> dict:
+    return {
+        "verified": 1,
+        "declared": 0,
+        "quality_avg": 0.0,
+        "unreachable_since": None,
+    }
+
+
+def _miner_state_from_row(row: dict) -> dict:
+    return {
+        "verified": row["verified"],
+        "declared": row["declared"],
+        "quality_avg": row["quality_avg"],
+        "unreachable_since": row["unreachable_since"],
+    }
+
+
+def per_type_from_rows(
+    rows: list[dict], latency_by_key: Optional[dict[str, dict]] = None
+) -> dict:
+    by_key = {row["search_type"]: _miner_state_from_row(row) for row in rows}
+    for key, stats in (latency_by_key or {}).items():
+        if key in by_key:
+            by_key[key]["latency"] = stats
+
+    modes = {
+        mode.value: by_key.get(
+            lane_key((SearchType.AI_SEARCH, mode)), _empty_miner_state()
+        )
+        for mode in AI_MODES
+    }
+
+    x_key = lane_key((SearchType.X_SEARCH, None))
+    return {
+        SearchType.AI_SEARCH.value: {"modes": modes},
+        x_key: by_key.get(x_key, _empty_miner_state()),
+    }
+
+
+def _window_out(row: dict) -> dict:
+    return {
+        "window_start": row["window_start"],
+        "quality_score": row["quality_score"],
+        "passed": bool(row["passed"]),
+        "verified_concurrency": row["verified_concurrency"],
+    }
+
+
+def windows_by_lane(windows_by_key: dict[str, list[dict]]) -> dict:
+    """Per-lane window rows in the public ``windows`` layout."""
+    return {
+        SearchType.AI_SEARCH.value: {
+            mode.value: [
+                _window_out(w)
+                for w in windows_by_key.get(lane_key((SearchType.AI_SEARCH, mode)), [])
+            ]
+            for mode in AI_MODES
+        },
+        lane_key((SearchType.X_SEARCH, None)): [
+            _window_out(w)
+            for w in windows_by_key.get(lane_key((SearchType.X_SEARCH, None)), [])
+        ],
+    }
+
+
+async def latency_by_uid(uids: list[int]) -> dict[int, dict[str, dict]]:
+    """``{uid: {lane_key: {ewma, p90, samples}}}`` from the live latency model."""
+    result: dict[int, dict[str, dict]] = {}
+    for lane in LANES:
+        for uid, stats in (await latency.stats_for(lane, uids)).items():
+            result.setdefault(uid, {})[lane_key(lane)] = stats
+    return result
+
+
+def group_rows(rows: list[dict]) -> dict[str, list[dict]]:
+    rows_by_hotkey: dict[str, list] = {}
+    for row in rows:
+        rows_by_hotkey.setdefault(row["hotkey"], []).append(row)
+    return rows_by_hotkey
+
+
+def list_item(hotkey: str, rows: list[dict], latency_by_key) -> dict:
+    return {
+        "hotkey": hotkey,
+        "uid": rows[0]["uid"],
+        "coldkey": rows[0]["coldkey"],
+        "per_type": per_type_from_rows(rows, latency_by_key),
+    }
+
+
+def _without_none(value):
+    """Mirror ``response_model_exclude_none`` for the stored bodies."""
+    if isinstance(value, dict):
+        return {k: _without_none(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_without_none(v) for v in value]
+    return value
+
+
+def encode(payload: dict) -> tuple[str, bytes]:
+    """``(etag, gzipped body)``; the ETag only depends on the content."""
+    body = json.dumps(_without_none(payload), separators=(",", ":")).encode()
+    etag = f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+    return etag, gzip.compress(body, compresslevel=6, mtime=0)
+
+
+async def build(validator_identity: Optional[dict]) -> dict:
+    """Render the list body and every detail body from two queries."""
+    rows_by_hotkey = group_rows(await miner_db.get_all_rows())
+    windows = await miner_db.get_windows_since(WINDOW_HOURS)
+    latencies = await latency_by_uid(
+        sorted({rows[0]["uid"] for rows in rows_by_hotkey.values()})
+    )
+
+    validator = validator_identity or {}
+    items = []
+    details = {}
+    for hotkey, rows in rows_by_hotkey.items():
+        item = list_item(hotkey, rows, latencies.get(rows[0]["uid"]))
+        items.append(item)
+        miner = dict(item, windows=windows_by_lane(windows.get(hotkey, {})))
+        details[hotkey] = encode({"validator": validator, "miner": miner})
+
+    items.sort(key=lambda m: m["uid"])
+    return {
+        "list": encode({"validator": validator, "miners": items}),
+        "details": details,
+    }
+
+
+async def publish(validator_identity: Optional[dict]) -> int:
+    """Build and atomically replace the stored snapshot; returns miner count."""
+    snapshot = await build(validator_identity)
+    list_etag, list_body = snapshot["list"]
+    details = snapshot["details"]
+
+    pipeline = redis_bytes_client.pipeline(transaction=True)
+    pipeline.delete(LIST_KEY, DETAIL_ETAG_KEY, DETAIL_BODY_KEY)
+    pipeline.hset(
+        LIST_KEY,
+        mapping={"etag": list_etag, "gzip": list_body, "built_at": time.time()},
+    )
+    if details:
+        pipeline.hset(
+            DETAIL_ETAG_KEY,
+            mapping={hotkey: etag for hotkey, (etag, _) in details.items()},
+        )
+        pipeline.hset(
+            DETAIL_BODY_KEY,
+            mapping={hotkey: body for hotkey, (_, body) in details.items()},
+        )
+    await pipeline.execute()
+    return len(details)
+
+
+async def load_list() -> Optional[SnapshotEntry]:
+    etag, body, built_at = await redis_bytes_client.hmget(
+        LIST_KEY, "etag", "gzip", "built_at"
+    )
+    if etag is None or body is None:
+        return None
+    return SnapshotEntry(etag.decode(), body, float(built_at or 0))
+
+
+async def load_detail(hotkey: str) -> Optional[SnapshotEntry]:
+    pipeline = redis_bytes_client.pipeline(transaction=False)
+    pipeline.hget(LIST_KEY, "built_at")
+    pipeline.hget(DETAIL_ETAG_KEY, hotkey)
+    pipeline.hget(DETAIL_BODY_KEY, hotkey)
+    built_at, etag, body = await pipeline.execute()
+    if etag is None or body is None:
+        return None
+    return SnapshotEntry(etag.decode(), body, float(built_at or 0))
+
+
+async def mark_dirty() -> None:
+    try:
+        await redis_client.set(DIRTY_KEY, 1)
+    except Exception as e:
+        bt.logging.warning(f"[PublicSnapshot] mark_dirty failed: {e}")
+
+
+async def run(get_validator_identity, should_exit) -> None:
+    """Validator-service loop: rebuild when dirty, and every
+    ``REFRESH_SECONDS`` regardless."""
+    last_built = float("-inf")
+    while not should_exit():
+        try:
+            # DEL reports whether the mark existed, so checking and clearing
+            # it is one atomic step.
+            dirty = await redis_client.delete(DIRTY_KEY)
+            if dirty or time.monotonic() - last_built >= REFRESH_SECONDS:
+                started = time.perf_counter()
+                count = await publish(get_validator_identity())
+                last_built = time.monotonic()
+                bt.logging.debug(
+                    f"[PublicSnapshot] published {count} miners in "
+                    f"{time.perf_counter() - started:.2f}s"
+                )
+        except Exception as e:
+            bt.logging.error(f"[PublicSnapshot] rebuild failed: {e}")
+        await asyncio.sleep(POLL_SECONDS)
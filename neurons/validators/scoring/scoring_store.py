@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from uuid import uuid4
 
 import jsonpickle
@@ -29,6 +29,22 @@ class ScoringStore:
         unix_ts = int(time_range_start.timestamp())
         return f"{self.KEY_PREFIX}:{unix_ts}:{kind}:{search_type}"
 
+    @staticmethod
+    def encode(response: Any) -> str:
+        return jsonpickle.encode(response)
+
+    async def save_encoded(
+        self, records: List[Tuple[datetime, str, int, str, str]]
+    ) -> None:
+        """Write pre-encoded ``(time_range_start, kind, uid, search_type, data)``
+        records in one pipeline."""
+        pipeline = redis_client.pipeline()
+        for time_range_start, kind, uid, search_type, data in records:
+            key = self._key(time_range_start, kind, search_type)
+            pipeline.hset(key, f"{uid}:{uuid4().hex[:8]}", data)
+            pipeline.expire(key, EXPIRY)
+        await pipeline.execute()
+
     async def _save(
         self,
         time_range_start: datetime,
@@ -37,13 +53,9 @@ class ScoringStore:
         search_type: str,
         response: Any,
     ) -> None:
-        key = self._key(time_range_start, kind, search_type)
-        field = f"{uid}:{uuid4().hex[:8]}"
-        data = jsonpickle.encode(response)
-        pipeline = redis_client.pipeline()
-        pipeline.hset(key, field, data)
-        pipeline.expire(key, EXPIRY)
-        await pipeline.execute()
+        await self.save_encoded(
+            [(time_range_start, kind, uid, search_type, self.encode(response))]
+        )
 
     async def save_synthetic(
         self,
@@ -1,4 +1,5 @@
 import time
+from contextlib import aclosing
 from typing import List, Optional
 
 import bittensor as bt
@@ -19,10 +20,6 @@ from desearch.protocol import (
 from desearch.stream import collect_final_synapses
 from desearch.utils import get_max_execution_time, get_mode_serving_budget
 from neurons.validators.base_validator import AbstractNeuron
-from neurons.validators.clients.miner_response_logger import (
-    build_log_entry,
-    submit_logs_best_effort,
-)
 from neurons.validators.penalty.count_penalty import CountPenaltyModel, TWITTER_TOOL
 from neurons.validators.penalty.date_range_penalty import DateRangePenaltyModel
 from neurons.validators.penalty.domain_filter_penalty import DomainFilterPenaltyModel
@@ -38,6 +35,8 @@ from neurons.validators.penalty.summary_structure_penalty import (
     SummaryStructurePenaltyModel,
 )
 from neurons.validators.penalty.timeout_penalty import TimeoutPenaltyModel
+from neurons.validators.proxy import inflight, latency
+from neurons.validators.proxy.hedging import HedgedStream
 from neurons.validators.reward import RewardModelType, RewardScoringType
 from neurons.validators.reward.performance_reward import (
     AI_PERF_FLOOR,
@@ -125,20 +124,24 @@ class AdvancedScraperValidator(BaseScraperValidator):
         timeout: float,
     ):
         """Wrap ``dendrite.call_stream`` so chunks flow through to the caller
-        and per-call success is recorded once the stream ends."""
+        and per-call success is recorded once the stream ends. The stream is
+        counted as in flight until it ends or the caller abandons it."""
         dendrite = next(self.neuron.dendrites)
         final_synapse = None
         success = False
+        lane = self.lane_for_synapse(synapse)
+        started = time.monotonic()
         try:
-            async for value in dendrite.call_stream(
-                target_axon=axon,
-                synapse=synapse,
-                timeout=timeout,
-                deserialize=False,
-            ):
-                if isinstance(value, bt.Synapse):
-                    final_synapse = value
-                yield value
+            async with inflight.track(uid, lane, timeout):
+                async for value in dendrite.call_stream(
+                    target_axon=axon,
+                    synapse=synapse,
+                    timeout=timeout,
+                    deserialize=False,
+                ):
+                    if isinstance(value, bt.Synapse):
+                        final_synapse = value
+                    yield value
             status = getattr(
                 getattr(final_synapse, "dendrite", None), "status_code", None
             )
@@ -148,6 +151,9 @@ class AdvancedScraperValidator(BaseScraperValidator):
                 f"[{self.search_type}] dendrite stream failed uid={uid}: {e}"
             )
 
+        # Failures count as the full timeout, as in ``_dendrite_call``.
+        elapsed = time.monotonic() - started if success else timeout
+        await latency.record(uid, lane, elapsed)
         await capacity.note_call_result(
             uid, self.search_type, success, mode=getattr(synapse, "mode", None)
         )
@@ -178,6 +184,7 @@ class AdvancedScraperValidator(BaseScraperValidator):
         )
 
         start_time = time.time()
+        pinned_uid = uid
 
         uid, axon = await self.neuron.get_random_miner(
             uid=uid,
@@ -220,6 +227,8 @@ class AdvancedScraperValidator(BaseScraperValidator):
             exclude_domains=exclude_domains or [],
         )
 
+        synapse.stream_decoded()
+
         async_response = self._dendrite_stream(
             synapse.model_copy(),
             axon,
@@ -227,8 +236,47 @@ class AdvancedScraperValidator(BaseScraperValidator):
             timeout=max_execution_time + 5,
         )
 
+        if pinned_uid is None and self._hedging_enabled(mode):
+            async_response = HedgedStream(
+                uid,
+                axon,
+                async_response,
+                launch_secondary=lambda: self._launch_hedge(
+                    synapse, uid, timeout=max_execution_time + 5
+                ),
+                search_type=self.search_type,
+                mode=mode,
+                quantile=self.neuron.config.neuron.hedge_quantile,
+            )
+
         return async_response, uids, start_time, axon
 
+    def _hedging_enabled(self, mode) -> bool:
+        if not getattr(self.neuron.config.neuron, "organic_hedging", False):
+            return False
+        return bool(mode) and SearchMode(mode) == SearchMode.FAST
+
+    async def _launch_hedge(
+        self, synapse: ScraperStreamingSynapse, primary_uid: int, timeout: float
+    ):
+        """Pick a second miner for a hedged call; ``None`` if routing only
+        offers the primary again or fails."""
+        for _ in range(2):
+            try:
+                uid, axon = await self.neuron.get_random_miner(
+                    search_type=self.search_type,
+                    mode=getattr(synapse.mode, "value", synapse.mode),
+                )
+            except Exception as e:
+                bt.logging.warning(f"[Hedging] no secondary miner: {e}")
+                return None
+            if uid != primary_uid:
+                stream = self._dendrite_stream(
+                    synapse.model_copy(), axon, uid, timeout=timeout
+                )
+                return uid, axon, stream
+        return None
+
     def get_penalty_additional_params(self, val_score_responses_list):
         val_scores = []
         for val_score_responses, reward_function in zip(
@@ -312,7 +360,7 @@ class AdvancedScraperValidator(BaseScraperValidator):
         axon = self.neuron.metagraph.axons[uid]
         final_synapse = None
         async for value in self._dendrite_stream(
-            synapse,
+            synapse.stream_decoded(),
             axon,
             uid,
             timeout=max_execution_time + 5,
@@ -377,59 +425,33 @@ class AdvancedScraperValidator(BaseScraperValidator):
                 final_synapses = await collect_final_synapses(
                     [async_response], uids, start_time
                 )
+                selected_uid = getattr(async_response, "uid", selected_uid)
+                axon = getattr(async_response, "axon", axon)
 
-                if final_synapses:
-                    submit_logs_best_effort(
-                        self.neuron,
-                        [
-                            build_log_entry(
-                                owner=self.neuron,
-                                search_type="ai_search",
-                                query_kind="organic",
-                                response=synapse,
-                                miner_uid=selected_uid,
-                                miner_hotkey=getattr(axon, "hotkey", None),
-                                miner_coldkey=getattr(axon, "coldkey", None),
-                            )
-                            for synapse in final_synapses
-                            if synapse is not None
-                        ],
-                    )
-                    for synapse in final_synapses:
-                        if synapse is not None:
-                            await self._save_organic_for_scoring(
-                                uid=selected_uid, response=synapse
-                            )
+                await self._persist_organic(
+                    [synapse for synapse in final_synapses if synapse is not None],
+                    selected_uid,
+                    axon,
+                )
 
                 for synapse in final_synapses:
                     yield synapse
             else:
-                # Stream miner response to the UI
+                # Stream miner response to the UI. Close the miner stream as
+                # soon as the caller closes this one rather than on GC.
                 final_synapse = None
-                async for value in async_response:
-                    if isinstance(value, bt.Synapse):
-                        final_synapse = value
-                    else:
-                        yield value
+                async with aclosing(aiter(async_response)) as stream:
+                    async for value in stream:
+                        if isinstance(value, bt.Synapse):
+                            final_synapse = value
+                        else:
+                            yield value
+
+                selected_uid = getattr(async_response, "uid", selected_uid)
+                axon = getattr(async_response, "axon", axon)
 
                 if final_synapse is not None:
-                    submit_logs_best_effort(
-                        self.neuron,
-                        [
-                            build_log_entry(
-                                owner=self.neuron,
-                                search_type="ai_search",
-                                query_kind="organic",
-                                response=final_synapse,
-                                miner_uid=selected_uid,
-                                miner_hotkey=getattr(axon, "hotkey", None),
-                                miner_coldkey=getattr(axon, "coldkey", None),
-                            )
-                        ],
-                    )
-                    await self._save_organic_for_scoring(
-                        uid=selected_uid, response=final_synapse
-                    )
+                    await self._persist_organic([final_synapse], selected_uid, axon)
         except Exception as e:
             bt.logging.error(f"Error in organic: {e}")
             raise e
@@ -1,17 +1,21 @@
 import time
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional
 
 import bittensor as bt
 import numpy as np
 import wandb
 
+from desearch.miner_config import Lane, SearchType
 from neurons.validators.base_validator import AbstractNeuron
 from neurons.validators.clients.miner_response_logger import (
+    RewardBatch,
     build_log_entry,
     build_reward_payload,
     submit_logs_best_effort,
 )
+from neurons.validators.proxy import inflight, latency
+from neurons.validators.proxy.uid_manager import UIDManager
 from neurons.validators.reward.performance_reward import perf_floor_for
 from neurons.validators.reward.reward import log_reward_aggregates
 from neurons.validators.scoring import capacity
@@ -82,19 +86,29 @@ class BaseScraperValidator:
 
         return rewards
 
+    def lane_for_synapse(self, synapse) -> Lane:
+        return UIDManager.lane_for(
+            SearchType(self.search_type), getattr(synapse, "mode", None)
+        )
+
     async def _dendrite_call(self, axon, synapse, uid: int):
         """Send a non-streaming synapse to a miner axon via dendrite. Tracks
-        per-call success so consecutive failures flag the miner unreachable."""
+        per-call success so consecutive failures flag the miner unreachable,
+        and counts the call as in flight against the miner's lane capacity."""
         dendrite = next(self.neuron.dendrites)
         success = False
+        timeout = synapse.max_execution_time + 5
+        lane = self.lane_for_synapse(synapse)
+        started = time.monotonic()
 
         try:
-            response = await dendrite.call(
-                target_axon=axon,
-                synapse=synapse,
-                timeout=synapse.max_execution_time + 5,
-                deserialize=False,
-            )
+            async with inflight.track(uid, lane, timeout):
+                response = await dendrite.call(
+                    target_axon=axon,
+                    synapse=synapse,
+                    timeout=timeout,
+                    deserialize=False,
+                )
             status = getattr(getattr(response, "dendrite", None), "status_code", None)
             success = status == 200
         except Exception as e:
@@ -103,6 +117,10 @@ class BaseScraperValidator:
             )
             response = synapse
 
+        # A failed call counts as the full timeout: an instant refusal must
+        # not make a broken miner look fast to routing.
+        elapsed = time.monotonic() - started if success else timeout
+        await latency.record(uid, lane, elapsed)
         await capacity.note_call_result(
             uid, self.search_type, success, mode=getattr(synapse, "mode", None)
         )
@@ -128,6 +146,55 @@ class BaseScraperValidator:
         except Exception as e:
             bt.logging.warning(f"[Organic] save_organic failed uid={uid}: {e}")
 
+    async def _persist_organic(
+        self,
+        responses: list,
+        miner_uid: int,
+        axon,
+        log_search_type: Optional[str] = None,
+        save_for_scoring: bool = True,
+    ) -> None:
+        """Log organic responses to the utility API and keep successful ones
+        for scoring. Goes through the neuron's background pipeline when it
+        has one, so the request does not wait on serialization or I/O."""
+        log_search_type = log_search_type or self.search_type
+        persistence = getattr(self.neuron, "organic_persistence", None)
+
+        if persistence is not None:
+            for response in responses:
+                keep = (
+                    save_for_scoring
+                    and miner_uid is not None
+                    and self.dendrite_succeeded(response)
+                )
+                persistence.submit(
+                    log_search_type,
+                    response,
+                    miner_uid,
+                    axon,
+                    scoring_search_type=self.search_type if keep else None,
+                )
+            return
+
+        submit_logs_best_effort(
+            self.neuron,
+            [
+                build_log_entry(
+                    owner=self.neuron,
+                    search_type=log_search_type,
+                    query_kind="organic",
+                    response=response,
+                    miner_uid=miner_uid,
+                    miner_hotkey=getattr(axon, "hotkey", None),
+                    miner_coldkey=getattr(axon, "coldkey", None),
+                )
+                for response in responses
+            ],
+        )
+        if save_for_scoring:
+            for response in responses:
+                await self._save_organic_for_scoring(uid=miner_uid, response=response)
+
     def get_penalty_additional_params(self, val_score_responses_list):
         """Override in subclasses that need to pass additional params to penalties (e.g. val_scores)."""
         return None
@@ -300,6 +367,9 @@ class BaseScraperValidator:
 
             scoring_logs = []
             response_count = len(responses)
+            reward_batch = RewardBatch.serialize(
+                all_rewards, all_original_rewards, val_score_responses_list, event
+            )
 
             for index, (uid_tensor, response, reward) in enumerate(
                 zip(uids, responses, rewards.tolist())
@@ -311,10 +381,7 @@ class BaseScraperValidator:
                     index=index,
                     uid=uid,
                     total_reward=reward,
-                    all_rewards=all_rewards,
-                    all_original_rewards=all_original_rewards,
-                    validator_scores=val_score_responses_list,
-                    event=event,
+                    batch=reward_batch,
                 )
                 scoring_logs.append(
                     build_log_entry(
@@ -9,10 +9,6 @@ from desearch.protocol import (
     TwitterURLsSearchSynapse,
 )
 from neurons.validators.base_validator import AbstractNeuron
-from neurons.validators.clients.miner_response_logger import (
-    build_log_entry,
-    submit_logs_best_effort,
-)
 from neurons.validators.penalty.count_penalty import CountPenaltyModel
 from neurons.validators.penalty.date_range_penalty import DateRangePenaltyModel
 from neurons.validators.penalty.duplicate_results_penalty import (
@@ -139,15 +135,7 @@ class XScraperValidator(BaseScraperValidator):
             )
 
             if response:
-                self._save_organic_log(
-                    response=response,
-                    miner_uid=selected_uid,
-                    axon=axon,
-                    search_type="x_search",
-                )
-                await self._save_organic_for_scoring(
-                    uid=selected_uid, response=response
-                )
+                await self._persist_organic([response], selected_uid, axon)
                 yield response
             else:
                 bt.logging.warning("Invalid response for UID: Unknown")
@@ -174,11 +162,12 @@ class XScraperValidator(BaseScraperValidator):
 
             response = await self._dendrite_call(axon, synapse, uid)
 
-            self._save_organic_log(
-                response=response,
-                miner_uid=uid,
-                axon=axon,
-                search_type="x_post_by_id",
+            await self._persist_organic(
+                [response],
+                uid,
+                axon,
+                log_search_type="x_post_by_id",
+                save_for_scoring=False,
             )
 
             return response.results
@@ -206,32 +195,15 @@ class XScraperValidator(BaseScraperValidator):
 
             response = await self._dendrite_call(axon, synapse, uid)
 
-            self._save_organic_log(
-                response=response,
-                miner_uid=uid,
-                axon=axon,
-                search_type="x_posts_by_urls",
+            await self._persist_organic(
+                [response],
+                uid,
+                axon,
+                log_search_type="x_posts_by_urls",
+                save_for_scoring=False,
             )
 
             return response.results
         except Exception as e:
             bt.logging.error(f"Error in URLs search: {e}")
             raise e
-
-    def _save_organic_log(
-        self, response, miner_uid: int, axon, search_type: str
-    ) -> None:
-        submit_logs_best_effort(
-            self.neuron,
-            [
-                build_log_entry(
-                    owner=self.neuron,
-                    search_type=search_type,
-                    query_kind="organic",
-                    response=response,
-                    miner_uid=miner_uid,
-                    miner_hotkey=getattr(axon, "hotkey", None),
-                    miner_coldkey=getattr(axon, "coldkey", None),
-                )
-            ],
-        )
@@ -0,0 +1,195 @@
+"""
+Event-loop lag sampling and stall attribution for the validator processes.
+
+A sampler task sleeps ``interval`` seconds and records how late it wakes up;
+that lateness is the time some other callback held the loop. A watchdog
+thread notices when the sampler has not woken up for ``stall_threshold``
+past its deadline and, while the loop is still blocked, captures the task
+holding it and the innermost frames of the loop thread. When the sampler
+finally runs, the stall is logged with that stack snippet and counted
+against the task in ``stats()``. Stalls the watchdog did not see in
+progress, such as a run of short callbacks, are counted as unattributed.
+"""
+
+import asyncio
+import re
+import sys
+import threading
+import time
+import traceback
+from collections import defaultdict, deque
+from typing import Optional
+
+import bittensor as bt
+
+SAMPLE_INTERVAL_SECONDS = 0.1
+STALL_THRESHOLD_SECONDS = 0.25
+WINDOW_SAMPLES = 3000
+STACK_FRAMES = 8
+TOP_OWNERS = 10
+
+UNATTRIBUTED = "<unattributed>"
+CALLBACK = "<callback>"
+
+_DEFAULT_TASK_NAME = re.compile(r"^Task-\d+$")
+
+
+def task_label(task: Optional[asyncio.Task]) -> str:
+    """The task's explicit name, else its coroutine's qualified name."""
+    if task is None:
+        return CALLBACK
+    name = task.get_name()
+    if not _DEFAULT_TASK_NAME.match(name):
+        return name
+    coro = task.get_coro()
+    return getattr(coro, "__qualname__", None) or name
+
+
+class LoopMonitor:
+    def __init__(
+        self,
+        name: str,
+        interval: float = SAMPLE_INTERVAL_SECONDS,
+        stall_threshold: float = STALL_THRESHOLD_SECONDS,
+        window: int = WINDOW_SAMPLES,
+        stack_frames: int = STACK_FRAMES,
+    ) -> None:
+        self.name = name
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self.stack_frames = stack_frames
+        self._lags: deque[float] = deque(maxlen=window)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._sampler: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+        # Written by the sampler, read by the watchdog.
+        self._deadline = 0.0
+        # Written by the watchdog while a stall is in progress.
+        self._capture: Optional[tuple[float, str, str]] = None
+
+        self.samples = 0
+        self.stalls = 0
+        self.stalled_seconds = 0.0
+        self.max_lag = 0.0
+        self._owners: dict[str, list] = defaultdict(lambda: [0, 0.0, 0.0])
+        self.last_stall: Optional[dict] = None
+
+    def start(self) -> None:
+        """Start sampling the running loop; a no-op when already running."""
+        if self._sampler is not None and not self._sampler.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._deadline = time.monotonic() + self.interval
+        self._stopped.clear()
+        self._sampler = self._loop.create_task(
+            self._sample(), name=f"loop-monitor:{self.name}"
+        )
+        self._watchdog = threading.Thread(
+            target=self._watch, name=f"loop-watchdog:{self.name}", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._sampler is not None:
+            self._sampler.cancel()
+            self._sampler = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join, self.interval * 2)
+            self._watchdog = None
+
+    async def _sample(self) -> None:
+        while True:
+            self._deadline = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, time.monotonic() - self._deadline))
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.interval):
+            deadline = self._deadline
+            if time.monotonic() - deadline < self.stall_threshold:
+                continue
+            if self._capture is not None and self._capture[0] == deadline:
+                continue
+            try:
+                self._capture = (deadline, *self._inspect_loop())
+            except Exception as e:
+                bt.logging.debug(f"[LoopMonitor] {self.name} capture failed: {e}")
+
+    def _inspect_loop(self) -> tuple[str, str]:
+        """Label and stack snippet of whatever is running on the loop thread."""
+        owner = task_label(asyncio.current_task(self._loop))
+        frame = sys._current_frames().get(self._loop_thread)
+        stack = (
+            "".join(traceback.format_stack(frame, limit=self.stack_frames))
+            if frame is not None
+            else ""
+        )
+        return owner, stack
+
+    def record(self, lag: float) -> None:
+        """Account one sampler wake-up that came ``lag`` seconds late."""
+        self.samples += 1
+        self._lags.append(lag)
+        self.max_lag = max(self.max_lag, lag)
+        if lag < self.stall_threshold:
+            return
+
+        capture, self._capture = self._capture, None
+        if capture is not None and capture[0] == self._deadline:
+            _, owner, stack = capture
+        else:
+            owner, stack = UNATTRIBUTED, ""
+
+        self.stalls += 1
+        self.stalled_seconds += lag
+        counts = self._owners[owner]
+        counts[0] += 1
+        counts[1] += lag
+        counts[2] = max(counts[2], lag)
+        self.last_stall = {
+            "owner": owner,
+            "lag_ms": round(lag * 1000, 1),
+            "at": time.time(),
+        }
+
+        message = (
+            f"[LoopMonitor] {self.name} loop blocked {lag * 1000:.0f} ms by {owner}"
+        )
+        bt.logging.warning(f"{message}\n{stack}" if stack else message)
+
+    def stats(self) -> dict:
+        ordered = sorted(self._lags)
+
+        def quantile_ms(q: float) -> float:
+            if not ordered:
+                return 0.0
+            return round(
+                ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 2
+            )
+
+        owners = sorted(self._owners.items(), key=lambda item: -item[1][1])
+        return {
+            "interval_ms": round(self.interval * 1000, 1),
+            "stall_threshold_ms": round(self.stall_threshold * 1000, 1),
+            "samples": self.samples,
+            "lag_p50_ms": quantile_ms(0.50),
+            "lag_p99_ms": quantile_ms(0.99),
+            "lag_max_ms": round(self.max_lag * 1000, 2),
+            "stalls": self.stalls,
+            "stalled_seconds": round(self.stalled_seconds, 3),
+            "stalls_by_owner": {
+                owner: {
+                    "stalls": count,
+                    "total_ms": round(total * 1000, 1),
+                    "max_ms": round(worst * 1000, 1),
+                }
+                for owner, (count, total, worst) in owners[:TOP_OWNERS]
+            },
+            "last_stall": self.last_stall,
+        }
@@ -1,8 +1,11 @@
 """Pure-code response checks shared between cheap penalties and deep reward models."""
 
 import re
+import sys
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import pytz
@@ -16,6 +19,10 @@ HEADER_BOLD_PATTERN = re.compile(r"\*\*[^*]+\*\*")
 AI_SEARCH_RESULT_FIELDS = ("search_results",)
 AI_ALL_RESULT_FIELDS = ("miner_tweets",) + AI_SEARCH_RESULT_FIELDS
 
+# Distinct raw URLs remembered by ``normalize_source_url`` and ``source_key``;
+# an epoch's responses carry a few tens of thousands.
+URL_CACHE_SIZE = 65536
+
 
 def extract_markdown_links(text: str) -> List[Tuple[str, str]]:
     """Returns list of (link_text, url) tuples from markdown."""
@@ -32,15 +39,17 @@ def check_markdown_structure(text: str) -> Tuple[bool, List[str]]:
     return len(issues) == 0, issues
 
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def normalize_source_url(url: str) -> str:
     """Normalize for comparison: lowercase, no www., no trailing slash. Scheme
-    and query string are kept — miner is accountable for matching those."""
+    and query string are kept — miner is accountable for matching those.
+    Memoized per raw URL; equal results are the same interned string."""
     url = (url or "").strip().lower()
     if url.startswith("https://www."):
         url = "https://" + url[len("https://www.") :]
     elif url.startswith("http://www."):
         url = "http://" + url[len("http://www.") :]
-    return url.removesuffix("/")
+    return sys.intern(url.removesuffix("/"))
 
 
 _TRACKING_PARAMS = frozenset(
@@ -74,8 +83,10 @@ def _is_tracking_param(key: str) -> bool:
     return key.startswith("utm_") or key in _TRACKING_PARAMS
 
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def source_key(url: str) -> str:
-    """Identity key for a URL: base + content query params, tracking params dropped."""
+    """Identity key for a URL: base + content query params, tracking params
+    dropped. Memoized and interned like ``normalize_source_url``."""
     parts = urlsplit(url or "")
     base = normalize_source_url(
         urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
@@ -85,23 +96,22 @@ def source_key(url: str) -> str:
         for k, v in parse_qsl(parts.query, keep_blank_values=True)
         if not _is_tracking_param(k)
     )
-    return f"{base}?{urlencode(kept)}" if kept else base
+    return sys.intern(f"{base}?{urlencode(kept)}") if kept else base
 
 
 def collect_summary_sources(response: ScraperStreamingSynapse) -> set:
     """Collect every URL the miner returned that a summary link could legitimately reference."""
     sources: set = set()
 
-    if response.miner_tweets:
-        for tweet in response.miner_tweets:
-            if not isinstance(tweet, dict):
-                continue
-            username = tweet.get("user", {}).get("username", "")
-            tweet_id = tweet.get("id", "")
-            if username and tweet_id:
-                sources.add(
-                    normalize_source_url(f"https://x.com/{username}/status/{tweet_id}")
-                )
+    for tweet in getattr(response, "miner_tweets", None) or []:
+        if not isinstance(tweet, dict):
+            continue
+        username = tweet.get("user", {}).get("username", "")
+        tweet_id = tweet.get("id", "")
+        if username and tweet_id:
+            sources.add(
+                normalize_source_url(f"https://x.com/{username}/status/{tweet_id}")
+            )
 
     for field in AI_SEARCH_RESULT_FIELDS:
         for result in getattr(response, field, []) or []:
@@ -116,19 +126,62 @@ def collect_summary_sources(response: ScraperStreamingSynapse) -> set:
     return sources
 
 
+@dataclass(frozen=True)
+class ResponseLinks:
+    """Link sets of one response's final summary, see ``response_links``."""
+
+    # Markdown link targets in the final summary, in order, repeats kept.
+    summary: Tuple[str, ...]
+    # ``summary`` normalized.
+    cited: FrozenSet[str]
+    # ``collect_summary_sources``: what a summary link may point at.
+    sources: FrozenSet[str]
+
+    @property
+    def verified(self) -> int:
+        return sum(
+            1 for link in self.summary if normalize_source_url(link) in self.sources
+        )
+
+
+def _links_fingerprint(response) -> tuple:
+    chunks = (getattr(response, "text_chunks", None) or {}).get(
+        ScraperTextRole.FINAL_SUMMARY.value
+    )
+    return (
+        id(chunks),
+        len(chunks or ()),
+        len(getattr(response, "search_results", None) or ()),
+        len(getattr(response, "miner_tweets", None) or ()),
+    )
+
+
+def response_links(response: ScraperStreamingSynapse) -> ResponseLinks:
+    """The response's ``ResponseLinks``, computed on first use and kept on the
+    response for every later penalty and reward model. Recomputed if the
+    summary chunks or returned results have changed since."""
+    fingerprint = _links_fingerprint(response)
+    cached = getattr(response, "_response_links", None)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    summary_text = (response.texts or {}).get(ScraperTextRole.FINAL_SUMMARY.value, "")
+    summary = tuple(url for _, url in extract_markdown_links(summary_text))
+    links = ResponseLinks(
+        summary=summary,
+        cited=frozenset(map(normalize_source_url, summary)),
+        sources=frozenset(collect_summary_sources(response)),
+    )
+    response._response_links = (fingerprint, links)
+    return links
+
+
 def verify_summary_links(response: ScraperStreamingSynapse) -> Tuple[int, int]:
     """Returns (verified_count, total_count) for markdown links in the final summary."""
-    summary = (
-        response.texts.get(ScraperTextRole.FINAL_SUMMARY.value, "")
-        if response.texts
-        else ""
-    )
-    links = [url for _, url in extract_markdown_links(summary)]
-    if not links:
+    links = response_links(response)
+    if not links.summary:
         return 0, 0
-    sources = collect_summary_sources(response)
-    verified = sum(1 for link in links if normalize_source_url(link) in sources)
-    return verified, len(links)
+    return links.verified, len(links.summary)
 
 
 def parse_tweet_date(value: str) -> Optional[datetime]:
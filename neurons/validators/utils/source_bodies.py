@@ -3,9 +3,9 @@
 import html
 import random
 import re
+from functools import lru_cache
 
 from neurons.validators.utils.response_checks import (
-    extract_markdown_links,
     normalize_source_url,
     source_key,
 )
@@ -15,14 +15,26 @@ _TWEET_ID = re.compile(r"/status/(\d+)")
 _NON_WORD = re.compile(r"\W+")
 
 
+# Normalized fetched bodies and miner texts kept for highlight checks. Each
+# is checked by both web relevance passes and shared by every response that
+# sampled the same link; the body fetcher warms it when a body arrives.
+NORMALIZED_TEXT_CACHE_SIZE = 2048
+
+
 def _normalize_for_match(text: str) -> str:
     """Casefold, unescape entities, drop non-word chars (Unicode-aware) for fuzzy containment."""
     return _NON_WORD.sub("", html.unescape(text or "").casefold())
 
 
+@lru_cache(maxsize=NORMALIZED_TEXT_CACHE_SIZE)
+def normalized_text(text: str) -> str:
+    """``_normalize_for_match`` of a page-sized text, memoized per text."""
+    return _normalize_for_match(text)
+
+
 def highlight_subset_of_body(highlights, body):
     """Return the subset of highlights actually present in body (normalized fuzzy containment)."""
-    normalized_body = _normalize_for_match(body)
+    normalized_body = normalized_text(body or "")
     if not normalized_body:
         return []
     verified = []
@@ -35,7 +47,7 @@ def highlight_subset_of_body(highlights, body):
 
 def highlights_in_order(highlights, body) -> bool:
     """True only if every highlight appears in body, in order and non-overlapping."""
-    normalized_body = _normalize_for_match(body)
+    normalized_body = normalized_text(body or "")
     if not normalized_body or not highlights:
         return False
     cursor = 0
@@ -50,21 +62,19 @@ def highlights_in_order(highlights, body) -> bool:
     return True
 
 
-def cited_urls_normalized(summary):
-    return {normalize_source_url(u) for _, u in extract_markdown_links(summary)}
-
-
 def sample_cited_and_uncited(urls, cited_norm, max_cited, max_total):
-    cited = [u for u in urls if normalize_source_url(u) in cited_norm]
-    other = [u for u in urls if normalize_source_url(u) not in cited_norm]
+    cited, other = [], []
+    for u in urls:
+        (cited if normalize_source_url(u) in cited_norm else other).append(u)
     picks = random.sample(cited, min(max_cited, len(cited)))
     if other:
         picks.append(random.choice(other))
-    while len(picks) < max_total:
-        pool = [u for u in urls if u not in picks]
-        if not pool:
-            break
-        picks.append(random.choice(pool))
+    picked = set(picks)
+    pool = [u for u in urls if u not in picked]
+    while len(picks) < max_total and pool:
+        pick = random.choice(pool)
+        picks.append(pick)
+        pool = [u for u in pool if u != pick]
     return picks
 
 
@@ -0,0 +1,105 @@
+import re
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Operator prefix for each value-carrying constraint. The value runs up to
+# the next space; only the first occurrence counts.
+_VALUE_OPERATORS = {
+    "user": "from:",
+    "min_likes": "min_faves:",
+    "min_retweets": "min_retweets:",
+    "min_replies": "min_replies:",
+    "start_date": "since:",
+    "end_date": "until:",
+    "lang": "lang:",
+}
+_INT_FIELDS = {"min_likes", "min_retweets", "min_replies"}
+
+_FLAG_OPERATORS = {
+    "verified": "filter:verified",
+    "blue_verified": "filter:blue_verified",
+    "is_quote": "filter:quote",
+    "is_image": "filter:images",
+    "is_video": "filter:videos",
+}
+
+_VALUE_RES = {
+    name: re.compile(re.escape(operator) + r"([^ ]*)")
+    for name, operator in _VALUE_OPERATORS.items()
+}
+
+PARSE_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class XQueryOperators:
+    """Constraints of an X search: the synapse filter fields, overridden by
+    operators written in the query. ``words`` are the lowercased query words
+    tweets are matched against."""
+
+    query: str = ""
+    words: Tuple[str, ...] = ("",)
+    sort: Optional[str] = None
+    user: Optional[str] = None
+    min_likes: Optional[int] = None
+    min_retweets: Optional[int] = None
+    min_replies: Optional[int] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    lang: Optional[str] = None
+    verified: Optional[bool] = None
+    blue_verified: Optional[bool] = None
+    is_quote: Optional[bool] = None
+    is_image: Optional[bool] = None
+    is_video: Optional[bool] = None
+
+
+# Constraint fields a synapse can also set directly.
+SYNAPSE_FIELDS = tuple(
+    f.name for f in fields(XQueryOperators) if f.name not in {"query", "words"}
+)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_x_query(query: str) -> XQueryOperators:
+    """Operators found in ``query``; constraints it does not mention stay ``None``."""
+    query = query or ""
+    lowered = query.strip().lower()
+    found = {}
+
+    for name, pattern in _VALUE_RES.items():
+        match = pattern.search(lowered)
+        if match is None:
+            continue
+        value = match.group(1).strip()
+        if name in _INT_FIELDS:
+            try:
+                value = int(value)
+            except ValueError:
+                continue
+        found[name] = value
+
+    for name, operator in _FLAG_OPERATORS.items():
+        if operator in lowered:
+            found[name] = True
+
+    return XQueryOperators(query=query, words=tuple(lowered.split(" ")), **found)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _with_defaults(query: str, defaults: Tuple) -> XQueryOperators:
+    parsed = parse_x_query(query)
+    missing = {
+        name: value
+        for name, value in zip(SYNAPSE_FIELDS, defaults)
+        if getattr(parsed, name) is None
+    }
+    return replace(parsed, **missing)
+
+
+def x_search_constraints(synapse) -> XQueryOperators:
+    """Constraints of a ``TwitterSearchSynapse``; memoized per query and
+    field values, so every reward and penalty can call it freely."""
+    defaults = tuple(getattr(synapse, name, None) for name in SYNAPSE_FIELDS)
+    return _with_defaults(synapse.query or "", defaults)
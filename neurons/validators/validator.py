@@ -25,11 +25,16 @@ from desearch.redis.utils import (
 )
 from desearch.utils import resync_metagraph
 from neurons.validators import env
+from neurons.validators.apify.extract_pool import (
+    close_extract_pool,
+    get_extract_pool,
+)
 from neurons.validators.base_validator import AbstractNeuron
+from neurons.validators.clients.log_shipper import LogShipper, LogSpool
 from neurons.validators.clients.utility_api_client import UtilityAPIClient
 from neurons.validators.config import add_args, check_config, config
 from neurons.validators.proxy.uid_manager import UIDManager
-from neurons.validators.scoring import capacity, miner_db
+from neurons.validators.scoring import capacity, miner_db, public_snapshot
 from neurons.validators.scoring.query_scheduler import QueryScheduler
 from neurons.validators.scoring.scoring_store import ScoringStore
 from neurons.validators.scoring.synthetic_query_generator import SyntheticQueryGenerator
@@ -38,6 +43,7 @@ from neurons.validators.scrapers.advanced_scraper_validator import (
     AdvancedScraperValidator,
 )
 from neurons.validators.scrapers.x_scraper_validator import XScraperValidator
+from neurons.validators.utils.loop_monitor import LoopMonitor
 
 
 class Neuron(AbstractNeuron):
@@ -64,6 +70,7 @@ class Neuron(AbstractNeuron):
     validator_identity: dict | None = None
 
     uid_manager: UIDManager
+    loop_monitor: LoopMonitor
 
     def __init__(self):
         self.config = Neuron.config()
@@ -81,6 +88,9 @@ class Neuron(AbstractNeuron):
         capacity.set_router(self.uid_manager)
         self.validator_identity = None
         self.scoring_store: Optional[ScoringStore] = None
+        self.loop_monitor = LoopMonitor(
+            "validator", stall_threshold=self.config.neuron.loop_stall_ms / 1000
+        )
         self.should_exit = False
 
     async def initialize(self):
@@ -256,7 +266,7 @@ class Neuron(AbstractNeuron):
             bt.logging.info(f"Run specific UID: {uid}")
             return uid, self.metagraph.axons[uid]
 
-        selected_uid = self.uid_manager.get_miner_uid(
+        selected_uid = await self.uid_manager.get_miner_uid(
             search_type=SearchType(search_type) if search_type else None,
             mode=SearchMode(mode) if mode else None,
         )
@@ -386,6 +396,9 @@ class Neuron(AbstractNeuron):
             await self.sync_available_uids()  # Initial sync
 
             self.loop = asyncio.get_event_loop()
+            self.loop_monitor.start()
+
+            await get_extract_pool().start()
 
             init_wandb(self)
 
@@ -404,6 +417,10 @@ class Neuron(AbstractNeuron):
                 wallet=self.wallet,
             )
             self.utility_api = utility_api
+            self.log_shipper = LogShipper(
+                utility_api, spool=LogSpool(env.LOG_SPOOL_PATH)
+            )
+            await self.log_shipper.start()
 
             generator = SyntheticQueryGenerator()
 
@@ -419,10 +436,18 @@ class Neuron(AbstractNeuron):
                 validators=validators,
             )
 
-            self.loop.create_task(self.sync_metagraph())
-            self.loop.create_task(self.sync())
-            self.loop.create_task(query_scheduler.run())
-            self.loop.create_task(self.run_unreachable_decay_loop())
+            self.loop.create_task(self.sync_metagraph(), name="sync_metagraph")
+            self.loop.create_task(self.sync(), name="set_weights")
+            self.loop.create_task(query_scheduler.run(), name="query_scheduler")
+            self.loop.create_task(
+                self.run_unreachable_decay_loop(), name="unreachable_decay"
+            )
+            self.loop.create_task(
+                public_snapshot.run(
+                    lambda: self.validator_identity, lambda: self.should_exit
+                ),
+                name="public_snapshot",
+            )
 
         except KeyboardInterrupt:
             self.axon.stop()
@@ -447,10 +472,17 @@ class Neuron(AbstractNeuron):
     async def stop(self):
         bt.logging.info("Stopping Neuron")
 
+        await self.loop_monitor.stop()
+
+        close_extract_pool()
+
         await close_redis()
 
         await miner_db.close()
 
+        if hasattr(self, "log_shipper"):
+            await self.log_shipper.stop()
+
         if hasattr(self, "utility_api"):
             await self.utility_api.close()
 
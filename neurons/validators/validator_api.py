@@ -6,13 +6,17 @@ import bittensor as bt
 from desearch.miner_config import SearchType
 from desearch.protocol import SearchMode
 from desearch.redis.redis_client import close_redis, initialize_redis
+from neurons.validators.clients.log_shipper import LogShipper, LogSpool
 from neurons.validators.clients.utility_api_client import UtilityAPIClient
 from neurons.validators.clients.validator_service_client import ValidatorServiceClient
+from neurons.validators.env import LOG_SPOOL_PATH
+from neurons.validators.scoring.organic_persistence import OrganicPersistence
 from neurons.validators.scoring.scoring_store import ScoringStore
 from neurons.validators.scrapers.advanced_scraper_validator import (
     AdvancedScraperValidator,
 )
 from neurons.validators.scrapers.x_scraper_validator import XScraperValidator
+from neurons.validators.utils.loop_monitor import LoopMonitor
 
 
 class ValidatorAPI:
@@ -27,6 +31,9 @@ class ValidatorAPI:
     advanced_scraper_validator: "AdvancedScraperValidator"
     x_scraper_validator: "XScraperValidator"
     utility_api: UtilityAPIClient
+    log_shipper: LogShipper
+    organic_persistence: OrganicPersistence
+    loop_monitor: LoopMonitor
     validator_identity: dict | None
 
     def __init__(self, config: bt.Config, validator_identity: dict | None = None):
@@ -39,6 +46,9 @@ class ValidatorAPI:
 
         self.validator_service_client = ValidatorServiceClient()
         self.scoring_store = ScoringStore()
+        self.loop_monitor = LoopMonitor(
+            "api", stall_threshold=self.config.neuron.loop_stall_ms / 1000
+        )
 
     async def initialize(self):
         if self.config.neuron.offline:
@@ -67,9 +77,16 @@ class ValidatorAPI:
             base_url=self.config.neuron.utility_api_url,
             wallet=self.wallet,
         )
+        self.log_shipper = LogShipper(self.utility_api, spool=LogSpool(LOG_SPOOL_PATH))
+        await self.log_shipper.start()
 
         await initialize_redis()
 
+        self.organic_persistence = OrganicPersistence(
+            owner=self, scoring_store=self.scoring_store
+        )
+        self.organic_persistence.start()
+
     async def get_random_miner(
         self,
         uid: Optional[int] = None,
@@ -82,13 +99,22 @@ class ValidatorAPI:
 
     async def start(self):
         bt.logging.info("Starting ValidatorAPI")
+        self.loop_monitor.start()
         await self.initialize()
 
     async def stop(self):
         bt.logging.info("Stopping ValidatorAPI")
 
+        await self.loop_monitor.stop()
+
+        if hasattr(self, "organic_persistence"):
+            await self.organic_persistence.stop()
+
         await close_redis()
 
+        if hasattr(self, "log_shipper"):
+            await self.log_shipper.stop()
+
         if hasattr(self, "utility_api"):
             await self.utility_api.close()
 
@@ -6,10 +6,14 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
+from neurons.validators.apify.extract_pool import get_extract_pool
+from neurons.validators.apify.tweet_cache import tweet_cache
 from neurons.validators.env import VALIDATOR_SERVICE_PORT
 from neurons.validators.validator import Neuron
 
-neuron = Neuron()
+# Article extraction workers import this script as __mp_main__ (see
+# apify/extract_pool.py); only the service process runs the neuron.
+neuron = Neuron() if __name__ != "__mp_main__" else None
 
 
 @asynccontextmanager
@@ -64,9 +68,12 @@ async def get_random_uid(body: GetRandomUidRequest):
             detail="Neuron is not available.",
         )
 
-    uid, axon = await neuron.get_random_miner(
-        search_type=body.search_type, mode=body.mode
-    )
+    try:
+        uid, axon = await neuron.get_random_miner(
+            search_type=body.search_type, mode=body.mode
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
 
     return {"uid": uid, "axon": axon}
 
@@ -79,7 +86,12 @@ async def health():
             detail="No available UIDs.",
         )
 
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "tweet_cache": tweet_cache.stats(),
+        "article_extraction": get_extract_pool().stats(),
+        "event_loop": neuron.loop_monitor.stats(),
+    }
 
 
 if __name__ == "__main__":
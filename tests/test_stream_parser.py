@@ -0,0 +1,79 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from desearch.protocol import JSONStreamParser, ScraperStreamingSynapse
+
+EVENTS = [
+    {"type": "text", "role": "summary", "content": 'quote " brace } bracket ]'},
+    {
+        "type": "search",
+        "content": [{"title": "é ü 漢字", "link": "https://a.b", "snippet": "s"}],
+    },
+    {"type": "completion", "content": 'back\\slash \\" done'},
+]
+
+
+def _feed_in_pieces(payload: bytes, size: int) -> list:
+    parser = JSONStreamParser()
+    values = []
+    for i in range(0, len(payload), size):
+        values.extend(parser.feed(payload[i : i + size]))
+    return values
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 4096])
+def test_parser_reassembles_events_across_any_split(size):
+    payload = "".join(json.dumps(e, ensure_ascii=False) for e in EVENTS).encode()
+
+    assert _feed_in_pieces(payload, size) == EVENTS
+
+
+def test_parser_skips_malformed_value_and_continues():
+    payload = b'{"type": "text"} {"broken": tru} \n{"type": "completion"}'
+
+    assert _feed_in_pieces(payload, 5) == [{"type": "text"}, {"type": "completion"}]
+
+
+def test_parser_compacts_consumed_bytes():
+    parser = JSONStreamParser()
+    for _ in range(1000):
+        parser.feed(b'{"type": "text", "content": "x"}')
+
+    assert len(parser._buffer) == 0
+
+
+class _Content:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def iter_any(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+def _response(payload: bytes, size: int):
+    chunks = [payload[i : i + size] for i in range(0, len(payload), size)]
+    return SimpleNamespace(
+        content=_Content(chunks),
+        real_url=SimpleNamespace(host="127.0.0.1", port=8091),
+    )
+
+
+async def test_streaming_synapse_yields_strings_or_decoded_events():
+    payload = "".join(json.dumps(e) for e in EVENTS).encode()
+
+    synapse = ScraperStreamingSynapse(prompt="q")
+    chunks = [
+        c async for c in synapse.process_streaming_response(_response(payload, 9))
+    ]
+    assert [json.loads(c) for c in chunks] == EVENTS
+    assert synapse.completion == EVENTS[2]["content"]
+    assert synapse.search_results[0].link == "https://a.b"
+
+    decoded = ScraperStreamingSynapse(prompt="q").stream_decoded()
+    events = [
+        e async for e in decoded.process_streaming_response(_response(payload, 9))
+    ]
+    assert events == EVENTS
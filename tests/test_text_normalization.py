@@ -0,0 +1,112 @@
+import html
+import random
+import re
+import unicodedata
+
+import pytest
+
+from desearch.text_normalization import clean_text, format_text_for_match
+from tests_data.links.links import link1, link2, link3, link4, link5
+from tests_data.tweets.tweet1 import tweet1
+from tests_data.tweets.tweet2 import tweet2
+
+
+def legacy_clean_text(text):
+    text = html.unescape(text)
+    text = re.sub(r"(https?://)?\S+\.\S+\/?(\S+)?", "", text)
+    text = re.sub(r"^(@\w+\s*)+", "", text)
+    text = re.sub(r"[^\w\s,]", "", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return "".join(
+        char
+        for char in text
+        if char.isprintable() and not unicodedata.category(char).startswith("C")
+    )
+
+
+def legacy_format_text_for_match(text):
+    text = html.unescape(text)
+    text = re.sub(r"(https?://)?\S+\.\S+\/?(\S+)?", "", text)
+    text = re.sub(r"^(@\w+\s*)+", "", text)
+    text = re.sub(r"\s+", "", text)
+    return text[:280]
+
+
+PIECES = [
+    "@user ",
+    "@a_b\n",
+    "https://t.co/abc",
+    "x.com/a/status/1",
+    "...",
+    "&amp;",
+    "&#128512;",
+    "&nbsp;",
+    ", ",
+    "_",
+    "١٢٣",
+    "Ⅻ",
+    "漢字",
+    "e\u0301",
+    "\u0903",
+    "\u200b",
+    "\u200d",
+    "\ufe0f",
+    "\xad",
+    "\u2066",
+    "\U0001f600",
+    "\x00",
+    "\x1c",
+    "\x85",
+    "\xa0",
+    "\u2028",
+    "\u3000",
+    "\t",
+    "\r\n",
+    " ",
+    "word",
+]
+
+
+def corpus() -> list[str]:
+    texts = []
+    for tweet in (tweet1, tweet2):
+        texts.append(tweet["text"])
+        if tweet.get("quote"):
+            texts.append(tweet["quote"]["text"])
+    for link in (link1, link2, link3, link4, link5):
+        texts.extend([link["title"], link["snippet"]])
+
+    rng = random.Random(0)
+    texts.extend(
+        "".join(rng.choice(PIECES) for _ in range(rng.randint(0, 120)))
+        for _ in range(3000)
+    )
+    texts.extend(["", " ", "@only", "@a @b text", "a.b", "." * 300, "w " * 400])
+    texts.extend(["漢字" * 200, "a" * 500 + ".", "." + "a" * 500, "a." * 300])
+    texts.extend(
+        "".join(
+            rng.choice(["a", ".", "/", ":", "https://", " ", "x.y"]) for _ in range(40)
+        )
+        for _ in range(3000)
+    )
+    return texts
+
+
+@pytest.mark.parametrize(
+    "current, legacy",
+    [
+        (clean_text, legacy_clean_text),
+        (format_text_for_match, legacy_format_text_for_match),
+    ],
+)
+def test_matches_the_legacy_normalization_on_the_corpus(current, legacy):
+    mismatches = [text for text in corpus() if current(text) != legacy(text)]
+
+    assert mismatches == []
+
+
+def test_examples():
+    text = "@alice @bob Big news &amp; more 🚀\n\nhttps://t.co/xyz  see it,  now\u200b"
+
+    assert clean_text(text) == "Big news more see it, now"
+    assert format_text_for_match(text) == "Bignews&more🚀seeit,now\u200b"
@@ -0,0 +1,70 @@
+import asyncio
+from types import SimpleNamespace
+
+from desearch.protocol import JSONStreamParser, ScraperTextRole, SearchMode
+from desearch.tools.response_streamer import (
+    COALESCE_POLICIES,
+    CoalescePolicy,
+    ResponseStreamer,
+    coalesce_policy_for,
+)
+
+
+class _Send:
+    def __init__(self):
+        self.frames = []
+
+    async def __call__(self, message):
+        self.frames.append(message)
+
+
+async def _tokens(tokens):
+    for token in tokens:
+        yield SimpleNamespace(
+            choices=[SimpleNamespace(delta=SimpleNamespace(content=token))]
+        )
+
+
+def _events(frames):
+    parser = JSONStreamParser()
+    return [event for frame in frames for event in parser.feed(frame["body"])]
+
+
+async def test_tokens_coalesce_by_bytes_and_stay_parseable():
+    send = _Send()
+    streamer = ResponseStreamer(send, policy=CoalescePolicy(10.0, 256))
+    tokens = [f"tok{i} " for i in range(40)]
+
+    await streamer.stream_response(_tokens(tokens), ScraperTextRole.FINAL_SUMMARY)
+    await streamer.send_completion_event()
+
+    assert 2 < len(send.frames) < len(tokens)
+    assert all(len(f["body"]) < 256 + 80 for f in send.frames)
+    assert send.frames[-1]["more_body"] is False
+
+    events = _events(send.frames)
+    assert [e["content"] for e in events[:-1]] == tokens
+    assert events[-1] == {"type": "completion", "content": "".join(tokens)}
+
+
+async def test_first_token_is_sent_immediately_and_rest_on_timer():
+    send = _Send()
+    streamer = ResponseStreamer(send, policy=CoalescePolicy(0.01, 10_000))
+
+    await streamer.send_text_event("a", ScraperTextRole.FINAL_SUMMARY)
+    await streamer.send_text_event("b", ScraperTextRole.FINAL_SUMMARY)
+    await streamer.send_text_event("c", ScraperTextRole.FINAL_SUMMARY)
+    assert len(send.frames) == 1
+
+    await asyncio.sleep(0.05)
+    assert len(send.frames) == 2
+    assert [e["content"] for e in _events(send.frames)] == ["a", "b", "c"]
+
+
+def test_policy_per_mode():
+    assert coalesce_policy_for("fast") == COALESCE_POLICIES[SearchMode.FAST]
+    assert coalesce_policy_for(None) == COALESCE_POLICIES[SearchMode.BALANCED]
+    assert (
+        COALESCE_POLICIES[SearchMode.FAST].max_delay
+        < COALESCE_POLICIES[SearchMode.DEEP].max_delay
+    )
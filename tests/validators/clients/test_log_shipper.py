@@ -0,0 +1,123 @@
+import asyncio
+import gzip
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import aiohttp
+
+from neurons.validators.clients import log_shipper
+from neurons.validators.clients.log_shipper import LogShipper, LogSpool
+
+
+def _decode(body: bytes) -> list[dict]:
+    return json.loads(gzip.decompress(body))["logs"]
+
+
+async def test_ships_logs_in_gzip_batches():
+    utility_api = SimpleNamespace(save_logs_body=AsyncMock())
+    shipper = LogShipper(utility_api, max_batch=2)
+
+    shipper.submit([{"n": 0}, {"n": 1}, {"n": 2}])
+    await shipper.stop()
+
+    bodies = [call.args[0] for call in utility_api.save_logs_body.await_args_list]
+    assert [_decode(body) for body in bodies] == [[{"n": 0}, {"n": 1}], [{"n": 2}]]
+    assert shipper.stats()["shipped"] == 3
+
+
+async def test_failed_batch_is_spooled_and_replayed(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_shipper, "BACKOFF_BASE_SECONDS", 0)
+    utility_api = SimpleNamespace(save_logs_body=AsyncMock(side_effect=OSError))
+    spool = LogSpool(str(tmp_path / "spool.db"))
+    shipper = LogShipper(utility_api, spool=spool)
+    await spool.open()
+
+    await shipper._ship([{"n": 0}])
+    assert await spool.count() == 1
+    assert utility_api.save_logs_body.await_count == log_shipper.MAX_ATTEMPTS
+
+    utility_api.save_logs_body = AsyncMock()
+    await shipper._replay_spool()
+
+    assert _decode(utility_api.save_logs_body.await_args.args[0]) == [{"n": 0}]
+    assert await spool.count() == 0
+    await spool.close()
+
+
+async def _until(condition):
+    while not condition():
+        await asyncio.sleep(0.01)
+
+
+def _http_error(status: int) -> aiohttp.ClientResponseError:
+    return aiohttp.ClientResponseError(
+        request_info=SimpleNamespace(real_url="http://utility"),
+        history=(),
+        status=status,
+    )
+
+
+async def test_rejected_batch_is_dropped_without_retry(tmp_path):
+    utility_api = SimpleNamespace(
+        save_logs_body=AsyncMock(side_effect=_http_error(413))
+    )
+    spool = LogSpool(str(tmp_path / "spool.db"))
+    shipper = LogShipper(utility_api, spool=spool)
+    await spool.open()
+
+    await shipper._ship([{"n": 0}, {"n": 1}])
+
+    assert utility_api.save_logs_body.await_count == 1
+    assert await spool.count() == 0
+    assert shipper.stats()["dropped"] == 2
+    await spool.close()
+
+
+async def test_spooled_batch_is_dropped_after_max_replays(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_shipper, "SPOOL_MAX_REPLAYS", 2)
+    utility_api = SimpleNamespace(
+        save_logs_body=AsyncMock(side_effect=_http_error(503))
+    )
+    spool = LogSpool(str(tmp_path / "spool.db"))
+    shipper = LogShipper(utility_api, spool=spool)
+    await spool.open()
+    await spool.push(log_shipper.encode_logs_body([{"n": 0}]), 1)
+
+    await shipper._replay_spool()
+    assert await spool.count() == 1
+    await shipper._replay_spool()
+
+    assert await spool.count() == 0
+    assert shipper.stats()["dropped"] == 1
+    await spool.close()
+
+
+async def test_stop_ships_the_batch_in_flight():
+    release = asyncio.Event()
+    bodies = []
+
+    async def save_logs_body(body):
+        if not bodies:
+            bodies.append(None)
+            await release.wait()
+        bodies.append(body)
+
+    shipper = LogShipper(SimpleNamespace(save_logs_body=save_logs_body), max_batch=2)
+    await shipper.start()
+    shipper.submit([{"n": 0}, {"n": 1}])
+    await asyncio.wait_for(_until(lambda: bodies), 5)
+
+    await shipper.stop()
+
+    assert [_decode(body) for body in bodies[1:]] == [[{"n": 0}, {"n": 1}]]
+    assert shipper.stats()["shipped"] == 2
+
+
+def test_submit_drops_overflow():
+    shipper = LogShipper(SimpleNamespace(), max_buffered=2)
+
+    shipper.submit([{"n": 0}, {"n": 1}, {"n": 2}])
+
+    assert shipper.stats()["buffered"] == 2
+    assert shipper.stats()["dropped"] == 1
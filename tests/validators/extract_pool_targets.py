@@ -0,0 +1,16 @@
+"""Extraction targets for the ``ExtractPool`` tests.
+
+Kept apart from the test module so that a worker unpickling a target does
+not import bittensor and the validator inside a page's timeout.
+"""
+
+import os
+import time
+
+
+def sleepy_extract(html, url, max_chars):
+    """``html`` is how long the page takes to extract."""
+    if html == "crash":
+        os._exit(1)
+    time.sleep(float(html))
+    return url, html, str(max_chars), str(os.getpid())
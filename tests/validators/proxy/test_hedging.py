@@ -0,0 +1,116 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from neurons.validators.proxy import hedging
+from neurons.validators.proxy.hedging import HedgedStream, TTFBTracker
+
+
+async def _stream(chunks, first_delay=0.0):
+    await asyncio.sleep(first_delay)
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.fixture(autouse=True)
+def fresh_stats(monkeypatch):
+    monkeypatch.setattr(hedging, "ttfb_tracker", TTFBTracker())
+    monkeypatch.setattr(hedging, "hedge_stats", hedging.HedgeStats())
+    monkeypatch.setattr(hedging, "DEFAULT_HEDGE_DELAY_SECONDS", 0.05)
+    note = AsyncMock()
+    monkeypatch.setattr(hedging.capacity, "note_call_result", note)
+    return note
+
+
+async def _collect(stream):
+    return [value async for value in stream]
+
+
+async def test_fast_primary_is_not_hedged():
+    launch = AsyncMock()
+    stream = HedgedStream(1, "axon-1", _stream(["a", "b"]), launch, "ai_search", "fast")
+
+    assert await _collect(stream) == ["a", "b"]
+    launch.assert_not_awaited()
+    assert stream.uid == 1
+    assert hedging.hedge_stats.hedged == 0
+
+
+async def test_slow_primary_is_hedged_and_secondary_wins(fresh_stats):
+    primary = _stream(["slow"], first_delay=0.3)
+    launch = AsyncMock(return_value=(2, "axon-2", _stream(["fast", "done"])))
+    stream = HedgedStream(1, "axon-1", primary, launch, "ai_search", "fast")
+
+    assert await _collect(stream) == ["fast", "done"]
+    assert (stream.uid, stream.axon) == (2, "axon-2")
+    assert hedging.hedge_stats.hedged == 1
+    assert hedging.hedge_stats.secondary_wins == 1
+
+    await asyncio.gather(*hedging._background)
+    fresh_stats.assert_awaited_once_with(1, "ai_search", True, mode="fast")
+    assert len(hedging.hedge_stats.savings) == 1
+
+
+async def test_hedge_falls_back_to_primary_when_no_secondary():
+    launch = AsyncMock(return_value=None)
+    stream = HedgedStream(
+        1, "axon-1", _stream(["late"], first_delay=0.1), launch, "ai_search", "fast"
+    )
+
+    assert await _collect(stream) == ["late"]
+    launch.assert_awaited_once()
+    assert stream.uid == 1
+
+
+async def test_client_disconnect_during_race_settles_every_contender(fresh_stats):
+    closed = []
+
+    async def tracked(uid, chunks, first_delay):
+        try:
+            await asyncio.sleep(first_delay)
+            for chunk in chunks:
+                yield chunk
+        finally:
+            closed.append(uid)
+
+    launch = AsyncMock(return_value=(2, "axon-2", tracked(2, ["b"], 0.3)))
+    stream = HedgedStream(
+        1, "axon-1", tracked(1, ["a"], 0.2), launch, "ai_search", "fast"
+    )
+    consumer = asyncio.create_task(_collect(stream))
+    await asyncio.sleep(0.1)
+    consumer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+
+    assert len(hedging._background) == 2
+    await asyncio.gather(*hedging._background)
+    assert sorted(closed) == [1, 2]
+
+
+async def test_client_disconnect_mid_stream_closes_the_winner():
+    closed = []
+
+    async def tracked():
+        try:
+            for chunk in ["a", "b", "c"]:
+                yield chunk
+        finally:
+            closed.append(1)
+
+    stream = HedgedStream(1, "axon-1", tracked(), AsyncMock(), "ai_search", "fast")
+    iterator = stream.__aiter__()
+    assert await iterator.__anext__() == "a"
+    await iterator.aclose()
+
+    assert closed == [1]
+
+
+def test_tracker_uses_quantile_once_warm():
+    tracker = TTFBTracker()
+    assert tracker.hedge_delay(0.9) == hedging.DEFAULT_HEDGE_DELAY_SECONDS
+
+    for i in range(1, 101):
+        tracker.observe(i / 100)
+    assert tracker.hedge_delay(0.9) == pytest.approx(0.901)
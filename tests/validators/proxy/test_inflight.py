@@ -0,0 +1,75 @@
+import time
+
+from desearch.miner_config import SearchType
+from desearch.protocol import SearchMode
+from neurons.validators.proxy import inflight
+
+LANE = (SearchType.AI_SEARCH, SearchMode.FAST)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.zsets = {}
+        self.lists = {}
+        self.queued = []
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def zadd(self, key, mapping):
+        self.queued.append(lambda: self.zsets.setdefault(key, {}).update(mapping))
+
+    def expire(self, key, seconds):
+        self.queued.append(lambda: True)
+
+    def rpush(self, key, value):
+        self.queued.append(lambda: self.lists.setdefault(key, []).append(value))
+
+    def zremrangebyscore(self, key, low, high):
+        def run():
+            members = self.zsets.get(key, {})
+            for member, score in list(members.items()):
+                if score <= high:
+                    del members[member]
+
+        self.queued.append(run)
+
+    def zrange(self, key, start, stop):
+        self.queued.append(lambda: list(self.zsets.get(key, {})))
+
+    async def execute(self):
+        queued, self.queued = self.queued, []
+        return [run() for run in queued]
+
+    async def zrem(self, key, member):
+        return int(self.zsets.get(key, {}).pop(member, None) is not None)
+
+    async def lpop(self, key):
+        values = self.lists.get(key)
+        return values.pop(0) if values else None
+
+
+async def test_track_takes_over_the_routing_reservation(monkeypatch):
+    monkeypatch.setattr(inflight, "redis_client", FakeRedis())
+
+    await inflight.reserve(7, LANE)
+    assert await inflight.counts(LANE) == {7: 1}
+
+    async with inflight.track(7, LANE, timeout=10):
+        assert await inflight.counts(LANE) == {7: 1}
+
+    assert await inflight.counts(LANE) == {}
+
+
+async def test_track_skips_reservations_that_already_expired(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(inflight, "redis_client", redis)
+
+    stale = await inflight.reserve(7, LANE)
+    live = await inflight.reserve(7, LANE)
+    redis.zsets[inflight._key(LANE)][stale] = time.time() - 1
+    assert await inflight.counts(LANE) == {7: 1}
+
+    async with inflight.track(7, LANE, timeout=10):
+        assert await inflight.counts(LANE) == {7: 1}
+        assert live not in redis.zsets[inflight._key(LANE)]
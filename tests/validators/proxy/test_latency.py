@@ -0,0 +1,53 @@
+import contextlib
+import itertools
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from neurons.validators.proxy import latency
+from neurons.validators.scrapers import base_scraper_validator
+from neurons.validators.scrapers.base_scraper_validator import BaseScraperValidator
+
+
+def test_summarize_needs_min_samples():
+    assert latency.summarize([1.0] * (latency.MIN_SAMPLES - 1)) is None
+
+
+def test_summarize_weights_newest_samples_most():
+    # Newest first: a miner that just got slow has ewma above its old level.
+    stats = latency.summarize([10.0, 10.0, 1.0, 1.0, 1.0, 1.0])
+
+    assert stats["samples"] == 6
+    assert 1.0 < stats["ewma"] < 10.0
+    assert stats["ewma"] > latency.summarize([1.0, 1.0, 1.0, 1.0, 10.0, 10.0])["ewma"]
+
+
+def test_summarize_p90():
+    samples = [float(i) for i in range(1, 11)]
+    assert latency.summarize(samples)["p90"] == pytest.approx(9.1)
+
+
+async def test_failed_dendrite_call_records_the_full_timeout(monkeypatch):
+    recorded = []
+
+    async def record(uid, lane, seconds):
+        recorded.append((uid, seconds))
+
+    @contextlib.asynccontextmanager
+    async def track(uid, lane, timeout):
+        yield
+
+    monkeypatch.setattr(base_scraper_validator.latency, "record", record)
+    monkeypatch.setattr(base_scraper_validator.inflight, "track", track)
+    monkeypatch.setattr(
+        base_scraper_validator.capacity, "note_call_result", AsyncMock()
+    )
+    dendrite = SimpleNamespace(call=AsyncMock(side_effect=ConnectionRefusedError))
+    validator = BaseScraperValidator.__new__(BaseScraperValidator)
+    validator.search_type = "x_search"
+    validator.neuron = SimpleNamespace(dendrites=itertools.repeat(dendrite))
+    synapse = SimpleNamespace(max_execution_time=10)
+
+    assert await validator._dendrite_call(None, synapse, uid=3) is synapse
+    assert recorded == [(3, 15)]
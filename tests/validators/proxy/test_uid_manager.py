@@ -4,7 +4,9 @@ from unittest.mock import AsyncMock
 import numpy as np
 import pytest
 
-from desearch.miner_config import LANES
+from desearch.miner_config import LANES, SearchType
+from desearch.protocol import SearchMode
+from desearch.utils import get_mode_serving_budget
 from neurons.validators.proxy import uid_manager
 from neurons.validators.proxy.uid_manager import UIDManager
 from neurons.validators.scoring.constants import (
@@ -65,3 +67,86 @@ async def test_ramped_organic_routing_uses_quality_exponent(monkeypatch):
     for lane in LANES:
         weights = manager.weights_by_lane[lane]
         assert weights[1] / weights[2] == pytest.approx((0.8 / 0.7) ** QUALITY_EXPONENT)
+
+
+async def _ramped_manager(monkeypatch, rows, in_flight, latency_stats=None):
+    monkeypatch.setattr(
+        uid_manager.miner_db,
+        "get_all_concurrency_data",
+        AsyncMock(return_value=rows),
+    )
+    monkeypatch.setattr(
+        uid_manager.miner_db,
+        "get_unreachable_uids",
+        AsyncMock(return_value=set()),
+    )
+    monkeypatch.setattr(
+        uid_manager.inflight, "counts", AsyncMock(return_value=in_flight)
+    )
+    reserve = AsyncMock()
+    monkeypatch.setattr(uid_manager.inflight, "reserve", reserve)
+
+    manager = UIDManager()
+    manager.latency.get = AsyncMock(return_value=latency_stats or {})
+    await manager.resync(sorted(rows), _metagraph())
+    return manager, reserve
+
+
+async def test_routing_skips_miners_at_verified_concurrency(monkeypatch):
+    rows = {1: (0.9, 4), 2: (0.5, 2), 3: (0.5, 2)}
+    manager, reserve = await _ramped_manager(monkeypatch, rows, {1: 4, 2: 2})
+
+    picks = {
+        await manager.get_miner_uid(SearchType.AI_SEARCH, SearchMode.FAST)
+        for _ in range(50)
+    }
+
+    assert picks == {3}
+    reserve.assert_awaited_with(3, (SearchType.AI_SEARCH, SearchMode.FAST))
+
+
+async def test_routing_prefers_less_loaded_of_two_choices(monkeypatch):
+    rows = {1: (0.7, 10), 2: (0.7, 10)}
+    manager, _ = await _ramped_manager(monkeypatch, rows, {1: 9})
+
+    picks = [await manager.get_miner_uid(SearchType.X_SEARCH) for _ in range(400)]
+
+    # Equal weights: uid 2 wins whenever it is drawn at least once (~3/4).
+    assert picks.count(2) > picks.count(1) * 2
+
+
+async def test_routing_raises_when_every_miner_is_saturated(monkeypatch):
+    rows = {1: (0.7, 1), 2: (0.7, 1)}
+    manager, _ = await _ramped_manager(monkeypatch, rows, {1: 1, 2: 1})
+
+    with pytest.raises(RuntimeError):
+        await manager.get_miner_uid(SearchType.X_SEARCH)
+
+
+async def test_fast_routing_skips_miners_over_serving_budget(monkeypatch):
+    rows = {1: (0.9, 10), 2: (0.5, 10)}
+    budget = get_mode_serving_budget(SearchMode.FAST)
+    stats = {1: {"ewma": budget + 5, "p90": budget + 8, "samples": 10}}
+    manager, _ = await _ramped_manager(monkeypatch, rows, {}, stats)
+
+    fast = {
+        await manager.get_miner_uid(SearchType.AI_SEARCH, SearchMode.FAST)
+        for _ in range(50)
+    }
+    deep = {
+        await manager.get_miner_uid(SearchType.AI_SEARCH, SearchMode.DEEP)
+        for _ in range(200)
+    }
+
+    assert fast == {2}
+    assert deep == {1, 2}
+
+
+async def test_fast_routing_falls_back_when_every_miner_is_slow(monkeypatch):
+    rows = {1: (0.9, 10), 2: (0.5, 10)}
+    slow = {"ewma": 60.0, "p90": 90.0, "samples": 10}
+    manager, _ = await _ramped_manager(monkeypatch, rows, {}, {1: slow, 2: slow})
+
+    uid = await manager.get_miner_uid(SearchType.AI_SEARCH, SearchMode.FAST)
+
+    assert uid in {1, 2}
@@ -5,10 +5,12 @@ from neurons.validators.reward.twitter_basic_search_content_relevance import (
     TwitterBasicSearchContentRelevanceModel,
 )
 from desearch.protocol import (
+    TwitterScraperTweet,
     TwitterSearchSynapse,
     TwitterIDSearchSynapse,
     TwitterURLsSearchSynapse,
 )
+from desearch.utils import tweets_for_links
 from tests_data.tweets.tweet1 import tweet1
 from tests_data.tweets.tweet2 import tweet2
 
@@ -409,6 +411,13 @@ class TwitterBasicSearchContentRelevanceModelTestCase(unittest.IsolatedAsyncioTe
             )
         )
 
+    def test_tweets_for_links_uses_id_index_once_per_tweet(self):
+        tweet = TwitterScraperTweet(**tweet1)
+        links = [tweet1["url"], tweet1["url"].replace("x.com", "twitter.com")]
+
+        self.assertEqual(tweets_for_links(links, {tweet.id: tweet}), [tweet])
+        self.assertEqual(tweets_for_links(links, {}), [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from neurons.validators.apify.extract_pool import EMPTY_EXTRACTION, ExtractPool
+from tests.validators.extract_pool_targets import sleepy_extract
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def make(**kwargs):
+        pool = ExtractPool(target=sleepy_extract, initializer=None, **kwargs)
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.close()
+
+
+async def test_extracts_pages_on_every_worker(make_pool):
+    pool = make_pool(workers=2)
+    await pool.start()
+
+    results = await asyncio.gather(
+        *[pool.extract("0.3", f"https://example.com/{i}", 100) for i in range(4)]
+    )
+
+    assert [r[0] for r in results] == [f"https://example.com/{i}" for i in range(4)]
+    assert len({r[3] for r in results}) == 2
+    assert pool.stats()["extracted"] == 4
+
+
+async def test_empty_html_does_not_start_workers(make_pool):
+    pool = make_pool(workers=1)
+
+    assert await pool.extract("", "https://example.com/", 100) == EMPTY_EXTRACTION
+    assert pool.stats()["running"] is False
+
+
+async def test_timed_out_page_restarts_the_pool(make_pool):
+    pool = make_pool(workers=2, timeout=2.0)
+    await pool.start()
+
+    stuck, healthy = await asyncio.gather(
+        pool.extract("30", "https://example.com/stuck", 100),
+        pool.extract("0.2", "https://example.com/ok", 100),
+    )
+
+    assert stuck == EMPTY_EXTRACTION
+    assert healthy[0] == "https://example.com/ok"
+    stats = pool.stats()
+    assert stats["timeouts"] == 1
+    assert stats["restarts"] == 1
+    assert (await pool.extract("0", "https://example.com/after", 100))[0] == (
+        "https://example.com/after"
+    )
+
+
+async def test_crashing_page_is_retried_once_then_dropped(make_pool):
+    pool = make_pool(workers=1)
+
+    assert await pool.extract("crash", "https://example.com/bad", 100) == (
+        EMPTY_EXTRACTION
+    )
+    assert pool.stats()["crashes"] == 2
+    assert (await pool.extract("0", "https://example.com/good", 100))[0] == (
+        "https://example.com/good"
+    )
@@ -1,7 +1,12 @@
+import asyncio
 import unittest
+from unittest.mock import patch
 
 from neurons.validators.reward.search_content_relevance import link_meets_evidence
-from neurons.validators.utils.source_bodies import highlight_subset_of_body
+from neurons.validators.utils.source_bodies import (
+    highlight_subset_of_body,
+    normalized_text,
+)
 
 
 class HighlightSubsetTestCase(unittest.TestCase):
@@ -76,5 +81,43 @@ class LinkEvidenceGateTestCase(unittest.TestCase):
         self.assertFalse(link_meets_evidence(reordered, self.body, self.body))
 
 
+class NormalizedTextCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        normalized_text.cache_clear()
+
+    def test_body_is_normalized_once_across_checks(self):
+        body = LinkEvidenceGateTestCase.body
+        highlights = LinkEvidenceGateTestCase.highlights
+
+        for _ in range(3):
+            self.assertTrue(link_meets_evidence(highlights, body, body))
+            highlight_subset_of_body(highlights, body)
+
+        info = normalized_text.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 8)
+
+    def test_body_fetcher_normalizes_fetched_bodies(self):
+        from neurons.validators.apify import body_fetch, scrapingdog_scraper
+
+        text = "A real article about the harbour bridge. " * 10
+
+        async def fake_scrape(urls, max_attempts=2):
+            return [{"link": u, "html_text": text} for u in urls], []
+
+        with patch.object(
+            scrapingdog_scraper, "scrape_links_with_retries", fake_scrape
+        ):
+            out = asyncio.run(
+                body_fetch.BodyFetcher().get_many(["https://example.com/a"])
+            )
+
+        self.assertEqual(out["https://example.com/a"]["text"], text)
+        self.assertEqual(normalized_text.cache_info().currsize, 1)
+        highlights = ["the harbour bridge"]
+        self.assertEqual(highlight_subset_of_body(highlights, text), highlights)
+        self.assertEqual(normalized_text.cache_info().misses, 1)
+
+
 if __name__ == "__main__":
     unittest.main()
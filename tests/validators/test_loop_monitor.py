@@ -0,0 +1,61 @@
+import asyncio
+import time
+
+from neurons.validators.utils import loop_monitor as loop_monitor_module
+from neurons.validators.utils.loop_monitor import (
+    UNATTRIBUTED,
+    LoopMonitor,
+    task_label,
+)
+
+
+def block_the_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def test_stall_is_attributed_to_the_blocking_task(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(loop_monitor_module.bt.logging, "warning", warnings.append)
+    monitor = LoopMonitor("test", interval=0.01, stall_threshold=0.05)
+    monitor.start()
+
+    async def blocker():
+        block_the_loop(0.3)
+
+    await asyncio.sleep(0.05)
+    await asyncio.create_task(blocker(), name="blocker")
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    stats = monitor.stats()
+    assert stats["stalls"] == 1
+    assert stats["stalls_by_owner"]["blocker"]["stalls"] == 1
+    assert stats["stalls_by_owner"]["blocker"]["max_ms"] >= 250
+    assert stats["last_stall"]["owner"] == "blocker"
+    assert "block_the_loop" in warnings[0]
+
+
+async def test_task_label_falls_back_to_the_coroutine():
+    async def unnamed_work():
+        pass
+
+    task = asyncio.create_task(unnamed_work())
+    named = asyncio.create_task(unnamed_work(), name="organic_persistence")
+    await asyncio.gather(task, named)
+
+    assert task_label(task).endswith("unnamed_work")
+    assert task_label(named) == "organic_persistence"
+
+
+def test_stalls_without_a_capture_are_unattributed(monkeypatch):
+    monkeypatch.setattr(loop_monitor_module.bt.logging, "warning", lambda _: None)
+    monitor = LoopMonitor("test", stall_threshold=0.1)
+
+    monitor.record(0.02)
+    monitor.record(0.4)
+
+    stats = monitor.stats()
+    assert stats["samples"] == 2
+    assert stats["stalls"] == 1
+    assert stats["lag_max_ms"] == 400
+    assert list(stats["stalls_by_owner"]) == [UNATTRIBUTED]
@@ -4,7 +4,9 @@ from unittest.mock import AsyncMock, patch
 import numpy as np
 import pytest
 
+from desearch.protocol import ScraperStreamingSynapse
 from neurons.validators.clients.miner_response_logger import (
+    RewardBatch,
     build_log_entry,
     build_reward_payload,
     submit_logs,
@@ -53,11 +55,11 @@ async def test_x_search_logs_selected_uid():
 
     with (
         patch(
-            "neurons.validators.scrapers.x_scraper_validator.build_log_entry",
+            "neurons.validators.scrapers.base_scraper_validator.build_log_entry",
             return_value={"ok": True},
         ) as build_log_entry,
         patch(
-            "neurons.validators.scrapers.x_scraper_validator.submit_logs_best_effort"
+            "neurons.validators.scrapers.base_scraper_validator.submit_logs_best_effort"
         ) as submit_logs_best_effort,
     ):
         items = [item async for item in validator.x_search({"query": "bittensor"})]
@@ -92,11 +94,11 @@ async def test_ai_organic_logs_after_stream_finishes():
 
     with (
         patch(
-            "neurons.validators.scrapers.advanced_scraper_validator.build_log_entry",
+            "neurons.validators.scrapers.base_scraper_validator.build_log_entry",
             return_value={"ok": True},
         ) as build_log_entry,
         patch(
-            "neurons.validators.scrapers.advanced_scraper_validator.submit_logs_best_effort"
+            "neurons.validators.scrapers.base_scraper_validator.submit_logs_best_effort"
         ) as submit_logs_best_effort,
         patch(
             "neurons.validators.scrapers.advanced_scraper_validator.bt.Synapse",
@@ -157,6 +159,81 @@ def test_build_log_entry_excludes_html_fields_from_response_payload():
     assert response.search_results[0]["html_text"] == "big payload"
 
 
+def test_build_log_entry_excludes_html_fields_from_synapse_payload():
+    response = ScraperStreamingSynapse(
+        prompt="what is bittensor",
+        model="NOVA",
+        mode="deep",
+        validator_links=[
+            {
+                "link": "https://example.com",
+                "html_content": "<p>x</p>",
+                "html_text": "x",
+            }
+        ],
+        miner_link_scores={"https://example.com": "HIGH"},
+    )
+
+    log_entry = build_log_entry(
+        owner=_fake_owner(),
+        search_type="ai_search",
+        query_kind="scoring",
+        response=response,
+    )
+
+    payload = log_entry["response_payload"]
+    assert payload["validator_links"] == [{"link": "https://example.com"}]
+    assert payload["mode"] == "deep"
+    assert payload["miner_link_scores"] == {"https://example.com": "HIGH"}
+    assert response.validator_links[0]["html_content"] == "<p>x</p>"
+
+
+def test_build_log_entry_excludes_nested_html_fields_from_synapse_payload():
+    response = ScraperStreamingSynapse(
+        prompt="what is bittensor",
+        model="NOVA",
+        validator_links=[
+            {"link": "https://example.com", "nested": {"html_text": "x", "n": 1}}
+        ],
+        miner_tweets=[{"id": "1", "extra": {"html_text": "x", "html_content": "y"}}],
+    )
+
+    log_entry = build_log_entry(
+        owner=_fake_owner(),
+        search_type="ai_search",
+        query_kind="scoring",
+        response=response,
+    )
+
+    payload = log_entry["response_payload"]
+    assert payload["validator_links"][0]["nested"] == {"n": 1}
+    assert payload["miner_tweets"][0]["extra"] == {}
+    assert response.miner_tweets[0]["extra"]["html_text"] == "x"
+
+
+def test_reward_batch_matches_unbatched_payloads():
+    rewards = [np.array([0.1, 0.2, 0.3]) for _ in range(3)]
+    event = {"content_raw": np.array([1.0, 2.0, 3.0]), "uids": [1, 2, 3]}
+    batch = RewardBatch.serialize(rewards, rewards, [{}, {}, {}], event)
+
+    for index in range(3):
+        kwargs = dict(
+            search_type="ai_search",
+            response_count=3,
+            index=index,
+            uid=index,
+            total_reward=0.5,
+        )
+        assert build_reward_payload(**kwargs, batch=batch) == build_reward_payload(
+            **kwargs,
+            all_rewards=rewards,
+            all_original_rewards=rewards,
+            validator_scores=[{}, {}, {}],
+            event=event,
+        )
+    assert batch.event == {"content_raw": [1.0, 2.0, 3.0]}
+
+
 @pytest.mark.parametrize(
     ("search_type", "component_names"),
     [
@@ -265,11 +342,11 @@ async def test_x_post_by_id_logs_organic():
 
     with (
         patch(
-            "neurons.validators.scrapers.x_scraper_validator.build_log_entry",
+            "neurons.validators.scrapers.base_scraper_validator.build_log_entry",
             return_value={"ok": True},
         ) as build_log_entry,
         patch(
-            "neurons.validators.scrapers.x_scraper_validator.submit_logs_best_effort"
+            "neurons.validators.scrapers.base_scraper_validator.submit_logs_best_effort"
         ) as submit_logs_best_effort,
     ):
         results = await validator.x_post_by_id("123")
@@ -300,11 +377,11 @@ async def test_x_posts_by_urls_logs_organic():
 
     with (
         patch(
-            "neurons.validators.scrapers.x_scraper_validator.build_log_entry",
+            "neurons.validators.scrapers.base_scraper_validator.build_log_entry",
             return_value={"ok": True},
         ) as build_log_entry,
         patch(
-            "neurons.validators.scrapers.x_scraper_validator.submit_logs_best_effort"
+            "neurons.validators.scrapers.base_scraper_validator.submit_logs_best_effort"
         ) as submit_logs_best_effort,
     ):
         results = await validator.x_posts_by_urls(
@@ -0,0 +1,104 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from neurons.validators.scoring import organic_persistence
+from neurons.validators.scoring.organic_persistence import OrganicPersistence
+from neurons.validators.scrapers.base_scraper_validator import BaseScraperValidator
+
+
+def _owner():
+    return SimpleNamespace(utility_api=SimpleNamespace(save_logs=AsyncMock()))
+
+
+def _response(status=200):
+    return SimpleNamespace(dendrite=SimpleNamespace(status_code=status))
+
+
+async def test_worker_batches_logs_and_scoring_writes():
+    owner = _owner()
+    store = SimpleNamespace(save_encoded=AsyncMock())
+    persistence = OrganicPersistence(owner, store)
+
+    with (
+        patch.object(
+            organic_persistence, "build_log_entry", side_effect=lambda **kw: kw
+        ),
+        patch.object(organic_persistence.ScoringStore, "encode", return_value="enc"),
+        patch.object(organic_persistence, "submit_logs_best_effort") as submit_logs,
+    ):
+        for uid in range(3):
+            persistence.submit("ai_search", _response(), uid, None, "ai_search")
+        persistence.submit("x_post_by_id", _response(), 9, None)
+
+        persistence.start()
+        await asyncio.wait_for(persistence._queue.join(), 1)
+        await persistence.stop()
+
+    submit_logs.assert_called_once()
+    assert len(submit_logs.call_args.args[1]) == 4
+    records = store.save_encoded.call_args.args[0]
+    assert [record[2] for record in records] == [0, 1, 2]
+    assert persistence.stats()["written"] == 4
+
+
+async def test_submit_sheds_load_when_full(monkeypatch):
+    monkeypatch.setattr(organic_persistence.random, "random", lambda: 0.99)
+    persistence = OrganicPersistence(_owner(), None, max_pending=4)
+
+    accepted = [
+        persistence.submit("ai_search", _response(), uid, None) for uid in range(6)
+    ]
+
+    assert accepted == [True, True, True, False, False, False]
+    stats = persistence.stats()
+    assert stats["depth"] == 3
+    assert stats["sampled_out"] == 3
+
+
+async def test_scraper_enqueues_instead_of_writing_inline():
+    validator = object.__new__(BaseScraperValidator)
+    validator.search_type = "ai_search"
+    persistence = SimpleNamespace(submit=lambda *args, **kwargs: calls.append(kwargs))
+    validator.neuron = SimpleNamespace(organic_persistence=persistence)
+    calls = []
+
+    await validator._persist_organic([_response(200), _response(500)], 5, None)
+
+    assert [call["scoring_search_type"] for call in calls] == ["ai_search", None]
+
+
+async def test_responses_without_a_uid_are_logged_but_not_kept_for_scoring():
+    validator = object.__new__(BaseScraperValidator)
+    validator.search_type = "ai_search"
+    persistence = SimpleNamespace(submit=lambda *args, **kwargs: calls.append(kwargs))
+    validator.neuron = SimpleNamespace(organic_persistence=persistence)
+    calls = []
+
+    await validator._persist_organic([_response(200)], None, None)
+
+    assert [call["scoring_search_type"] for call in calls] == [None]
+
+    store = SimpleNamespace(save_encoded=AsyncMock())
+    worker = OrganicPersistence(_owner(), store)
+    with (
+        patch.object(
+            organic_persistence, "build_log_entry", side_effect=lambda **kw: kw
+        ),
+        patch.object(organic_persistence.ScoringStore, "encode", return_value="enc"),
+    ):
+        logs, records = worker._serialize(
+            [
+                organic_persistence.OrganicJob(
+                    log_search_type="ai_search",
+                    response=_response(),
+                    miner_uid=None,
+                    axon=None,
+                    hour_bucket=None,
+                    scoring_search_type="ai_search",
+                )
+            ]
+        )
+
+    assert len(logs) == 1
+    assert records == []
@@ -0,0 +1,53 @@
+import pytest
+
+from benchmarks.provider_emulator import (
+    LatencyProfile,
+    ProviderEmulator,
+    fixture_tweet,
+)
+from desearch.protocol import TwitterScraperTweet
+from desearch.provider_endpoints import SCRAPINGDOG, provider_url
+from desearch.utils import call_chutes
+from neurons.validators.apify.scrapingdog_scraper import ScrapingDogScraper
+from neurons.validators.apify.twitter_scraper_actor import TwitterScraperActor
+
+INSTANT = LatencyProfile()
+
+
+def test_base_urls_follow_the_environment(monkeypatch):
+    monkeypatch.delenv("SCRAPINGDOG_BASE_URL", raising=False)
+    assert ScrapingDogScraper().api_url == "https://api.scrapingdog.com/scrape"
+
+    monkeypatch.setenv("SCRAPINGDOG_BASE_URL", "http://localhost:8900/scrapingdog/")
+    assert ScrapingDogScraper().api_url == "http://localhost:8900/scrapingdog/scrape"
+    assert provider_url(SCRAPINGDOG, "/google") == (
+        "http://localhost:8900/scrapingdog/google"
+    )
+
+
+@pytest.fixture
+async def emulator(monkeypatch):
+    emulator = ProviderEmulator(
+        profiles={name: INSTANT for name in ("apify", "scrapingdog", "chutes")}
+    )
+    await emulator.start()
+    for name, value in emulator.environ().items():
+        monkeypatch.setenv(name, value)
+    yield emulator
+    await emulator.stop()
+
+
+async def test_validator_clients_run_against_the_emulator(emulator):
+    urls = ["https://x.com/user/status/101", "https://x.com/user/status/202"]
+
+    tweets = await TwitterScraperActor().get_tweets(urls)
+    pages = await ScrapingDogScraper().scrape_metadata(["https://www.python.org/"])
+    reply = await call_chutes([{"role": "user", "content": "hi"}], 0, "model")
+
+    assert tweets == [
+        TwitterScraperTweet(**fixture_tweet("101")),
+        TwitterScraperTweet(**fixture_tweet("202")),
+    ]
+    assert pages[0]["link"] == "https://www.python.org/"
+    assert reply == emulator.llm_reply
+    assert emulator.stats()["apify"]["requests"] == 1
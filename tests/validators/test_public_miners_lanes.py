@@ -1,4 +1,5 @@
 import neurons.validators.api as api
+from neurons.validators.scoring import public_snapshot
 from desearch.miner_config import SearchType, lane_key
 from desearch.protocol import SearchMode
 
@@ -31,7 +32,7 @@ def test_ai_search_carries_only_modes():
         _row(1, DEEP, 20, 100, 0.50),
         _row(1, X, 25, 80, 0.80),
     ]
-    per_type = api._per_type_from_rows(rows)
+    per_type = public_snapshot.per_type_from_rows(rows)
 
     assert set(per_type) == {"ai_search", "x_search"}
     assert per_type["ai_search"] == {
@@ -61,11 +62,11 @@ def test_ai_search_carries_only_modes():
 
 def test_retired_search_types_are_dropped():
     rows = [_row(1, FAST, 10, 100, 0.7), _row(1, "web_search", 5, 6, 0.2)]
-    assert "web_search" not in api._per_type_from_rows(rows)
+    assert "web_search" not in public_snapshot.per_type_from_rows(rows)
 
 
 def test_missing_mode_falls_back_to_empty_state():
-    per_type = api._per_type_from_rows([_row(1, FAST, 10, 100, 0.7)])
+    per_type = public_snapshot.per_type_from_rows([_row(1, FAST, 10, 100, 0.7)])
     modes = per_type["ai_search"]["modes"]
     assert modes["deep"]["declared"] == 0
     assert modes["deep"]["verified"] == 1
@@ -80,10 +81,24 @@ def test_response_model_serializes_modes_without_aggregate():
         _row(1, X, 25, 80, 0.80),
     ]
     item = api.MinerListItemOut(
-        hotkey="hk", uid=1, coldkey="ck", per_type=api._per_type_from_rows(rows)
+        hotkey="hk",
+        uid=1,
+        coldkey="ck",
+        per_type=public_snapshot.per_type_from_rows(rows),
     )
     dumped = item.model_dump(exclude_none=True)
 
     assert set(dumped["per_type"]["ai_search"]) == {"modes"}
     assert dumped["per_type"]["ai_search"]["modes"]["fast"]["verified"] == 60
     assert "modes" not in dumped["per_type"]["x_search"]
+
+
+def test_latency_attaches_to_observed_lanes_only():
+    rows = [_row(1, FAST, 10, 100, 0.7), _row(1, X, 5, 10, 0.8)]
+    stats = {"ewma": 3.2, "p90": 6.0, "samples": 12}
+
+    per_type = public_snapshot.per_type_from_rows(rows, {FAST: stats, DEEP: stats})
+
+    assert per_type["ai_search"]["modes"]["fast"]["latency"] == stats
+    assert "latency" not in per_type["ai_search"]["modes"]["deep"]
+    assert "latency" not in per_type["x_search"]
@@ -0,0 +1,100 @@
+import gzip
+import json
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import neurons.validators.api as api
+from desearch.miner_config import SearchType, lane_key
+from desearch.protocol import SearchMode
+from neurons.validators.scoring import miner_db, public_snapshot
+
+FAST = lane_key((SearchType.AI_SEARCH, SearchMode.FAST))
+X = lane_key((SearchType.X_SEARCH, None))
+
+
+@pytest.fixture
+async def db(tmp_path, monkeypatch):
+    async def no_latency(lane, uids):
+        return {}
+
+    monkeypatch.setattr(public_snapshot.latency, "stats_for", no_latency)
+    await miner_db.initialize(str(tmp_path / "miner.db"), readonly=False, owner=True)
+    for uid, hotkey in ((2, "hk-b"), (1, "hk-a")):
+        for key in (FAST, X):
+            await miner_db.register_miner(
+                uid=uid, search_type=key, declared=10, hotkey=hotkey, coldkey="ck"
+            )
+    await miner_db.insert_window(
+        uid=1,
+        search_type=FAST,
+        window_start="2026-01-01T00:00:00+00:00",
+        hotkey="hk-a",
+        coldkey="ck",
+        quality_score=0.8,
+        passed=True,
+        verified_concurrency=3,
+    )
+    yield miner_db
+    await miner_db.close()
+
+
+async def test_snapshot_bodies_match_live_responses(db, monkeypatch):
+    async def missing(*args):
+        return None
+
+    monkeypatch.setattr(public_snapshot, "load_list", missing)
+    monkeypatch.setattr(public_snapshot, "load_detail", missing)
+    monkeypatch.setattr(api, "validator_identity", {"uid": 7, "hotkey": "vk"})
+
+    snapshot = await public_snapshot.build(api.validator_identity)
+
+    live_list = api.MinerListResponse(**await api.public_list_miners(None))
+    _, list_body = snapshot["list"]
+    assert json.loads(gzip.decompress(list_body)) == live_list.model_dump(
+        mode="json", exclude_none=True
+    )
+    assert [m["uid"] for m in live_list.model_dump()["miners"]] == [1, 2]
+
+    live_detail = api.MinerDetailResponse(
+        **await api.public_miner_detail(None, hotkey="hk-a")
+    )
+    _, detail_body = snapshot["details"]["hk-a"]
+    detail = json.loads(gzip.decompress(detail_body))
+    assert detail == live_detail.model_dump(mode="json", exclude_none=True)
+    assert detail["miner"]["windows"]["ai_search"]["fast"][0]["quality_score"] == 0.8
+
+
+def test_etag_depends_only_on_content():
+    first, _ = public_snapshot.encode({"miners": [1], "validator": {"uid": None}})
+    second, _ = public_snapshot.encode({"miners": [1], "validator": {}})
+    third, _ = public_snapshot.encode({"miners": [2], "validator": {}})
+
+    assert first == second
+    assert first != third
+
+
+def test_public_miners_serves_stored_snapshot(monkeypatch):
+    etag, body = public_snapshot.encode({"validator": {}, "miners": []})
+    entry = public_snapshot.SnapshotEntry(etag, body, time.time() - 5)
+
+    async def load_list():
+        return entry
+
+    monkeypatch.setattr(public_snapshot, "load_list", load_list)
+    client = TestClient(api.app)
+
+    response = client.get("/public/miners")
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] == etag
+    assert int(response.headers["Age"]) >= 5
+    assert response.json() == {"validator": {}, "miners": []}
+
+    plain = client.get("/public/miners", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in plain.headers
+    assert plain.json() == {"validator": {}, "miners": []}
+
+    cached = client.get("/public/miners", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
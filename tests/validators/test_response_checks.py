@@ -11,9 +11,12 @@ from neurons.validators.utils.response_checks import (
     is_descending_by_created_at,
     normalize_source_url,
     parse_tweet_date,
+    response_links,
+    source_key,
     tweet_date_in_range,
     verify_summary_links,
 )
+from neurons.validators.utils.source_bodies import sample_cited_and_uncited
 
 
 def test_normalize_source_url_lowercases():
@@ -310,3 +313,40 @@ def test_verify_summary_links_no_links():
 def test_verify_summary_links_no_summary():
     response = ScraperStreamingSynapse(prompt="x", miner_tweets=[_tweet_dict("123")])
     assert verify_summary_links(response) == (0, 0)
+
+
+def test_url_keys_are_memoized_and_interned():
+    first = normalize_source_url("https://www.News.com/a/")
+    second = normalize_source_url("HTTPS://news.com/a".lower())
+
+    assert first == "https://news.com/a"
+    assert first is second
+    assert source_key("https://news.com/a?utm_source=x") is first
+    assert normalize_source_url.cache_info().hits > 0
+
+
+def test_response_links_are_computed_once_per_summary():
+    chunks = ["[a](https://x.com/foo/status/123) [b](https://www.news.com/a/)"]
+    response = ScraperStreamingSynapse(
+        prompt="x",
+        text_chunks={ScraperTextRole.FINAL_SUMMARY.value: chunks},
+        miner_tweets=[_tweet_dict("123")],
+    )
+
+    links = response_links(response)
+    assert response_links(response) is links
+    assert links.cited == {"https://x.com/foo/status/123", "https://news.com/a"}
+    assert verify_summary_links(response) == (1, 2)
+
+    summary_chunks = response.text_chunks[ScraperTextRole.FINAL_SUMMARY.value]
+    summary_chunks.append(" [c](https://x.com/foo/status/123)")
+    assert response_links(response) is not links
+    assert verify_summary_links(response) == (2, 3)
+
+
+def test_sample_cited_and_uncited_excludes_every_copy_of_a_pick():
+    urls = ["https://a.com", "https://b.com", "https://a.com", "https://c.com"]
+
+    picks = sample_cited_and_uncited(urls, {"https://a.com"}, 1, 5)
+
+    assert sorted(picks) == ["https://a.com", "https://b.com", "https://c.com"]
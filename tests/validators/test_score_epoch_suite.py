@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+
+from benchmarks.score_epoch_suite import MemoryRedis, StageTimer, build_records
+from desearch.protocol import ScraperStreamingSynapse, TwitterSearchSynapse
+from neurons.validators.scoring import scoring_store as scoring_store_module
+from neurons.validators.scoring.scoring_store import ScoringStore
+
+HOUR = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+async def test_memory_store_round_trips_every_lane(monkeypatch):
+    monkeypatch.setattr(scoring_store_module, "redis_client", MemoryRedis())
+    store = ScoringStore()
+
+    await store.save_encoded(build_records(0, HOUR, 2, 2, 1, seed=0))
+    synthetics = await store.get_synthetics_for_range(HOUR)
+    organics = await store.get_organics_for_range(HOUR)
+
+    # Three AI modes and X, two UIDs each.
+    assert len(synthetics["ai_search"]) == 2 * 3 * 2
+    assert len(synthetics["x_search"]) == 2 * 2
+    assert len(organics["ai_search"]) == 2 * 3
+    assert {item["uid"] for item in synthetics["x_search"]} == {0, 1}
+    assert isinstance(organics["ai_search"][0]["response"], ScraperStreamingSynapse)
+    assert isinstance(synthetics["x_search"][0]["response"], TwitterSearchSynapse)
+
+
+async def test_stage_timer_restores_patched_methods():
+    class Owner:
+        async def work(self, value):
+            return value * 2
+
+    owner = Owner()
+    stages = StageTimer()
+    with stages.timing(owner, "work", "work"):
+        assert await owner.work(2) == 4
+        assert await owner.work(3) == 6
+
+    assert "work" not in vars(owner)
+    assert stages.report()["work"]["calls"] == 2
@@ -0,0 +1,84 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+
+from desearch.protocol import ResultType
+from desearch.stream import encode_sse_event
+from neurons.validators import api as api_module
+from neurons.validators.scrapers.advanced_scraper_validator import (
+    AdvancedScraperValidator,
+)
+
+EVENTS = [
+    {"type": "text", "role": "final_summary", "content": "line\nbreak"},
+    {"type": "search", "content": [{"link": "https://a.b"}]},
+    {"type": "completion", "content": "done"},
+]
+
+
+def _legacy_frame(chunk: str) -> bytes:
+    lines = chunk.split("\n")
+    sse_data = "\n".join(f"data: {line if line else ' '}" for line in lines)
+    return f"{sse_data}\n\n".encode()
+
+
+def test_encode_matches_legacy_framing():
+    for event in EVENTS:
+        assert encode_sse_event(event) == _legacy_frame(json.dumps(event))
+    assert encode_sse_event("a\n\nb") == _legacy_frame("a\n\nb")
+
+
+async def test_relay_streams_frames_and_closes_upstream(monkeypatch):
+    closed = []
+
+    async def organic(query, result_type):
+        try:
+            for event in EVENTS:
+                yield event
+        finally:
+            closed.append(True)
+
+    fake_api = SimpleNamespace(advanced_scraper_validator=MagicMock())
+    fake_api.advanced_scraper_validator.organic = organic
+    monkeypatch.setattr(api_module, "api", fake_api)
+    monkeypatch.setattr(api_module, "_build_query", lambda data: {})
+
+    request = SimpleNamespace(result_type=ResultType.LINKS_WITH_FINAL_SUMMARY)
+    relay = api_module.response_stream_event(request)
+
+    first = await relay.__anext__()
+    assert first == encode_sse_event(EVENTS[0])
+
+    await relay.aclose()
+    assert closed == [True]
+
+
+async def test_relay_disconnect_closes_the_miner_stream(monkeypatch):
+    closed = []
+
+    async def miner_stream():
+        try:
+            for event in EVENTS:
+                yield event
+        finally:
+            closed.append(True)
+
+    validator = object.__new__(AdvancedScraperValidator)
+    validator.language = "en"
+    validator.region = "us"
+    validator.date_filter = "qdr:w"
+    validator.call_miner = AsyncMock(
+        return_value=(miner_stream(), np.array([5]), 0.0, SimpleNamespace())
+    )
+    fake_api = SimpleNamespace(advanced_scraper_validator=validator)
+    monkeypatch.setattr(api_module, "api", fake_api)
+    monkeypatch.setattr(api_module, "_build_query", lambda data: {"content": "q"})
+
+    request = SimpleNamespace(result_type=ResultType.LINKS_WITH_FINAL_SUMMARY)
+    relay = api_module.response_stream_event(request)
+
+    assert await relay.__anext__() == encode_sse_event(EVENTS[0])
+    await relay.aclose()
+    assert closed == [True]
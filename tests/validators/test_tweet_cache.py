@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import desearch.utils as utils
+from desearch.protocol import TwitterScraperTweet
+from neurons.validators.apify import tweet_cache as tweet_cache_module
+from neurons.validators.apify.tweet_cache import TweetCache, ttl_for
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_tweet(tweet_id: str, created_at: datetime = NOW) -> TwitterScraperTweet:
+    return TwitterScraperTweet(
+        id=tweet_id,
+        text=f"tweet {tweet_id}",
+        reply_count=1,
+        retweet_count=2,
+        like_count=3,
+        quote_count=0,
+        bookmark_count=0,
+        url=f"https://x.com/user/status/{tweet_id}",
+        created_at=created_at.strftime("%a %b %d %H:%M:%S %z %Y"),
+        is_quote_tweet=False,
+        is_retweet=False,
+    )
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    async def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+        self.ttls[key] = ex
+
+    async def execute(self):
+        return []
+
+
+def test_ttl_grows_with_tweet_age():
+    assert ttl_for(make_tweet("1", NOW - timedelta(minutes=5)), NOW) == 60
+    assert ttl_for(make_tweet("1", NOW - timedelta(hours=3)), NOW) == 300
+    assert ttl_for(make_tweet("1", NOW - timedelta(days=30)), NOW) == 3600
+
+
+async def test_cache_round_trips_tweets(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(tweet_cache_module, "redis_client", fake)
+    cache = TweetCache()
+
+    await cache.put_many([make_tweet("1"), make_tweet("2")])
+    tweets = await cache.get_many(["1", "3"])
+
+    assert tweets == {"1": make_tweet("1")}
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = TweetCache()
+    monkeypatch.setattr(tweet_cache_module, "redis_client", FakeRedis())
+    monkeypatch.setattr(utils, "tweet_cache", cache)
+    return cache
+
+
+async def test_scrape_skips_actor_for_cached_tweets(cache, monkeypatch):
+    requested = []
+
+    async def get_tweets(self, urls):
+        requested.append(list(urls))
+        return [make_tweet(url.rsplit("/", 1)[-1]) for url in urls]
+
+    monkeypatch.setattr(utils.TwitterScraperActor, "get_tweets", get_tweets)
+    urls = [f"https://x.com/user/status/{i}" for i in range(1, 4)]
+
+    first, missing = await utils.scrape_tweets_with_retries(
+        urls[:2], group_size=2, max_attempts=1
+    )
+    second, missing = await utils.scrape_tweets_with_retries(
+        urls, group_size=2, max_attempts=1
+    )
+
+    assert requested == [urls[:2], urls[2:]]
+    assert sorted(tweet.id for tweet in second) == ["1", "2", "3"]
+    assert missing == []
+    assert cache.stats()["apify_runs"] == 2
+    assert cache.stats()["apify_runs_avoided"] == 1
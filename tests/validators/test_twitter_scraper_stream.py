@@ -0,0 +1,134 @@
+from types import SimpleNamespace
+
+import pytest
+
+from neurons.validators.apify.twitter_scraper_actor import TwitterScraperActor
+
+
+def make_item(tweet_id: str) -> dict:
+    return {
+        "id": tweet_id,
+        "text": f"tweet {tweet_id}",
+        "url": f"https://x.com/user/status/{tweet_id}",
+        "createdAt": "Thu Jan 01 12:00:00 +0000 2026",
+        "replyCount": 0,
+        "retweetCount": 0,
+        "likeCount": 0,
+        "quoteCount": 0,
+        "bookmarkCount": 0,
+        "isQuote": False,
+        "isRetweet": False,
+        "author": {"id": "1", "userName": "user"},
+    }
+
+
+class FakeRun:
+    """Pushes one batch of items per ``wait_for_finish`` poll."""
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.items = []
+        self.status = "RUNNING"
+        self.aborted = False
+        self.polls = 0
+
+    def start(self, run_input):
+        self.run_input = run_input
+        self._push()
+        return self._run()
+
+    def _run(self):
+        return {"id": "run", "defaultDatasetId": "ds", "status": self.status}
+
+    def _push(self):
+        if self.batches:
+            self.items.extend(self.batches.pop(0))
+        if not self.batches:
+            self.status = "SUCCEEDED"
+
+    async def wait_for_finish(self, wait_secs=None):
+        self.polls += 1
+        self._push()
+        return self._run()
+
+    async def abort(self, gracefully=None):
+        self.aborted = True
+        self.status = "ABORTED"
+
+    async def list_items(self, offset=0, limit=None):
+        return SimpleNamespace(items=self.items[offset : offset + limit])
+
+
+class FakeClient:
+    def __init__(self, run: FakeRun):
+        self.fake_run = run
+
+    def actor(self, actor_id):
+        async def start(run_input):
+            return self.fake_run.start(run_input)
+
+        return SimpleNamespace(start=start)
+
+    def run(self, run_id):
+        return self.fake_run
+
+    def dataset(self, dataset_id):
+        return self.fake_run
+
+
+@pytest.fixture
+def actor(monkeypatch):
+    monkeypatch.setenv("APIFY_API_KEY", "token")
+    return TwitterScraperActor()
+
+
+async def test_get_tweets_aborts_once_requested_ids_arrive(actor):
+    run = FakeRun(
+        [
+            [make_item("1"), {"noResults": True}],
+            [make_item("2")],
+            [make_item("3")],
+        ]
+    )
+    actor.client = FakeClient(run)
+
+    tweets = await actor.get_tweets(
+        ["https://x.com/user/status/1", "https://x.com/user/status/2"]
+    )
+
+    assert [tweet.id for tweet in tweets] == ["1", "2"]
+    assert run.run_input == {"tweetIDs": ["1", "2"]}
+    assert run.polls == 1
+    assert run.aborted
+
+
+async def test_get_tweets_advanced_stops_at_max_items(actor):
+    run = FakeRun([[make_item(str(i)) for i in range(5)], [make_item("9")]])
+    actor.client = FakeClient(run)
+
+    tweets = await actor.get_tweets_advanced(searchTerms=["bitcoin"], maxItems=3)
+
+    assert [tweet.id for tweet in tweets] == ["0", "1", "2"]
+    assert run.aborted
+
+
+async def test_stream_reads_everything_from_a_finished_run(actor):
+    run = FakeRun([[make_item("1")], [make_item("2")], [make_item("3")]])
+    actor.client = FakeClient(run)
+
+    tweets = await actor.get_tweets_advanced(searchTerms=["bitcoin"])
+
+    assert [tweet.id for tweet in tweets] == ["1", "2", "3"]
+    assert not run.aborted
+
+
+async def test_stream_aborts_when_consumer_stops_early(actor):
+    run = FakeRun([[make_item("1"), make_item("2")], [make_item("3")]])
+    actor.client = FakeClient(run)
+
+    stream = actor.stream_items(actor.actor_id, {})
+    first = await stream.__anext__()
+    await stream.aclose()
+
+    assert first["id"] == "1"
+    assert run.aborted
@@ -0,0 +1,42 @@
+from desearch.protocol import TwitterSearchSynapse
+from neurons.validators.utils.x_query_operators import (
+    parse_x_query,
+    x_search_constraints,
+)
+
+
+def test_operators_override_synapse_fields():
+    synapse = TwitterSearchSynapse(
+        query="Bitcoin from:Alice min_faves:10 filter:videos since:2024-01-01",
+        min_likes=5,
+        lang="en",
+        sort="Latest",
+    )
+
+    constraints = x_search_constraints(synapse)
+
+    assert constraints.user == "alice"
+    assert constraints.min_likes == 10
+    assert constraints.is_video is True
+    assert constraints.start_date == "2024-01-01"
+    assert constraints.lang == "en"
+    assert constraints.sort == "Latest"
+    assert constraints.words[0] == "bitcoin"
+
+
+def test_unparseable_values_are_ignored():
+    parsed = parse_x_query("x min_faves:lots min_replies:3 from:")
+
+    assert parsed.min_likes is None
+    assert parsed.min_replies == 3
+    assert parsed.user == ""
+    assert parsed.is_quote is None
+
+
+def test_constraints_are_memoized_per_query_and_fields():
+    first = x_search_constraints(TwitterSearchSynapse(query="x lang:de"))
+    again = x_search_constraints(TwitterSearchSynapse(query="x lang:de"))
+    other = x_search_constraints(TwitterSearchSynapse(query="x lang:de", sort="Top"))
+
+    assert first is again
+    assert other.sort == "Top" and other.lang == "de"
@@ -17,7 +17,32 @@ def _parse_csv(raw: str) -> list[str]:
 # VALIDATOR_URLS="http://1.2.3.4:8005,http://5.6.7.8:8005"
 VALIDATOR_URLS = _parse_csv(os.getenv("VALIDATOR_URLS", ""))
 
+# /miners is served from a snapshot refreshed every MINERS_REFRESH_INTERVAL
+# seconds. A validator with no answer for MINERS_STALE_AFTER seconds is shown
+# offline; miner detail views are reused for MINER_DETAIL_TTL seconds.
+MINERS_REFRESH_INTERVAL = float(os.getenv("MINERS_REFRESH_INTERVAL", "30"))
+MINERS_STALE_AFTER = float(os.getenv("MINERS_STALE_AFTER", "180"))
+MINER_DETAIL_TTL = float(os.getenv("MINER_DETAIL_TTL", "60"))
+
 # Comma-separated CORS origins. Override locally to test from the dev frontend.
 CORS_ALLOWED_ORIGINS = _parse_csv(
     os.getenv("CORS_ALLOWED_ORIGINS", "https://mining.desearch.ai")
 )
+
+# Days of miner_response_logs partitions to keep; 0 keeps everything.
+LOG_RETENTION_DAYS = int(os.getenv("LOG_RETENTION_DAYS", "0"))
+
+# Daily partitions created ahead of time so inserts never miss one.
+LOG_PARTITION_PREMAKE_DAYS = int(os.getenv("LOG_PARTITION_PREMAKE_DAYS", "3"))
+
+# Database connection mode:
+#   nullpool  - no client-side pool; a new connection per session (default).
+#   pgbouncer - client-side pool in front of a transaction-mode pooler;
+#               asyncpg statement caches off, unique prepared statement names.
+#   direct    - client-side pool straight to Postgres with statement caching.
+DB_POOL_MODE = os.getenv("DB_POOL_MODE", "nullpool")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "500"))
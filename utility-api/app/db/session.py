@@ -1,18 +1,118 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
+import uuid
 
-from app.config import DB_URL
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
 
-# Transaction-mode connection pooler handles pooling itself, so use NullPool
-# client-side and disable asyncpg prepared statements (incompatible with
-# transaction pooling).
-engine = create_async_engine(
+from app.config import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_MODE,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_STATEMENT_CACHE_SIZE,
     DB_URL,
-    echo=False,
-    poolclass=NullPool,
-    connect_args={"statement_cache_size": 0, "prepared_statement_cache_size": 0},
 )
 
+POOL_MODES = ("pgbouncer", "direct", "nullpool")
+
+
+def _unique_statement_name() -> str:
+    # A transaction pooler may hand the next transaction to another server
+    # connection, so prepared statement names must never be reused.
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+class PoolMetrics:
+    """Connection pool counters, fed by pool events on the engine."""
+
+    def __init__(self, engine: AsyncEngine, mode: str) -> None:
+        self.engine = engine
+        self.mode = mode
+        self.connects = 0
+        self.checkouts = 0
+        self.invalidations = 0
+
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "connect", self._on_connect)
+        event.listen(sync_engine, "checkout", self._on_checkout)
+        event.listen(sync_engine, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, proxy) -> None:
+        self.checkouts += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        self.invalidations += 1
+
+    def snapshot(self) -> dict:
+        pool = self.engine.pool
+        stats = {
+            "mode": self.mode,
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "invalidations": self.invalidations,
+        }
+        if not isinstance(pool, NullPool):
+            stats.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+            )
+        return stats
+
+
+def build_engine(url: str = DB_URL, mode: str = DB_POOL_MODE) -> AsyncEngine:
+    if mode not in POOL_MODES:
+        raise ValueError(f"DB_POOL_MODE must be one of {POOL_MODES}, got {mode!r}")
+
+    if mode == "nullpool":
+        # The external pooler handles pooling itself, so skip the client-side
+        # pool and disable asyncpg prepared statements.
+        engine = create_async_engine(
+            url,
+            echo=False,
+            poolclass=NullPool,
+            connect_args={
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+            },
+        )
+    else:
+        if mode == "pgbouncer":
+            connect_args = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": _unique_statement_name,
+            }
+        else:
+            connect_args = {"statement_cache_size": DB_STATEMENT_CACHE_SIZE}
+
+        engine = create_async_engine(
+            url,
+            echo=False,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+            pool_pre_ping=True,
+            connect_args=connect_args,
+        )
+
+    return engine
+
+
+engine = build_engine()
+pool_metrics = PoolMetrics(engine, DB_POOL_MODE)
+
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -0,0 +1,97 @@
+"""
+Bulk ingest of miner response logs with asyncpg's binary COPY.
+
+Rows are streamed with ``copy_records_to_table`` instead of a multi-row
+``INSERT ... VALUES``, so Postgres skips statement parsing and per-row
+parameter binding. Null bytes, which Postgres cannot store in text or JSONB,
+are removed from the few text columns directly and from the JSON payloads
+on their serialized form rather than by walking every payload.
+"""
+
+import json
+import re
+import uuid
+from datetime import datetime, timezone
+
+from app.domains.logs.models.miner_response_log import MinerResponseLog
+from app.domains.logs.schemas import MinerResponseLogCreate
+from sqlalchemy.ext.asyncio import AsyncSession
+
+COPY_COLUMNS = (
+    "id",
+    "created_at",
+    "query_kind",
+    "search_type",
+    "netuid",
+    "scoring_epoch_start",
+    "miner_uid",
+    "miner_hotkey",
+    "miner_coldkey",
+    "validator_uid",
+    "validator_hotkey",
+    "validator_coldkey",
+    "request_query",
+    "status_code",
+    "process_time",
+    "total_reward",
+    "response_payload",
+    "reward_payload",
+)
+
+# ``\u0000`` escapes in serialized JSON, skipping escaped backslashes such as
+# the literal text ``\\u0000``.
+_JSON_NUL_ESCAPE = re.compile(r"(?<!\\)((?:\\\\)*)\\u0000")
+
+
+def _text(value: str | None) -> str | None:
+    if value is None or "\x00" not in value:
+        return value
+    return value.replace("\x00", "")
+
+
+def _json(value) -> str | None:
+    if value is None:
+        return None
+    encoded = json.dumps(value, separators=(",", ":"), default=str)
+    if "\\u0000" not in encoded:
+        return encoded
+    return _JSON_NUL_ESCAPE.sub(r"\1", encoded)
+
+
+def build_copy_record(log: MinerResponseLogCreate, created_at: datetime) -> tuple:
+    # Enum columns store member names, as SQLAlchemy's Enum type does.
+    return (
+        uuid.uuid4(),
+        created_at,
+        log.query_kind.name,
+        log.search_type.name,
+        log.netuid,
+        log.scoring_epoch_start,
+        log.miner_uid,
+        _text(log.miner_hotkey),
+        _text(log.miner_coldkey),
+        log.validator_uid,
+        _text(log.validator_hotkey),
+        _text(log.validator_coldkey),
+        _text(log.request_query),
+        log.status_code,
+        log.process_time,
+        log.total_reward,
+        _json(log.response_payload),
+        _json(log.reward_payload),
+    )
+
+
+async def copy_logs(session: AsyncSession, logs: list[MinerResponseLogCreate]) -> int:
+    """COPY ``logs`` in the session's transaction; returns the row count."""
+    created_at = datetime.now(timezone.utc)
+    records = [build_copy_record(log, created_at) for log in logs]
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    status = await raw_connection.driver_connection.copy_records_to_table(
+        MinerResponseLog.__tablename__,
+        records=records,
+        columns=COPY_COLUMNS,
+    )
+    return int(status.rsplit(" ", 1)[-1])
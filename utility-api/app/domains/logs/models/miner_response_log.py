@@ -7,11 +7,18 @@ from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 
 class MinerResponseLog(Base):
+    """Range-partitioned by day on ``created_at``; partitions are managed in
+    ``app.domains.logs.partitions``."""
+
     __tablename__ = "miner_response_logs"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Part of the primary key because Postgres requires the partition key in it.
     created_at = Column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        DateTime(timezone=True),
+        primary_key=True,
+        server_default=func.now(),
+        nullable=False,
     )
 
     query_kind = Column(
@@ -85,4 +92,5 @@ class MinerResponseLog(Base):
             postgresql_using="gin",
             postgresql_ops={"request_query": "gin_trgm_ops"},
         ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
@@ -0,0 +1,115 @@
+"""
+Daily range partitions of ``miner_response_logs`` on ``created_at``.
+
+Partitions are named ``miner_response_logs_pYYYYMMDD`` and cover one UTC day.
+``maintain_partitions`` creates today's partition plus a few days ahead and,
+when a retention window is configured, drops whole partitions that fell out
+of it, which is far cheaper than deleting rows from one large table.
+"""
+
+import re
+from datetime import date, datetime, time, timedelta, timezone
+
+from app.config import LOG_PARTITION_PREMAKE_DAYS, LOG_RETENTION_DAYS
+from app.domains.logs.models.miner_response_log import MinerResponseLog
+from app.logger import get_logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = get_logger(__name__)
+
+PARENT_TABLE = MinerResponseLog.__tablename__
+PARTITION_PREFIX = f"{PARENT_TABLE}_p"
+_PARTITION_NAME = re.compile(rf"^{PARTITION_PREFIX}(\d{{8}})$")
+
+
+def partition_name(day: date) -> str:
+    return f"{PARTITION_PREFIX}{day:%Y%m%d}"
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+async def create_partition(conn: AsyncConnection, day: date) -> None:
+    await conn.execute(
+        text(
+            f'CREATE TABLE IF NOT EXISTS "{partition_name(day)}" '
+            f'PARTITION OF "{PARENT_TABLE}" '
+            f"FOR VALUES FROM ('{_day_start(day).isoformat()}') "
+            f"TO ('{_day_start(day + timedelta(days=1)).isoformat()}')"
+        )
+    )
+
+
+async def list_partitions(conn: AsyncConnection) -> dict[date, str]:
+    result = await conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "WHERE parent.relname = :parent"
+        ),
+        {"parent": PARENT_TABLE},
+    )
+
+    partitions = {}
+    for (name,) in result.all():
+        match = _PARTITION_NAME.match(name)
+        if match:
+            partitions[datetime.strptime(match.group(1), "%Y%m%d").date()] = name
+    return partitions
+
+
+async def ensure_partitions(
+    conn: AsyncConnection,
+    today: date,
+    days_ahead: int = LOG_PARTITION_PREMAKE_DAYS,
+    since: date | None = None,
+) -> list[str]:
+    """Create missing partitions from ``since`` (default today) through
+    ``today + days_ahead``."""
+    existing = await list_partitions(conn)
+    day = since or today
+    created = []
+    while day <= today + timedelta(days=days_ahead):
+        if day not in existing:
+            await create_partition(conn, day)
+            created.append(partition_name(day))
+        day += timedelta(days=1)
+    return created
+
+
+async def drop_expired_partitions(
+    conn: AsyncConnection, today: date, retention_days: int
+) -> list[str]:
+    """Drop partitions whose whole day is older than ``retention_days``."""
+    if retention_days <= 0:
+        return []
+
+    cutoff = today - timedelta(days=retention_days)
+    dropped = []
+    for day, name in sorted((await list_partitions(conn)).items()):
+        if day >= cutoff:
+            break
+        await conn.execute(text(f'DROP TABLE IF EXISTS "{name}"'))
+        dropped.append(name)
+    return dropped
+
+
+async def maintain_partitions(
+    engine: AsyncEngine,
+    today: date | None = None,
+    retention_days: int = LOG_RETENTION_DAYS,
+) -> dict[str, list[str]]:
+    today = today or datetime.now(timezone.utc).date()
+    async with engine.begin() as conn:
+        created = await ensure_partitions(conn, today)
+        dropped = await drop_expired_partitions(conn, today, retention_days)
+
+    if created or dropped:
+        logger.info(
+            f"Maintained miner response log partitions: "
+            f"created={created} dropped={dropped}"
+        )
+    return {"created": created, "dropped": dropped}
@@ -1,14 +1,21 @@
-from datetime import datetime
+import base64
+import json
+import zlib
+from datetime import datetime, timezone
+from typing import Callable
+from uuid import UUID
 
 from app.auth import get_hotkey
 from app.db.session import get_session
 from app.domains.logs.enums import QueryKind, SearchType
+from app.domains.logs.ingest import copy_logs
 from app.domains.logs.models.miner_response_log import MinerResponseLog
 from app.domains.logs.schemas import (
     BatchOrganicMatchResult,
     BatchOrganicSearchRequest,
     BatchOrganicSearchResponse,
     GetScoringLogsResponse,
+    LogPayloadResponse,
     OrganicLogResponse,
     SaveMinerResponseLogsRequest,
     SaveMinerResponseLogsResponse,
@@ -16,15 +23,60 @@ from app.domains.logs.schemas import (
     ScoringValidatorLogResponse,
 )
 from app.logger import get_logger
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import and_, or_, select
-from sqlalchemy.dialects.postgresql import insert
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy import DateTime, and_, func, literal, or_, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-router = APIRouter(prefix="/logs", tags=["logs"])
 logger = get_logger(__name__)
 
+MAX_DECOMPRESSED_BODY_BYTES = 64 * 1024 * 1024
+
+
+def _gunzip_body(body: bytes) -> bytes:
+    """Inflate a gzip request body, refusing anything that expands past
+    ``MAX_DECOMPRESSED_BODY_BYTES``."""
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    try:
+        inflated = decompressor.decompress(body, MAX_DECOMPRESSED_BODY_BYTES)
+    except zlib.error as e:
+        raise HTTPException(status_code=400, detail="Invalid gzip body") from e
+    if decompressor.unconsumed_tail:
+        raise HTTPException(status_code=413, detail="Decompressed body too large")
+    if not decompressor.eof:
+        raise HTTPException(status_code=400, detail="Truncated gzip body")
+    return inflated
+
+
+class GzipRequest(Request):
+    async def body(self) -> bytes:
+        if not hasattr(self, "_body"):
+            body = await super().body()
+            if self.headers.get("Content-Encoding", "").lower() == "gzip":
+                body = _gunzip_body(body)
+            self._body = body
+        return self._body
+
+
+class GzipRoute(APIRoute):
+    """Accept ``Content-Encoding: gzip`` bodies from the validator log shipper."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def gzip_route_handler(request: Request) -> Response:
+            return await handler(GzipRequest(request.scope, request.receive))
+
+        return gzip_route_handler
+
+
+router = APIRouter(prefix="/logs", tags=["logs"], route_class=GzipRoute)
+
 SCORING_GROUP_LIMIT = 20
+SCORING_GROUP_MAX_LIMIT = 100
+# Lower created_at bound for groups without an epoch start.
+SCORING_EPOCH_FLOOR = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
 PAYLOAD_NETWORK_BLOCKS = ("axon", "dendrite")
 REDACTED_IP = "0.0.0.0"
@@ -69,27 +121,6 @@ def _normalize_optional_query(query: str | None) -> str | None:
     return normalized_query or None
 
 
-def _build_log_values(body: SaveMinerResponseLogsRequest) -> list[dict]:
-    """Keep Python-native datatypes for SQLAlchemy inserts."""
-    return [_sanitize_log_value(log.model_dump(mode="python")) for log in body.logs]
-
-
-def _sanitize_log_value(value):
-    """Strip null bytes that Postgres cannot store in text/JSONB values."""
-    if isinstance(value, str):
-        return value.replace("\x00", "")
-    if isinstance(value, dict):
-        return {
-            _sanitize_log_value(key): _sanitize_log_value(item)
-            for key, item in value.items()
-        }
-    if isinstance(value, list):
-        return [_sanitize_log_value(item) for item in value]
-    if isinstance(value, tuple):
-        return tuple(_sanitize_log_value(item) for item in value)
-    return value
-
-
 @router.post("", response_model=SaveMinerResponseLogsResponse)
 async def save_logs(
     body: SaveMinerResponseLogsRequest,
@@ -104,13 +135,9 @@ async def save_logs(
         return SaveMinerResponseLogsResponse(inserted=0)
 
     try:
-        values = _build_log_values(body)
-        stmt = insert(MinerResponseLog).values(values)
-
-        result = await session.execute(stmt)
+        inserted = await copy_logs(session, body.logs)
         await session.commit()
 
-        inserted = result.rowcount or 0
         logger.info(
             f"Saved miner response logs: "
             f"requester_hotkey={requester_hotkey} "
@@ -126,8 +153,71 @@ async def save_logs(
         raise
 
 
+SCORING_LOG_COLUMNS = (
+    MinerResponseLog.id,
+    MinerResponseLog.created_at,
+    MinerResponseLog.scoring_epoch_start,
+    MinerResponseLog.miner_uid,
+    MinerResponseLog.miner_hotkey,
+    MinerResponseLog.miner_coldkey,
+    MinerResponseLog.search_type,
+    MinerResponseLog.request_query,
+    MinerResponseLog.validator_uid,
+    MinerResponseLog.validator_hotkey,
+    MinerResponseLog.validator_coldkey,
+    MinerResponseLog.status_code,
+    MinerResponseLog.process_time,
+    MinerResponseLog.total_reward,
+)
+SCORING_LOG_PAYLOAD_COLUMNS = (
+    MinerResponseLog.response_payload,
+    MinerResponseLog.reward_payload,
+)
+
+
+def _scoring_group_key(log) -> tuple:
+    return (
+        log.scoring_epoch_start,
+        log.miner_uid,
+        log.search_type,
+        log.request_query,
+    )
+
+
+def encode_scoring_cursor(group_key: tuple) -> str:
+    scoring_epoch_start, miner_uid, search_type, request_query = group_key
+    raw = json.dumps(
+        [
+            None if scoring_epoch_start is None else scoring_epoch_start.isoformat(),
+            miner_uid,
+            SearchType(search_type).value,
+            request_query,
+        ]
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_scoring_cursor(cursor: str) -> tuple:
+    try:
+        scoring_epoch_start, miner_uid, search_type, request_query = json.loads(
+            base64.urlsafe_b64decode(cursor.encode())
+        )
+        return (
+            (
+                None
+                if scoring_epoch_start is None
+                else datetime.fromisoformat(scoring_epoch_start)
+            ),
+            None if miner_uid is None else int(miner_uid),
+            SearchType(search_type),
+            str(request_query),
+        )
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
 def _build_reward_stats(
-    logs: list[MinerResponseLog],
+    logs: list,
 ) -> tuple[float | None, float | None, float | None]:
     rewards = [log.total_reward for log in logs if log.total_reward is not None]
     if not rewards:
@@ -137,23 +227,19 @@ def _build_reward_stats(
 
 
 def _build_scoring_groups(
-    logs: list[MinerResponseLog],
+    logs: list,
+    include_payloads: bool = False,
 ) -> list[ScoringLogGroupResponse]:
-    grouped_logs: dict[tuple, list[MinerResponseLog]] = {}
+    """Group rows that arrive in keyset order; groups keep that order."""
+    grouped_logs: dict[tuple, list] = {}
 
     for log in logs:
-        group_key = (
-            log.scoring_epoch_start,
-            log.miner_uid,
-            log.request_query,
-            log.search_type,
-        )
-        grouped_logs.setdefault(group_key, []).append(log)
+        grouped_logs.setdefault(_scoring_group_key(log), []).append(log)
 
     groups: list[ScoringLogGroupResponse] = []
 
     for group_key, group_logs in grouped_logs.items():
-        scoring_epoch_start, miner_uid, request_query, search_type = group_key
+        scoring_epoch_start, miner_uid, search_type, request_query = group_key
         sorted_logs = sorted(
             group_logs,
             key=lambda log: (
@@ -187,130 +273,176 @@ def _build_scoring_groups(
                         status_code=log.status_code,
                         process_time=log.process_time,
                         total_reward=log.total_reward,
-                        response_payload=_strip_network_fields(log.response_payload),
-                        reward_payload=log.reward_payload,
+                        response_payload=(
+                            _strip_network_fields(log.response_payload)
+                            if include_payloads
+                            else None
+                        ),
+                        reward_payload=(
+                            log.reward_payload if include_payloads else None
+                        ),
                     )
                     for log in sorted_logs
                 ],
             )
         )
 
-    return sorted(
-        groups,
-        key=lambda group: (
-            -group.scoring_epoch_start.timestamp(),
-            group.miner_uid is None,
-            group.miner_uid if group.miner_uid is not None else 0,
-            group.search_type.value,
-            group.request_query,
-        ),
-    )
+    return groups
 
 
-def _build_scoring_group_filter(
-    scoring_epoch_start: datetime | None,
-    miner_uid: int | None,
-    request_query: str,
-    search_type: SearchType,
-):
-    return and_(
-        (
-            MinerResponseLog.scoring_epoch_start.is_(None)
-            if scoring_epoch_start is None
-            else MinerResponseLog.scoring_epoch_start == scoring_epoch_start
+def _build_after_cursor_filter(entity, cursor: tuple):
+    """Rows strictly after ``cursor`` in (scoring_epoch_start DESC NULLS LAST,
+    miner_uid ASC NULLS LAST, search_type, request_query) order."""
+    scoring_epoch_start, miner_uid, search_type, request_query = cursor
+    after_search_key = or_(
+        entity.search_type > search_type,
+        and_(
+            entity.search_type == search_type,
+            entity.request_query > request_query,
         ),
-        (
-            MinerResponseLog.miner_uid.is_(None)
-            if miner_uid is None
-            else MinerResponseLog.miner_uid == miner_uid
-        ),
-        MinerResponseLog.request_query == request_query,
-        MinerResponseLog.search_type == search_type,
+    )
+    if miner_uid is None:
+        after_miner = and_(entity.miner_uid.is_(None), after_search_key)
+    else:
+        after_miner = or_(
+            entity.miner_uid > miner_uid,
+            entity.miner_uid.is_(None),
+            and_(entity.miner_uid == miner_uid, after_search_key),
+        )
+    if scoring_epoch_start is None:
+        return and_(entity.scoring_epoch_start.is_(None), after_miner)
+    return or_(
+        entity.scoring_epoch_start < scoring_epoch_start,
+        entity.scoring_epoch_start.is_(None),
+        and_(entity.scoring_epoch_start == scoring_epoch_start, after_miner),
     )
 
 
-async def _load_scoring_logs(
-    session: AsyncSession,
+def _build_scoring_row_filters(
+    entity,
+    miner_coldkey: str | None,
+    validator_uid: int | None,
+) -> list:
+    """Filters on columns outside the group key, applied to every row."""
+    filters = [entity.query_kind == QueryKind.SCORING]
+
+    if miner_coldkey is not None:
+        filters.append(entity.miner_coldkey == miner_coldkey)
+
+    if validator_uid is not None:
+        filters.append(entity.validator_uid == validator_uid)
+
+    return filters
+
+
+def _build_scoring_filters(
+    entity,
     scoring_epoch_start: datetime | None,
     search_type: SearchType,
     miner_uids: list[int] | None,
     query: str | None,
-    miner_coldkey: str | None = None,
-    validator_uid: int | None = None,
-) -> list[MinerResponseLog]:
-    normalized_query = _normalize_optional_query(query)
-    filters = [
-        MinerResponseLog.query_kind == QueryKind.SCORING,
-        MinerResponseLog.search_type == search_type,
-    ]
+    miner_coldkey: str | None,
+    validator_uid: int | None,
+) -> list:
+    filters = _build_scoring_row_filters(entity, miner_coldkey, validator_uid)
+    filters.append(entity.search_type == search_type)
 
     if scoring_epoch_start is not None:
-        filters.append(MinerResponseLog.scoring_epoch_start == scoring_epoch_start)
+        filters.append(entity.scoring_epoch_start == scoring_epoch_start)
+        # Scoring logs are written after their epoch starts, so bounding
+        # created_at lets Postgres prune the older daily partitions.
+        filters.append(entity.created_at >= scoring_epoch_start)
 
     if miner_uids:
-        filters.append(MinerResponseLog.miner_uid.in_(miner_uids))
+        filters.append(entity.miner_uid.in_(miner_uids))
 
-    if miner_coldkey is not None:
-        filters.append(MinerResponseLog.miner_coldkey == miner_coldkey)
+    if query is not None:
+        filters.append(entity.request_query.ilike(f"%{query}%"))
 
-    if validator_uid is not None:
-        filters.append(MinerResponseLog.validator_uid == validator_uid)
-
-    if normalized_query is not None:
-        filters.append(MinerResponseLog.request_query.ilike(f"%{normalized_query}%"))
-
-    if not miner_uids and normalized_query is None:
-        limited_group_keys_stmt = (
-            select(
-                MinerResponseLog.scoring_epoch_start,
-                MinerResponseLog.miner_uid,
-                MinerResponseLog.request_query,
-                MinerResponseLog.search_type,
-            )
-            .where(*filters)
-            .distinct()
-            .order_by(
-                MinerResponseLog.scoring_epoch_start.desc().nullslast(),
-                MinerResponseLog.miner_uid,
-                MinerResponseLog.search_type,
-                MinerResponseLog.request_query,
-            )
-            .limit(SCORING_GROUP_LIMIT)
-        )
-        group_key_rows = (await session.execute(limited_group_keys_stmt)).all()
-
-        if not group_key_rows:
-            return []
-
-        filters.append(
-            or_(
-                *[
-                    _build_scoring_group_filter(
-                        scoring_epoch_start=row[0],
-                        miner_uid=row[1],
-                        request_query=row[2],
-                        search_type=row[3],
-                    )
-                    for row in group_key_rows
-                ]
-            )
-        )
+    return filters
 
-    stmt = (
-        select(MinerResponseLog)
-        .where(*filters)
+
+def _build_scoring_logs_stmt(
+    scoring_epoch_start: datetime | None,
+    search_type: SearchType,
+    miner_uids: list[int] | None,
+    query: str | None,
+    miner_coldkey: str | None = None,
+    validator_uid: int | None = None,
+    cursor: tuple | None = None,
+    limit: int | None = SCORING_GROUP_LIMIT,
+    include_payloads: bool = False,
+):
+    """One statement: the next ``limit + 1`` group keys in keyset order (every
+    key when ``limit`` is ``None``), each joined LATERAL to its validator
+    rows, projecting scalar columns only unless payloads are requested."""
+    filter_args = dict(
+        scoring_epoch_start=scoring_epoch_start,
+        search_type=search_type,
+        miner_uids=miner_uids,
+        query=_normalize_optional_query(query),
+        miner_coldkey=miner_coldkey,
+        validator_uid=validator_uid,
+    )
+
+    group_filters = _build_scoring_filters(MinerResponseLog, **filter_args)
+    if cursor is not None:
+        group_filters.append(_build_after_cursor_filter(MinerResponseLog, cursor))
+
+    group_keys = (
+        select(
+            MinerResponseLog.scoring_epoch_start,
+            MinerResponseLog.miner_uid,
+            MinerResponseLog.search_type,
+            MinerResponseLog.request_query,
+        )
+        .where(*group_filters)
+        .distinct()
         .order_by(
             MinerResponseLog.scoring_epoch_start.desc().nullslast(),
-            MinerResponseLog.miner_uid,
+            MinerResponseLog.miner_uid.asc().nullslast(),
             MinerResponseLog.search_type,
             MinerResponseLog.request_query,
-            MinerResponseLog.validator_uid,
-            MinerResponseLog.id,
         )
+        .limit(None if limit is None else limit + 1)
+        .cte("group_keys")
     )
 
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    log = aliased(MinerResponseLog)
+    columns = SCORING_LOG_COLUMNS + (
+        SCORING_LOG_PAYLOAD_COLUMNS if include_payloads else ()
+    )
+    group_logs = (
+        select(*[getattr(log, column.key) for column in columns])
+        .where(
+            log.scoring_epoch_start.is_not_distinct_from(
+                group_keys.c.scoring_epoch_start
+            ),
+            log.miner_uid.is_not_distinct_from(group_keys.c.miner_uid),
+            log.search_type == group_keys.c.search_type,
+            log.request_query == group_keys.c.request_query,
+            log.created_at
+            >= func.coalesce(
+                group_keys.c.scoring_epoch_start,
+                literal(SCORING_EPOCH_FLOOR, DateTime(timezone=True)),
+            ),
+            *_build_scoring_row_filters(log, miner_coldkey, validator_uid),
+        )
+        .lateral("group_logs")
+    )
+
+    return (
+        select(group_logs)
+        .select_from(group_keys.join(group_logs, true()))
+        .order_by(
+            group_keys.c.scoring_epoch_start.desc().nullslast(),
+            group_keys.c.miner_uid.asc().nullslast(),
+            group_keys.c.search_type,
+            group_keys.c.request_query,
+            group_logs.c.validator_uid,
+            group_logs.c.id,
+        )
+    )
 
 
 @router.get("/scoring", response_model=GetScoringLogsResponse)
@@ -335,19 +467,91 @@ async def get_scoring_logs(
         None,
         description="Optional validator UID to filter by.",
     ),
+    cursor: str | None = Query(
+        None,
+        description="Opaque `next_cursor` from the previous page.",
+    ),
+    limit: int | None = Query(
+        None,
+        ge=1,
+        le=SCORING_GROUP_MAX_LIMIT,
+        description=(
+            f"Maximum number of groups per page. Defaults to "
+            f"{SCORING_GROUP_LIMIT}; requests filtered by `miner_uids` or "
+            "`query` return every matching group unless a `cursor` or "
+            "`limit` is passed."
+        ),
+    ),
+    include_payloads: bool = Query(
+        False,
+        description=(
+            "Also return response/reward payloads. Prefer "
+            "`GET /logs/{log_id}/payload` for the logs actually opened."
+        ),
+    ),
     session: AsyncSession = Depends(get_session),
 ):
-    logs = await _load_scoring_logs(
-        session=session,
+    # Filtered lookups return every match, as before pagination, unless the
+    # caller pages explicitly.
+    filtered = bool(miner_uids) or _normalize_optional_query(query) is not None
+    if limit is None and (cursor is not None or not filtered):
+        limit = SCORING_GROUP_LIMIT
+
+    stmt = _build_scoring_logs_stmt(
         scoring_epoch_start=scoring_epoch_start,
         search_type=search_type,
         miner_uids=miner_uids,
         query=query,
         miner_coldkey=miner_coldkey,
         validator_uid=validator_uid,
+        cursor=decode_scoring_cursor(cursor) if cursor else None,
+        limit=limit,
+        include_payloads=include_payloads,
+    )
+    logs = (await session.execute(stmt)).all()
+
+    # The statement reads one group past the page to tell whether more exist.
+    group_keys = list(dict.fromkeys(_scoring_group_key(log) for log in logs))
+    next_cursor = None
+    if limit is not None and len(group_keys) > limit:
+        page_keys = set(group_keys[:limit])
+        logs = [log for log in logs if _scoring_group_key(log) in page_keys]
+        next_cursor = encode_scoring_cursor(group_keys[limit - 1])
+
+    return GetScoringLogsResponse(
+        groups=_build_scoring_groups(logs, include_payloads=include_payloads),
+        next_cursor=next_cursor,
     )
 
-    return GetScoringLogsResponse(groups=_build_scoring_groups(logs))
+
+@router.get("/{log_id}/payload", response_model=LogPayloadResponse)
+async def get_log_payload(
+    log_id: UUID,
+    created_at: datetime | None = Query(
+        None,
+        description="Optional `created_at` of the log, to read a single partition.",
+    ),
+    session: AsyncSession = Depends(get_session),
+):
+    filters = [MinerResponseLog.id == log_id]
+    if created_at is not None:
+        filters.append(MinerResponseLog.created_at == created_at)
+
+    stmt = select(
+        MinerResponseLog.id,
+        MinerResponseLog.created_at,
+        *SCORING_LOG_PAYLOAD_COLUMNS,
+    ).where(*filters)
+    log = (await session.execute(stmt)).first()
+    if log is None:
+        raise HTTPException(status_code=404, detail="Log not found")
+
+    return LogPayloadResponse(
+        id=log.id,
+        created_at=log.created_at,
+        response_payload=_strip_network_fields(log.response_payload),
+        reward_payload=log.reward_payload,
+    )
 
 
 ORGANIC_LOG_LIMIT = 500
@@ -51,12 +51,13 @@ class ScoringValidatorLogResponse(BaseModel):
     status_code: int | None = None
     process_time: float | None = None
     total_reward: float | None = None
-    response_payload: dict[str, Any] = Field(default_factory=dict)
+    # Only filled when requested; otherwise use GET /logs/{id}/payload.
+    response_payload: dict[str, Any] | None = None
     reward_payload: dict[str, Any] | None = None
 
 
 class ScoringLogGroupResponse(BaseModel):
-    scoring_epoch_start: datetime
+    scoring_epoch_start: datetime | None = None
     miner_uid: int | None = None
     miner_hotkey: str
     miner_coldkey: str | None = None
@@ -71,6 +72,14 @@ class ScoringLogGroupResponse(BaseModel):
 
 class GetScoringLogsResponse(BaseModel):
     groups: list[ScoringLogGroupResponse]
+    next_cursor: str | None = None
+
+
+class LogPayloadResponse(BaseModel):
+    id: UUID
+    created_at: datetime
+    response_payload: dict[str, Any] = Field(default_factory=dict)
+    reward_payload: dict[str, Any] | None = None
 
 
 class OrganicLogResponse(BaseModel):
@@ -0,0 +1,344 @@
+"""
+Stale-while-revalidate cache of the miner state reported by validators.
+
+A background task polls every validator's ``/public/miners`` each
+``MINERS_REFRESH_INTERVAL`` seconds over one keep-alive session, sending
+``If-None-Match`` so an unchanged validator answers with a bare 304. After
+each round the aggregated ``/miners`` body is built and serialized once;
+requests only read that snapshot. A validator that stops answering keeps its
+last payload until it is ``MINERS_STALE_AFTER`` seconds old.
+
+Miner detail is cached per hotkey for ``MINER_DETAIL_TTL`` seconds. An
+expired entry is still served while a single background fetch refreshes it.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+import aiohttp
+
+from app.config import (
+    MINER_DETAIL_TTL,
+    MINERS_REFRESH_INTERVAL,
+    MINERS_STALE_AFTER,
+    VALIDATOR_URLS,
+)
+from app.domains.miners.client import (
+    REQUEST_TIMEOUT,
+    _validator_info,
+    fetch_miner_detail,
+)
+from app.domains.miners.schemas import (
+    MinerDetail,
+    MinerDetailResponse,
+    MinerListItem,
+    MinerListResponse,
+    MinerTypeState,
+    ScoringWindow,
+    ValidatorInfo,
+    ValidatorMinerView,
+)
+from app.logger import get_logger
+
+logger = get_logger(__name__)
+
+MINER_DETAIL_MAX_ENTRIES = 1024
+
+
+def _utc(timestamp: Optional[float]) -> Optional[datetime]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+@dataclass
+class ValidatorPoll:
+    index: int
+    url: str
+    payload: Optional[dict] = None
+    etag: Optional[str] = None
+    last_success: Optional[float] = None
+    last_error: Optional[str] = None
+
+    def is_fresh(self, now: float, stale_after: float) -> bool:
+        return self.last_success is not None and now - self.last_success <= stale_after
+
+
+@dataclass
+class MinersSnapshot:
+    body: bytes
+    etag: str
+    built_at: float
+    miners_by_hotkey: dict[str, MinerListItem]
+
+    def age(self) -> float:
+        return max(0.0, time.time() - self.built_at)
+
+
+@dataclass
+class _DetailEntry:
+    response: Optional[MinerDetailResponse]
+    fetched_at: float
+
+
+def build_miner_list(
+    results: list[tuple[ValidatorInfo, Optional[dict]]],
+) -> list[MinerListItem]:
+    by_miner: dict[str, dict] = {}
+
+    for info, data in results:
+        if not data:
+            continue
+        for m in data.get("miners", []):
+            entry = by_miner.setdefault(
+                m["hotkey"],
+                {
+                    "hotkey": m["hotkey"],
+                    "uid": m["uid"],
+                    "coldkey": m["coldkey"],
+                    "by_validator": {},
+                },
+            )
+            entry["by_validator"][info.id] = {
+                st: MinerTypeState(**state) for st, state in m["per_type"].items()
+            }
+
+    miners = [MinerListItem(**v) for v in by_miner.values()]
+    miners.sort(key=lambda m: m.uid)
+    return miners
+
+
+def build_miner_detail(
+    results: list[tuple[ValidatorInfo, Optional[dict]]],
+) -> Optional[MinerDetailResponse]:
+    """One view per validator; ``None`` when no validator knows the miner."""
+    views: list[ValidatorMinerView] = []
+    for info, data in results:
+        miner = (data or {}).get("miner") if data else None
+        if not miner:
+            views.append(ValidatorMinerView(validator=info, detail=None))
+            continue
+
+        per_type = {
+            st: MinerTypeState(**state) for st, state in miner["per_type"].items()
+        }
+        windows = {
+            st: [ScoringWindow(**w) for w in ws]
+            for st, ws in (miner.get("windows") or {}).items()
+        }
+        detail = MinerDetail(
+            hotkey=miner["hotkey"],
+            uid=miner["uid"],
+            coldkey=miner["coldkey"],
+            per_type=per_type,
+            windows=windows,
+        )
+        views.append(ValidatorMinerView(validator=info, detail=detail))
+
+    if all(v.detail is None for v in views):
+        return None
+    return MinerDetailResponse(views=views)
+
+
+class MinersCache:
+    def __init__(
+        self,
+        validator_urls: list[str],
+        refresh_interval: float = MINERS_REFRESH_INTERVAL,
+        stale_after: float = MINERS_STALE_AFTER,
+        detail_ttl: float = MINER_DETAIL_TTL,
+    ) -> None:
+        self.validator_urls = validator_urls
+        self.refresh_interval = refresh_interval
+        self.stale_after = stale_after
+        self.detail_ttl = detail_ttl
+
+        self._polls = [
+            ValidatorPoll(index=index, url=url.rstrip("/"))
+            for index, url in enumerate(validator_urls)
+        ]
+        self._snapshot: Optional[MinersSnapshot] = None
+        self._refresh_lock = asyncio.Lock()
+        self._details: OrderedDict[str, _DetailEntry] = OrderedDict()
+        self._detail_fetches: dict[str, asyncio.Task] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self.validator_urls and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for task in self._detail_fetches.values():
+            task.cancel()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get_snapshot(self) -> MinersSnapshot:
+        """Latest snapshot; only the very first caller waits for a fan-out."""
+        if self._snapshot is None:
+            async with self._refresh_lock:
+                if self._snapshot is None:
+                    await self._refresh_locked()
+        return self._snapshot
+
+    async def refresh(self) -> None:
+        async with self._refresh_lock:
+            await self._refresh_locked()
+
+    async def get_miner_detail(self, hotkey: str) -> Optional[MinerDetailResponse]:
+        entry = self._details.get(hotkey)
+        if entry is None:
+            return await asyncio.shield(self._start_detail_fetch(hotkey))
+
+        self._details.move_to_end(hotkey)
+        if time.time() - entry.fetched_at > self.detail_ttl:
+            # Serve the stale view and revalidate in the background.
+            self._start_detail_fetch(hotkey)
+        return entry.response
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Miner snapshot refresh failed")
+            await asyncio.sleep(self.refresh_interval)
+
+    def _client_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=REQUEST_TIMEOUT)
+        return self._session
+
+    async def _get(
+        self, url: str, etag: Optional[str]
+    ) -> tuple[int, Optional[dict], Optional[str]]:
+        headers = {"If-None-Match": etag} if etag else {}
+        async with self._client_session().get(url, headers=headers) as resp:
+            if resp.status == 304:
+                return 304, None, etag
+            resp.raise_for_status()
+            return resp.status, await resp.json(), resp.headers.get("ETag")
+
+    async def _poll(self, poll: ValidatorPoll) -> None:
+        etag = poll.etag if poll.payload is not None else None
+        try:
+            status, payload, poll.etag = await self._get(
+                f"{poll.url}/public/miners", etag
+            )
+        except Exception as e:
+            poll.last_error = str(e) or type(e).__name__
+            logger.warning(f"Validator fetch failed url={poll.url} error={e}")
+            return
+
+        if status != 304:
+            poll.payload = payload
+        poll.last_success = time.time()
+        poll.last_error = None
+
+    async def _refresh_locked(self) -> None:
+        await asyncio.gather(*(self._poll(poll) for poll in self._polls))
+        self._snapshot = self._build_snapshot()
+        logger.info(
+            f"Miner snapshot refreshed: configured={len(self._polls)} "
+            f"online={sum(1 for poll in self._polls if poll.last_error is None)} "
+            f"miners={len(self._snapshot.miners_by_hotkey)}"
+        )
+
+    def _build_snapshot(self) -> MinersSnapshot:
+        now = time.time()
+        results = []
+        validators = []
+        for poll in self._polls:
+            online = poll.is_fresh(now, self.stale_after)
+            payload = poll.payload if online else None
+            info = _validator_info(poll.index, payload, online=online).model_copy(
+                update={"last_updated": _utc(poll.last_success)}
+            )
+            results.append((info, payload))
+            validators.append(info)
+
+        miners = build_miner_list(results)
+        response = MinerListResponse(
+            validators=validators, miners=miners, generated_at=_utc(now)
+        )
+
+        # Weak validator over everything but the timestamps, so clients see
+        # 304 until some miner or validator state actually changes.
+        content = json.dumps(
+            [
+                [v.model_dump(exclude={"last_updated"}) for v in validators],
+                [m.model_dump() for m in miners],
+            ],
+            sort_keys=True,
+        )
+        digest = hashlib.sha256(content.encode()).hexdigest()[:32]
+
+        return MinersSnapshot(
+            body=response.model_dump_json().encode(),
+            etag=f'W/"{digest}"',
+            built_at=now,
+            miners_by_hotkey={m.hotkey: m for m in miners},
+        )
+
+    def _start_detail_fetch(self, hotkey: str) -> asyncio.Task:
+        """One in-flight fetch per hotkey, shared by every waiting request."""
+        task = self._detail_fetches.get(hotkey)
+        if task is None:
+            task = asyncio.create_task(self._load_detail(hotkey))
+            self._detail_fetches[hotkey] = task
+            task.add_done_callback(lambda done: self._detail_fetched(hotkey, done))
+        return task
+
+    def _detail_fetched(self, hotkey: str, task: asyncio.Task) -> None:
+        self._detail_fetches.pop(hotkey, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                f"Miner detail fetch failed hotkey={hotkey} error={task.exception()}"
+            )
+
+    async def _load_detail(self, hotkey: str) -> Optional[MinerDetailResponse]:
+        results = await fetch_miner_detail(
+            self.validator_urls, hotkey, session=self._client_session()
+        )
+        response = build_miner_detail(results)
+        self._details[hotkey] = _DetailEntry(response=response, fetched_at=time.time())
+        self._details.move_to_end(hotkey)
+        while len(self._details) > MINER_DETAIL_MAX_ENTRIES:
+            self._details.popitem(last=False)
+        return response
+
+    def stats(self) -> dict:
+        now = time.time()
+        return {
+            "snapshot_age_seconds": (
+                round(self._snapshot.age(), 1) if self._snapshot else None
+            ),
+            "validators": [
+                {
+                    "index": poll.index,
+                    "online": poll.is_fresh(now, self.stale_after),
+                    "age_seconds": (
+                        round(now - poll.last_success, 1)
+                        if poll.last_success is not None
+                        else None
+                    ),
+                    "last_error": poll.last_error,
+                }
+                for poll in self._polls
+            ],
+            "cached_details": len(self._details),
+        }
+
+
+miners_cache = MinersCache(VALIDATOR_URLS)
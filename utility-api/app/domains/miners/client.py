@@ -49,38 +49,28 @@ async def _fetch_one(session: aiohttp.ClientSession, url: str):
         return None
 
 
-async def fetch_all_miners(
+async def fetch_miner_detail(
     validator_urls: list[str],
+    miner_hotkey: str,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> list[tuple[ValidatorInfo, Optional[dict]]]:
-    """Fan out `/public/miners` to every configured validator in parallel."""
-
-    async with aiohttp.ClientSession() as session:
-        coros = [
-            _fetch_one(session, f"{url.rstrip('/')}/public/miners")
-            for url in validator_urls
-        ]
-        responses = await asyncio.gather(*coros, return_exceptions=True)
-
-    results: list[tuple[ValidatorInfo, Optional[dict]]] = []
-    for idx, data in enumerate(responses):
-        if isinstance(data, Exception) or data is None:
-            results.append((_validator_info(idx, None, online=False), None))
-        else:
-            results.append((_validator_info(idx, data, online=True), data))
-    return results
-
+    """Fan out `/public/miners/{hotkey}` to every configured validator in parallel.
 
-async def fetch_miner_detail(
-    validator_urls: list[str], miner_hotkey: str
-) -> list[tuple[ValidatorInfo, Optional[dict]]]:
-    """Fan out `/public/miners/{hotkey}` to every configured validator in parallel."""
+    Reuses ``session`` when given instead of opening a new one.
+    """
 
-    async with aiohttp.ClientSession() as session:
+    async def fan_out(session: aiohttp.ClientSession) -> list:
         coros = [
             _fetch_one(session, f"{url.rstrip('/')}/public/miners/{miner_hotkey}")
             for url in validator_urls
         ]
-        responses = await asyncio.gather(*coros, return_exceptions=True)
+        return await asyncio.gather(*coros, return_exceptions=True)
+
+    if session is not None:
+        responses = await fan_out(session)
+    else:
+        async with aiohttp.ClientSession() as session:
+            responses = await fan_out(session)
 
     results: list[tuple[ValidatorInfo, Optional[dict]]] = []
     for idx, data in enumerate(responses):
@@ -1,107 +1,67 @@
 from app.config import VALIDATOR_URLS
-from app.domains.miners.client import fetch_all_miners, fetch_miner_detail
-from app.domains.miners.schemas import (
-    MinerDetail,
-    MinerDetailResponse,
-    MinerListItem,
-    MinerListResponse,
-    MinerTypeState,
-    ScoringWindow,
-    ValidatorMinerView,
-)
+from app.domains.miners.cache import miners_cache
+from app.domains.miners.schemas import MinerDetailResponse, MinerListResponse
 from app.logger import get_logger
-from fastapi import APIRouter, HTTPException, Path
+from fastapi import APIRouter, Header, HTTPException, Path, Response
 
 router = APIRouter(prefix="/miners", tags=["miners"])
 logger = get_logger(__name__)
 
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 @router.get("", response_model=MinerListResponse)
-async def list_miners():
-    """Aggregate `/public/miners` from every configured validator.
+async def list_miners(
+    if_none_match: str | None = Header(None),
+):
+    """Aggregated `/public/miners` of every configured validator.
 
-    Validators are queried in parallel. The response includes one
-    `ValidatorInfo` per configured validator (online or not) plus a list
-    of miners, each carrying a per-validator map of current per-search-type
-    state.
+    Served from a snapshot the background refresher rebuilds after polling
+    the validators. The response includes one `ValidatorInfo` per configured
+    validator (online or not, with when it last answered) plus a list of
+    miners, each carrying a per-validator map of current per-search-type
+    state. Supports `If-None-Match`; `Age` is the snapshot age in seconds.
     """
 
     if not VALIDATOR_URLS:
         raise HTTPException(status_code=503, detail="No validators configured")
 
-    results = await fetch_all_miners(VALIDATOR_URLS)
-
-    validators = [info for info, _ in results]
-    by_miner: dict[str, dict] = {}
-
-    for info, data in results:
-        if not data:
-            continue
-        for m in data.get("miners", []):
-            entry = by_miner.setdefault(
-                m["hotkey"],
-                {
-                    "hotkey": m["hotkey"],
-                    "uid": m["uid"],
-                    "coldkey": m["coldkey"],
-                    "by_validator": {},
-                },
-            )
-            entry["by_validator"][info.id] = {
-                st: MinerTypeState(**state) for st, state in m["per_type"].items()
-            }
-
-    miners = [MinerListItem(**v) for v in by_miner.values()]
-    miners.sort(key=lambda m: m.uid)
-
-    logger.info(
-        f"/miners served: configured={len(VALIDATOR_URLS)} "
-        f"online={sum(1 for v in validators if v.online)} "
-        f"miners={len(miners)}"
-    )
+    snapshot = await miners_cache.get_snapshot()
+    headers = {"ETag": snapshot.etag, "Age": str(int(snapshot.age()))}
 
-    return MinerListResponse(validators=validators, miners=miners)
+    if _etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=snapshot.body, media_type="application/json", headers=headers
+    )
 
 
 @router.get("/{hotkey}", response_model=MinerDetailResponse)
 async def get_miner_detail(
     hotkey: str = Path(..., description="Miner hotkey (ss58)"),
 ):
-    """Fan out `/public/miners/{hotkey}` to every configured validator in parallel.
+    """Per-validator `/public/miners/{hotkey}` views.
 
     Returns one view per validator. `detail` is null if the validator was
-    unreachable or doesn't know the miner.
+    unreachable or doesn't know the miner. Views are cached per hotkey and
+    revalidated in the background once they expire; hotkeys absent from the
+    current snapshot are rejected without asking the validators.
     """
 
     if not VALIDATOR_URLS:
         raise HTTPException(status_code=503, detail="No validators configured")
 
-    results = await fetch_miner_detail(VALIDATOR_URLS, hotkey)
-
-    views: list[ValidatorMinerView] = []
-    for info, data in results:
-        miner = (data or {}).get("miner") if data else None
-        if not miner:
-            views.append(ValidatorMinerView(validator=info, detail=None))
-            continue
-
-        per_type = {
-            st: MinerTypeState(**state) for st, state in miner["per_type"].items()
-        }
-        windows = {
-            st: [ScoringWindow(**w) for w in ws]
-            for st, ws in (miner.get("windows") or {}).items()
-        }
-        detail = MinerDetail(
-            hotkey=miner["hotkey"],
-            uid=miner["uid"],
-            coldkey=miner["coldkey"],
-            per_type=per_type,
-            windows=windows,
-        )
-        views.append(ValidatorMinerView(validator=info, detail=detail))
-
-    if all(v.detail is None for v in views):
+    snapshot = await miners_cache.get_snapshot()
+    if hotkey not in snapshot.miners_by_hotkey:
+        raise HTTPException(status_code=404, detail="Miner not found")
+
+    response = await miners_cache.get_miner_detail(hotkey)
+    if response is None:
         raise HTTPException(status_code=404, detail="Miner not found")
 
-    return MinerDetailResponse(views=views)
+    return response
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel
@@ -9,6 +10,8 @@ class ValidatorInfo(BaseModel):
     hotkey: str
     label: str
     online: bool
+    # When this validator last answered the utility API's poll.
+    last_updated: Optional[datetime] = None
 
 
 class MinerTypeState(BaseModel):
@@ -35,6 +38,7 @@ class MinerListItem(BaseModel):
 class MinerListResponse(BaseModel):
     validators: list[ValidatorInfo]
     miners: list[MinerListItem]
+    generated_at: Optional[datetime] = None
 
 
 class MinerDetail(BaseModel):
@@ -1,21 +1,43 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.requests import Request
 
 from app.config import CORS_ALLOWED_ORIGINS
+from app.db.session import engine, pool_metrics
+from app.domains.logs.partitions import maintain_partitions
 from app.domains.logs.router import router as logs_router
+from app.domains.miners.cache import miners_cache
 from app.domains.miners.router import router as miners_router
 from app.logger import get_logger
 
 logger = get_logger(__name__)
 
+PARTITION_MAINTENANCE_INTERVAL_SECONDS = 3600
+
+
+async def _maintain_partitions_forever():
+    while True:
+        try:
+            await maintain_partitions(engine)
+        except Exception:
+            logger.exception("Miner response log partition maintenance failed")
+        await asyncio.sleep(PARTITION_MAINTENANCE_INTERVAL_SECONDS)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting utility API lifespan")
+    maintenance = asyncio.create_task(_maintain_partitions_forever())
+    await miners_cache.start()
     yield
+    await miners_cache.stop()
+    maintenance.cancel()
+    with suppress(asyncio.CancelledError):
+        await maintenance
+    await engine.dispose()
     logger.info("Stopping utility API lifespan")
 
 
@@ -56,3 +78,11 @@ async def log_unhandled_request_errors(request: Request, call_next):
 @app.get("/")
 async def root():
     return {"message": "Subnet-22 utility api is running!"}
+
+
+@app.get("/health")
+async def health():
+    return {
+        "db_pool": pool_metrics.snapshot(),
+        "miners_cache": miners_cache.stats(),
+    }
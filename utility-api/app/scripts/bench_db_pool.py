@@ -0,0 +1,78 @@
+"""
+Request latency under concurrency for each database pool mode.
+
+Each simulated request opens a session, runs a small indexed query on
+miner_response_logs the way ``/logs`` handlers do and closes the session.
+Every mode in ``POOL_MODES`` gets its own engine and is reported with
+requests/s, p50/p99 latency and how many server connections it opened.
+Point ``DB_URL`` at pgbouncer for ``pgbouncer`` and ``nullpool``, and at
+Postgres for ``direct``, or run everything against one local Postgres.
+
+Usage:
+    poetry run python -m app.scripts.bench_db_pool [--requests 2000] [--concurrency 50] [--modes direct,pgbouncer,nullpool]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.db.session import POOL_MODES, PoolMetrics, build_engine
+from app.domains.logs.enums import QueryKind
+from app.domains.logs.models.miner_response_log import MinerResponseLog
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+async def run_mode(mode: str, requests: int, concurrency: int) -> dict:
+    engine = build_engine(mode=mode)
+    metrics = PoolMetrics(engine, mode)
+    sessions = async_sessionmaker(engine, class_=AsyncSession)
+    stmt = (
+        select(MinerResponseLog.id, MinerResponseLog.created_at)
+        .where(MinerResponseLog.query_kind == QueryKind.ORGANIC)
+        .order_by(MinerResponseLog.created_at.desc())
+        .limit(10)
+    )
+    latencies = []
+    remaining = iter(range(requests))
+
+    async def client():
+        for _ in remaining:
+            started = time.perf_counter()
+            async with sessions() as session:
+                (await session.execute(stmt)).all()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+
+    latencies.sort()
+    return {
+        "requests_per_second": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "connects": metrics.connects,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--modes", default=",".join(POOL_MODES))
+    args = parser.parse_args()
+
+    for mode in args.modes.split(","):
+        result = await run_mode(mode, args.requests, args.concurrency)
+        print(
+            f"{mode:10s} {result['requests_per_second']:8.0f} req/s  "
+            f"p50 {result['p50_ms']:7.1f} ms  p99 {result['p99_ms']:7.1f} ms  "
+            f"connects {result['connects']}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
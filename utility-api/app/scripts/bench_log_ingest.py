@@ -0,0 +1,122 @@
+"""
+Load benchmark for miner response log ingest against a local Postgres.
+
+Sends the same batches through a multi-row ``INSERT ... VALUES`` and through
+the binary COPY path used by ``POST /logs``, each from several concurrent
+writers the way validators ship logs, and reports rows/s and p50/p99 batch
+latency. Rows are tagged with a unique validator hotkey and deleted at the
+end. Run ``create_tables`` first so today's partition exists.
+
+Usage:
+    poetry run python -m app.scripts.bench_log_ingest [--batches 200] [--batch-size 50] [--writers 8]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from app.db.session import async_session, engine
+from app.domains.logs.enums import QueryKind, SearchType
+from app.domains.logs.ingest import copy_logs
+from app.domains.logs.models.miner_response_log import MinerResponseLog
+from app.domains.logs.schemas import MinerResponseLogCreate
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+
+
+def build_logs(count: int, hotkey: str) -> list[MinerResponseLogCreate]:
+    results = [
+        {
+            "title": f"Result {i}",
+            "link": f"https://example.com/{i}",
+            "snippet": "lorem ipsum dolor sit amet " * 20,
+        }
+        for i in range(30)
+    ]
+    return [
+        MinerResponseLogCreate(
+            query_kind=QueryKind.SCORING,
+            search_type=SearchType.AI_SEARCH,
+            netuid=22,
+            miner_uid=i % 256,
+            miner_hotkey=f"miner-{i % 256}",
+            validator_uid=7,
+            validator_hotkey=hotkey,
+            request_query=f"benchmark query {i}",
+            status_code=200,
+            process_time=1.5,
+            total_reward=0.5,
+            response_payload={"completion": "word " * 400, "search_results": results},
+            reward_payload={"total_reward": 0.5, "components": {"content": 0.5}},
+        )
+        for i in range(count)
+    ]
+
+
+async def insert_batch(logs: list[MinerResponseLogCreate]) -> None:
+    async with async_session() as session:
+        values = [log.model_dump(mode="python") for log in logs]
+        await session.execute(insert(MinerResponseLog).values(values))
+        await session.commit()
+
+
+async def copy_batch(logs: list[MinerResponseLogCreate]) -> None:
+    async with async_session() as session:
+        await copy_logs(session, logs)
+        await session.commit()
+
+
+async def run(write_batch, batches: int, logs, writers: int) -> dict:
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(batches):
+        queue.put_nowait(logs)
+    latencies = []
+
+    async def writer():
+        while not queue.empty():
+            batch = queue.get_nowait()
+            started = time.perf_counter()
+            await write_batch(batch)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(writer() for _ in range(writers)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "rows_per_second": batches * len(logs) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batches", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--writers", type=int, default=8)
+    args = parser.parse_args()
+
+    hotkey = f"bench-{uuid.uuid4().hex}"
+    logs = build_logs(args.batch_size, hotkey)
+    try:
+        for name, write_batch in (("insert", insert_batch), ("copy", copy_batch)):
+            result = await run(write_batch, args.batches, logs, args.writers)
+            print(
+                f"{name:6s} {result['rows_per_second']:9.0f} rows/s  "
+                f"p50 {result['p50_ms']:7.1f} ms  p99 {result['p99_ms']:7.1f} ms"
+            )
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(
+                delete(MinerResponseLog).where(
+                    MinerResponseLog.validator_hotkey == hotkey
+                )
+            )
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,5 +1,6 @@
 """
-Creates all database tables defined in SQLAlchemy models.
+Creates all database tables defined in SQLAlchemy models, plus the daily
+miner_response_logs partitions for today and the days ahead.
 Use this for initial setup or development. For production, use Alembic migrations.
 
 Usage:
@@ -10,11 +11,13 @@ import asyncio
 
 from app.db.base import Base
 from app.db.session import engine
+from app.domains.logs.partitions import maintain_partitions
 
 
 async def main():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await maintain_partitions(engine)
 
     await engine.dispose()
 
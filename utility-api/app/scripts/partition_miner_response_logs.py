@@ -0,0 +1,94 @@
+"""
+Converts an unpartitioned miner_response_logs table to daily partitions.
+
+The existing table and its indexes are renamed with a ``legacy`` marker, the
+partitioned table is created with partitions covering the oldest row through
+the days ahead, and rows are copied over one day per transaction. The legacy
+table is left in place; drop it by hand once the copy is verified.
+
+Usage:
+    poetry run python -m app.scripts.partition_miner_response_logs
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from app.db.base import Base
+from app.db.session import engine
+from app.domains.logs.ingest import COPY_COLUMNS
+from app.domains.logs.partitions import PARENT_TABLE, ensure_partitions
+from sqlalchemy import text
+
+LEGACY_TABLE = f"{PARENT_TABLE}_legacy"
+MAX_IDENTIFIER_LENGTH = 63
+
+
+async def _convert() -> datetime | None:
+    """Swap the tables; returns the oldest legacy row timestamp."""
+    async with engine.begin() as conn:
+        relkind = (
+            await conn.execute(
+                text("SELECT relkind FROM pg_class WHERE relname = :name"),
+                {"name": PARENT_TABLE},
+            )
+        ).scalar()
+        if relkind == "p":
+            print(f"{PARENT_TABLE} is already partitioned.")
+            return None
+
+        index_names = (
+            (
+                await conn.execute(
+                    text("SELECT indexname FROM pg_indexes WHERE tablename = :name"),
+                    {"name": PARENT_TABLE},
+                )
+            )
+            .scalars()
+            .all()
+        )
+        await conn.execute(
+            text(f'ALTER TABLE "{PARENT_TABLE}" RENAME TO "{LEGACY_TABLE}"')
+        )
+        for index_name in index_names:
+            legacy_name = f"legacy_{index_name}"[:MAX_IDENTIFIER_LENGTH]
+            await conn.execute(
+                text(f'ALTER INDEX "{index_name}" RENAME TO "{legacy_name}"')
+            )
+
+        await conn.run_sync(Base.metadata.create_all)
+
+        oldest = (
+            await conn.execute(text(f'SELECT min(created_at) FROM "{LEGACY_TABLE}"'))
+        ).scalar()
+        today = datetime.now(timezone.utc).date()
+        since = oldest.astimezone(timezone.utc).date() if oldest else None
+        await ensure_partitions(conn, today, since=since)
+        return oldest
+
+
+async def main():
+    oldest = await _convert()
+
+    if oldest is not None:
+        columns = ", ".join(COPY_COLUMNS)
+        day = oldest.astimezone(timezone.utc).date()
+        today = datetime.now(timezone.utc).date()
+        while day <= today:
+            start = datetime.combine(day, datetime.min.time(), tzinfo=timezone.utc)
+            async with engine.begin() as conn:
+                result = await conn.execute(
+                    text(
+                        f'INSERT INTO "{PARENT_TABLE}" ({columns}) '
+                        f'SELECT {columns} FROM "{LEGACY_TABLE}" '
+                        "WHERE created_at >= :start AND created_at < :end"
+                    ),
+                    {"start": start, "end": start + timedelta(days=1)},
+                )
+            print(f"{day}: copied {result.rowcount} rows")
+            day += timedelta(days=1)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,63 @@
+import json
+from datetime import date, datetime, timezone
+
+from app.domains.logs.enums import QueryKind, SearchType
+from app.domains.logs.ingest import COPY_COLUMNS, build_copy_record
+from app.domains.logs.partitions import drop_expired_partitions, partition_name
+from app.domains.logs.schemas import MinerResponseLogCreate
+
+
+def build_log(**overrides):
+    payload = {
+        "query_kind": QueryKind.SCORING,
+        "search_type": SearchType.WEB_SEARCH,
+        "netuid": 22,
+        "miner_hotkey": "miner\x00-hotkey",
+        "validator_hotkey": "validator-hotkey",
+        "request_query": "what is\x00 bittensor",
+        "response_payload": {"text\x00": ["a\x00b", "literal \\u0000 stays"]},
+    }
+    payload.update(overrides)
+    return MinerResponseLogCreate(**payload)
+
+
+def test_copy_record_strips_null_bytes():
+    created_at = datetime(2026, 3, 14, tzinfo=timezone.utc)
+    record = dict(zip(COPY_COLUMNS, build_copy_record(build_log(), created_at)))
+
+    assert record["created_at"] == created_at
+    assert record["query_kind"] == "SCORING"
+    assert record["search_type"] == "WEB_SEARCH"
+    assert record["miner_hotkey"] == "miner-hotkey"
+    assert record["request_query"] == "what is bittensor"
+    assert json.loads(record["response_payload"]) == {
+        "text": ["ab", "literal \\u0000 stays"]
+    }
+    assert record["reward_payload"] is None
+
+
+class FakePartitionConnection:
+    def __init__(self, days):
+        self.names = [partition_name(day) for day in days]
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append(str(statement))
+        names = self.names
+
+        class Result:
+            def all(self):
+                return [(name,) for name in names]
+
+        return Result()
+
+
+async def test_drop_expired_partitions_keeps_retention_window():
+    conn = FakePartitionConnection(
+        [date(2026, 3, 1), date(2026, 3, 10), date(2026, 3, 14)]
+    )
+
+    dropped = await drop_expired_partitions(conn, date(2026, 3, 14), 7)
+
+    assert dropped == ["miner_response_logs_p20260301"]
+    assert await drop_expired_partitions(conn, date(2026, 3, 14), 0) == []
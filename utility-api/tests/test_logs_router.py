@@ -1,3 +1,5 @@
+import gzip
+import json
 from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
@@ -6,16 +8,12 @@ from uuid import uuid4
 from app.auth import get_hotkey
 from app.db.session import get_session
 from app.domains.logs.enums import QueryKind, SearchType
+from app.domains.logs import router as logs_router
 from app.domains.logs.router import router
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 
-class FakeResult:
-    def __init__(self, rowcount):
-        self.rowcount = rowcount
-
-
 class FakeScalarResult:
     def __init__(self, rows):
         self._rows = rows
@@ -34,6 +32,9 @@ class FakeSelectResult:
     def all(self):
         return self._rows
 
+    def first(self):
+        return self._rows[0] if self._rows else None
+
 
 def create_test_app():
     app = FastAPI()
@@ -90,10 +91,11 @@ def build_log_row(**overrides):
     return row
 
 
-def test_save_logs_inserts_batch():
+def test_save_logs_inserts_batch(monkeypatch):
     app = create_test_app()
     session = AsyncMock()
-    session.execute.return_value = FakeResult(rowcount=2)
+    copy_logs = AsyncMock(side_effect=lambda session, logs: len(logs))
+    monkeypatch.setattr(logs_router, "copy_logs", copy_logs)
 
     async def override_session():
         yield session
@@ -115,14 +117,51 @@ def test_save_logs_inserts_batch():
 
     assert response.status_code == 200
     assert response.json() == {"inserted": 2}
-    assert session.execute.await_count == 1
+    assert len(copy_logs.await_args.args[1]) == 2
     session.commit.assert_awaited_once()
 
 
-def test_save_logs_accepts_scoring_payload():
+def test_save_logs_accepts_gzip_body(monkeypatch):
     app = create_test_app()
     session = AsyncMock()
-    session.execute.return_value = FakeResult(rowcount=1)
+    copy_logs = AsyncMock(side_effect=lambda session, logs: len(logs))
+    monkeypatch.setattr(logs_router, "copy_logs", copy_logs)
+
+    async def override_session():
+        yield session
+
+    async def override_hotkey():
+        return "validator-hotkey"
+
+    app.dependency_overrides[get_session] = override_session
+    app.dependency_overrides[get_hotkey] = override_hotkey
+
+    client = TestClient(app)
+    body = gzip.compress(
+        json.dumps({"logs": [build_payload(), build_payload(miner_uid=12)]}).encode()
+    )
+
+    response = client.post(
+        "/logs",
+        content=body,
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"inserted": 2}
+
+    response = client.post(
+        "/logs",
+        content=b"not gzip",
+        headers={"Content-Type": "application/json", "Content-Encoding": "gzip"},
+    )
+    assert response.status_code == 400
+
+
+def test_save_logs_accepts_scoring_payload(monkeypatch):
+    app = create_test_app()
+    session = AsyncMock()
+    copy_logs = AsyncMock(side_effect=lambda session, logs: len(logs))
+    monkeypatch.setattr(logs_router, "copy_logs", copy_logs)
 
     async def override_session():
         yield session
@@ -302,3 +341,121 @@ def test_get_scoring_logs_filters_by_validator_uid():
     final_stmt = session.execute.await_args_list[-1].args[0]
     compiled = str(final_stmt.compile(compile_kwargs={"literal_binds": True}))
     assert "validator_uid = 3" in compiled
+
+
+def test_get_scoring_logs_pages_by_group_key_without_payloads():
+    app = create_test_app()
+    session = AsyncMock()
+    session.execute.return_value = FakeSelectResult(
+        [
+            build_log_row(miner_uid=11, validator_uid=2),
+            build_log_row(miner_uid=11, validator_uid=5),
+            build_log_row(miner_uid=12, validator_uid=2),
+        ]
+    )
+
+    async def override_session():
+        yield session
+
+    app.dependency_overrides[get_session] = override_session
+
+    client = TestClient(app)
+
+    response = client.get(
+        "/logs/scoring", params={"search_type": "x_search", "limit": 1}
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert [group["miner_uid"] for group in payload["groups"]] == [11]
+    assert payload["groups"][0]["validator_count"] == 2
+    assert payload["groups"][0]["logs"][0]["response_payload"] is None
+    assert payload["next_cursor"]
+
+    response = client.get(
+        "/logs/scoring",
+        params={"search_type": "x_search", "cursor": payload["next_cursor"]},
+    )
+
+    assert response.status_code == 200
+    final_stmt = session.execute.await_args_list[-1].args[0]
+    compiled = str(final_stmt.compile(compile_kwargs={"literal_binds": True}))
+    assert "JOIN LATERAL" in compiled
+    assert "response_payload" not in compiled
+    assert "miner_response_logs.miner_uid > 11" in compiled
+
+    response = client.get(
+        "/logs/scoring", params={"search_type": "x_search", "cursor": "bogus"}
+    )
+    assert response.status_code == 400
+
+
+def test_get_scoring_logs_filtered_by_miner_returns_every_group():
+    app = create_test_app()
+    session = AsyncMock()
+    session.execute.return_value = FakeSelectResult(
+        [build_log_row(request_query=f"query {i}") for i in range(25)]
+        + [build_log_row(scoring_epoch_start=None, request_query="no epoch")]
+    )
+
+    async def override_session():
+        yield session
+
+    app.dependency_overrides[get_session] = override_session
+
+    client = TestClient(app)
+
+    response = client.get(
+        "/logs/scoring", params={"search_type": "x_search", "miner_uids": 11}
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert len(payload["groups"]) == 26
+    assert payload["groups"][-1]["scoring_epoch_start"] is None
+    assert payload["next_cursor"] is None
+
+    final_stmt = session.execute.await_args_list[-1].args[0]
+    compiled = str(final_stmt.compile(compile_kwargs={"literal_binds": True}))
+    assert "LIMIT" not in compiled
+    assert "scoring_epoch_start IS NOT NULL" not in compiled
+
+
+def test_scoring_cursor_round_trips_null_epoch_start():
+    key = (None, None, SearchType.X_SEARCH, "Latest AI news")
+
+    cursor = logs_router.decode_scoring_cursor(logs_router.encode_scoring_cursor(key))
+
+    assert cursor == key
+    after = logs_router._build_after_cursor_filter(logs_router.MinerResponseLog, cursor)
+    compiled = str(after.compile(compile_kwargs={"literal_binds": True}))
+    assert "scoring_epoch_start IS NULL" in compiled
+
+
+def test_get_log_payload_redacts_network_fields():
+    app = create_test_app()
+    session = AsyncMock()
+    row = build_log_row(
+        response_payload={"axon": {"ip": "1.2.3.4", "process_time": 1.0}}
+    )
+    session.execute.return_value = FakeSelectResult([row])
+
+    async def override_session():
+        yield session
+
+    app.dependency_overrides[get_session] = override_session
+
+    client = TestClient(app)
+
+    response = client.get(f"/logs/{row.id}/payload")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["response_payload"]["axon"] == {
+        "ip": "0.0.0.0",
+        "process_time": 1.0,
+    }
+    assert payload["reward_payload"] == {"total_reward": 0.4}
+
+    session.execute.return_value = FakeSelectResult([])
+    assert client.get(f"/logs/{uuid4()}/payload").status_code == 404
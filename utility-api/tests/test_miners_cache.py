@@ -0,0 +1,107 @@
+import asyncio
+
+from app.domains.miners import router as miners_router
+from app.domains.miners.cache import MinersCache
+from app.domains.miners.router import router
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+STATE = {"verified": 1, "declared": 2, "quality_avg": 0.5}
+
+
+def validator_payload(hotkey, miners):
+    return {
+        "validator": {"hotkey": hotkey, "uid": 1},
+        "miners": [
+            {"hotkey": miner, "uid": uid, "coldkey": "ck", "per_type": {"x": STATE}}
+            for uid, miner in enumerate(miners)
+        ],
+    }
+
+
+class FakeValidatorsCache(MinersCache):
+    """Answers polls from ``payloads`` keyed by URL, honouring ETags."""
+
+    def __init__(self, payloads, **kwargs):
+        super().__init__(list(payloads), **kwargs)
+        self.payloads = payloads
+        self.requests = []
+
+    async def _get(self, url, etag):
+        base = url.removesuffix("/public/miners")
+        self.requests.append((base, etag))
+        payload = self.payloads[base]
+        if isinstance(payload, Exception):
+            raise payload
+        current = f'"{len(payload["miners"])}"'
+        if etag == current:
+            return 304, None, etag
+        return 200, payload, current
+
+
+async def test_refresh_uses_etags_and_keeps_stale_payloads():
+    cache = FakeValidatorsCache(
+        {
+            "http://a": validator_payload("hk-a", ["m1", "m2"]),
+            "http://b": validator_payload("hk-b", ["m1"]),
+        }
+    )
+
+    first = await cache.get_snapshot()
+    assert set(first.miners_by_hotkey) == {"m1", "m2"}
+
+    cache.payloads["http://b"] = OSError("down")
+    await cache.refresh()
+    second = await cache.get_snapshot()
+
+    assert ("http://a", '"2"') in cache.requests
+    assert second.etag == first.etag
+    assert cache.stats()["validators"][1]["last_error"] == "down"
+
+    cache._polls[1].last_success -= cache.stale_after + 1
+    await cache.refresh()
+    assert (await cache.get_snapshot()).etag != first.etag
+
+
+async def test_stale_detail_is_served_while_refetching(monkeypatch):
+    calls = []
+
+    async def fake_fetch(urls, hotkey, session=None):
+        calls.append(hotkey)
+        await asyncio.sleep(0)
+        return []
+
+    from app.domains.miners import cache as cache_module
+
+    monkeypatch.setattr(cache_module, "fetch_miner_detail", fake_fetch)
+    monkeypatch.setattr(cache_module, "build_miner_detail", lambda results: "view")
+    cache = MinersCache(["http://a"], detail_ttl=0)
+
+    assert await asyncio.gather(
+        cache.get_miner_detail("m1"), cache.get_miner_detail("m1")
+    ) == ["view", "view"]
+    assert calls == ["m1"]
+
+    assert await cache.get_miner_detail("m1") == "view"
+    await asyncio.sleep(0.01)
+    assert calls == ["m1", "m1"]
+
+
+def test_list_miners_serves_snapshot_with_etag(monkeypatch):
+    cache = FakeValidatorsCache({"http://a": validator_payload("hk-a", ["m1"])})
+    monkeypatch.setattr(miners_router, "miners_cache", cache)
+    monkeypatch.setattr(miners_router, "VALIDATOR_URLS", ["http://a"])
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    response = client.get("/miners")
+
+    assert response.status_code == 200
+    assert response.json()["miners"][0]["hotkey"] == "m1"
+    assert response.json()["validators"][0]["online"] is True
+    assert "Age" in response.headers
+
+    cached = client.get("/miners", headers={"If-None-Match": response.headers["ETag"]})
+    assert cached.status_code == 304
+    assert client.get("/miners/unknown").status_code == 404